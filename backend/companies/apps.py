@@ -4,4 +4,8 @@ from django.apps import AppConfig
 class CompaniesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'companies'
+
+    def ready(self):
+        # Register the signal that expires the cached company list.
+        import companies.signals
 # end of companies/apps.py
\ No newline at end of file
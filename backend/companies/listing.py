@@ -0,0 +1,15 @@
+# companies/listing.py
+
+from core.cache import CacheNamespace
+from .models import Company
+from .serializers import CompanySerializer
+
+# The company list changes rarely and is read on most admin screens
+company_list = CacheNamespace('company-list', timeout=60 * 60)
+
+
+def get_company_list():
+    """Return the serialised companies, ordered by name, from the cache when possible."""
+    return company_list.get_or_set(
+        ['all'], lambda: list(CompanySerializer(Company.objects.order_by('name'), many=True).data)
+    )
@@ -0,0 +1,12 @@
+# companies/signals.py
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import Company
+from .listing import company_list
+
+@receiver([post_save, post_delete], sender=Company)
+def expire_company_list(sender, **kwargs):
+    """
+    Expire the cached company list whenever a company is written.
+    """
+    company_list.invalidate()
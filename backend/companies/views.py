@@ -1,15 +1,22 @@
 # companies/views.py
 from rest_framework import viewsets
+from rest_framework.response import Response
 from .models import Company
 from .serializers import CompanySerializer
+from .listing import get_company_list
 # [MODIFIED] Use the specific permission for Super Admins.
 from core.permissions import IsSuperAdmin
+from core.mixins import ConditionalGetMixin
 
-class CompanyViewSet(viewsets.ModelViewSet):
+class CompanyViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """
     API endpoint that allows companies to be viewed or edited.
     """
     queryset = Company.objects.all().order_by('name')
     serializer_class = CompanySerializer
     # [FIXED] Only Super Admins can view or manage companies.
-    permission_classes = [IsSuperAdmin]
\ No newline at end of file
+    permission_classes = [IsSuperAdmin]
+
+    def list(self, request, *args, **kwargs):
+        # The full list is served from the cache; writes expire it (see companies.signals)
+        return self.conditional_response(request, self.get_queryset(), lambda: Response(get_company_list()))
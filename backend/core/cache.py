@@ -0,0 +1,139 @@
+# core/cache.py
+
+import hashlib
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+
+# Sentinel for "not in the cache", so that None can be cached
+MISSING = object()
+
+
+def is_shared(using='default'):
+    """
+    Return True if every worker process uses the same cache, so a version
+    bump made by one is seen by all of them. Local-memory and dummy caches
+    belong to a single process; an alias can state otherwise with
+    'SHARED': True (a single-process server, or the test suite).
+    """
+    shared = settings.CACHES[using].get('SHARED')
+    if shared is None:
+        shared = not isinstance(caches[using], (LocMemCache, DummyCache))
+    return shared
+
+
+# --- Versions ---
+# A namespace and every tag own a version key holding a random value. Entry
+# keys embed a digest of the versions they depend on, so bumping a version
+# orphans all the entries built under the old one (they age out by TTL or
+# LRU) without having to find and delete them.
+
+def _tag_key(tag):
+    return f'cache-tag:{tag}'
+
+
+def _current_versions(backend, keys):
+    """Return the versions of `keys` in order, creating the missing ones."""
+    versions = backend.get_many(keys)
+    missing = {key: uuid.uuid4().hex for key in keys if key not in versions}
+    if missing:
+        backend.set_many(missing, timeout=None)
+        versions.update(missing)
+    return [versions[key] for key in keys]
+
+
+def tag_versions(tags, using='default'):
+    """Return the current versions of `tags`, e.g. to build an HTTP validator from them."""
+    return _current_versions(caches[using], [_tag_key(tag) for tag in tags])
+
+
+def invalidate_tags(*tags, using='default'):
+    """
+    Expire every entry that was cached with any of `tags`. The bump happens
+    once the surrounding transaction commits, so a value computed from
+    uncommitted data is never stored under the new version.
+    """
+    keys = {_tag_key(tag) for tag in tags if tag is not None}
+    if keys:
+        transaction.on_commit(
+            lambda: caches[using].set_many({key: uuid.uuid4().hex for key in keys}, timeout=None)
+        )
+
+
+def invalidate_on_change(model, tags, using='default'):
+    """
+    Expire tags(instance) whenever an instance of `model` is saved or deleted.
+    Queryset update() and bulk operations send no signals; code using them
+    calls invalidate_tags() itself.
+    """
+    def expire(sender, instance, **kwargs):
+        invalidate_tags(*tags(instance), using=using)
+
+    uid = f'core.cache:{model._meta.label}:{id(tags)}'
+    post_save.connect(expire, sender=model, weak=False, dispatch_uid=uid)
+    post_delete.connect(expire, sender=model, weak=False, dispatch_uid=uid)
+
+
+# --- Namespaces ---
+
+class CacheNamespace:
+    """
+    A named group of cached values with its own default timeout.
+
+    Keys are built as '<name>:<parts>:<versions digest>' from the namespace
+    version and the versions of the tags the value depends on, and the
+    per-process hit and miss counters show whether caching pays off.
+
+    Invalidation only reaches the processes sharing the cache, so values
+    are cached only when is_shared() holds; otherwise every lookup computes.
+    """
+
+    def __init__(self, name, timeout=300, using='default'):
+        self.name = name
+        self.timeout = timeout
+        self.using = using
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def backend(self):
+        return caches[self.using]
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def make_key(self, parts, tags=()):
+        version_keys = [f'cache-namespace:{self.name}'] + [_tag_key(tag) for tag in tags]
+        versions = _current_versions(self.backend, version_keys)
+        digest = hashlib.sha1(':'.join(versions).encode()).hexdigest()[:16]
+        return ':'.join([self.name, *(str(part) for part in parts), digest])
+
+    def get_or_set(self, parts, compute, tags=(), timeout=None):
+        """
+        Return the cached value for `parts`, or compute(), cache and return it.
+        Costs two cache round trips on a hit (versions, then the value).
+        """
+        if not is_shared(self.using):
+            self.misses += 1
+            return compute()
+        key = self.make_key(parts, tags)
+        value = self.backend.get(key, MISSING)
+        if value is not MISSING:
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = compute()
+        self.backend.set(key, value, timeout=self.timeout if timeout is None else timeout)
+        return value
+
+    def invalidate(self):
+        """Expire every entry of the namespace once the transaction commits."""
+        key = f'cache-namespace:{self.name}'
+        transaction.on_commit(lambda: self.backend.set(key, uuid.uuid4().hex, timeout=None))
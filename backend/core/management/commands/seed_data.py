@@ -12,10 +12,14 @@ from faker import Faker
 from companies.models import Company
 from contracts.models import Contract
 from menu.models import FoodCategory, FoodItem, SideDish
-from orders.models import Order
+from orders.models import Order, DailySalesRollup
+from orders.rollups import rebuild_sales_rollup
 from schedules.models import Schedule, DailyMenu
+from schedules.generation import MenuTemplate, generate_menus, rotation_rule, service_days
 from users.models import User
 from wallets.models import Wallet, Transaction
+from ledger import journal
+from ledger.models import Account, JournalEntry, Posting, Statement
 
 
 class Command(BaseCommand):
@@ -44,6 +48,9 @@ class Command(BaseCommand):
                 for i in range(3):
                     self.create_company_and_related_data(i + 1, fake)
 
+                # Orders are created directly above, so rebuild the sales rollup from them
+                rebuild_sales_rollup()
+
                 self.stdout.write(self.style.SUCCESS("پر کردن پایگاه داده با موفقیت به پایان رسید!"))
         except Exception as e:
             self.stdout.write(self.style.ERROR(f"خطایی در حین پر کردن پایگاه داده رخ داد: {e}"))
@@ -51,14 +58,21 @@ class Command(BaseCommand):
     def clear_data(self):
         """ Clears all data from the relevant models except for superusers. """
         self.stdout.write("پاک‌سازی داده‌های موجود...")
+        DailySalesRollup.objects.all().delete()
         Order.objects.all().delete()
         DailyMenu.objects.all().delete()
         Schedule.objects.all().delete()
         Transaction.objects.all().delete()
+        Statement.objects.all().delete()
+        Posting.objects.all().delete()
+        JournalEntry.objects.all().delete()
+        Account.objects.filter(kind__in=Account.CACHED_KINDS).update(balance=Decimal('0.00'))
         Contract.objects.all().delete()
         # User objects are already cleared in the handle method
         Wallet.objects.all().delete()
         Company.objects.all().delete()
+        # Accounts of the deleted companies and users are left without an owner
+        Account.objects.filter(kind__in=Account.CACHED_KINDS, company__isnull=True, user__isnull=True).delete()
         SideDish.objects.all().delete()
         FoodItem.objects.all().delete()
         FoodCategory.objects.all().delete()
@@ -134,6 +148,7 @@ class Command(BaseCommand):
             amount=deposit_amount,
             description=f"واریز اولیه توسط {super_admin.username}."
         )
+        journal.record_deposit(company.id, deposit_amount, created_by=super_admin)
 
         # 4. Create Users for the Company
         company_admin = User.objects.create_user(
@@ -161,10 +176,12 @@ class Command(BaseCommand):
 
         # 5. Allocate Budget to Employees
         allocation_amount = Decimal('500000.00')
+        allocations = []
         for employee in employees:
             if wallet.balance >= allocation_amount:
                 wallet.balance -= allocation_amount
                 employee.budget += allocation_amount
+                allocations.append((employee.pk, allocation_amount))
 
                 Transaction.objects.create(
                     wallet=wallet,
@@ -185,6 +202,7 @@ class Command(BaseCommand):
         wallet.save()
         for emp in employees:
             emp.save()
+        journal.record_allocations(company.id, allocations, created_by=company_admin)
 
         # 6. Create Schedule and Daily Menus
         schedule = Schedule.objects.create(
@@ -195,29 +213,34 @@ class Command(BaseCommand):
             is_active=True
         )
 
-        current_date = schedule.start_date
-        while current_date <= schedule.end_date:
-            # Skip Fridays (weekend in Iran)
-            if current_date.weekday() != 4: # Friday is 4 in Python's weekday()
-                daily_menu = DailyMenu.objects.create(schedule=schedule, date=current_date)
-                daily_menu.available_foods.set(random.sample(self.food_items, k=2))
-                daily_menu.available_sides.set(random.sample(self.side_dishes, k=2))
-            current_date += timedelta(days=1)
+        # Skip Fridays (weekend in Iran); Friday is 4 in Python's weekday()
+        days = service_days(schedule.start_date, schedule.end_date, skip_weekdays=[4])
+        templates = [
+            MenuTemplate(
+                [food.pk for food in random.sample(self.food_items, k=2)],
+                [side.pk for side in random.sample(self.side_dishes, k=2)],
+            )
+            for _ in days
+        ]
+        generate_menus([(schedule, days, rotation_rule(templates))])
 
         # 7. Create Past Orders for some employees
         past_menus = DailyMenu.objects.filter(schedule=schedule, date__lt=today).order_by('?')
+        charged_orders = []
         for employee in random.sample(employees, k=3):
             for menu in past_menus[:5]:
                 food_item = menu.available_foods.first()
                 side_dish = menu.available_sides.first()
-                total_cost = food_item.price + (side_dish.price if side_dish else Decimal('0.00'))
+                prices = Order.calculate_prices(food_item, [side_dish] if side_dish else [])
+                total_cost = prices['total_price']
 
                 if employee.budget >= total_cost:
                     order = Order.objects.create(
                         user=employee,
                         daily_menu=menu,
                         food_item=food_item,
-                        status=random.choice([Order.OrderStatus.DELIVERED, Order.OrderStatus.CONFIRMED])
+                        status=random.choice([Order.OrderStatus.DELIVERED, Order.OrderStatus.CONFIRMED]),
+                        **prices
                     )
                     if side_dish:
                         order.side_dishes.add(side_dish)
@@ -225,6 +248,7 @@ class Command(BaseCommand):
                     # Update employee budget and create transaction
                     employee.budget -= total_cost
                     employee.save()
+                    charged_orders.append(order)
 
                     Transaction.objects.create(
                         wallet=wallet,
@@ -232,4 +256,6 @@ class Command(BaseCommand):
                         transaction_type=Transaction.TransactionType.ORDER_DEDUCTION,
                         amount=-total_cost,
                         description=f"کسر هزینه برای سفارش #{order.id}"
-                    )
\ No newline at end of file
+                    )
+
+        journal.record_order_charges(charged_orders)
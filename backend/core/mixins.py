@@ -0,0 +1,65 @@
+# core/mixins.py
+
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control
+
+from .cache import is_shared, tag_versions
+
+
+class ConditionalGetMixin:
+    """
+    Answers conditional list requests (If-None-Match) with a 304 before the
+    full queryset is evaluated and serialised.
+
+    The validator is either the versions of `conditional_tags` (cache tags
+    bumped by signals, for lists whose output depends on related rows) or
+    one aggregate over the filtered queryset: the latest of the
+    `conditional_timestamps` fields plus the row count, which also changes
+    when a row is deleted. Only an ETag is sent: a Last-Modified date taken
+    from the newest row would stay the same when an older row is deleted, so
+    If-Modified-Since alone could confirm a stale copy. Tag versions held in
+    a per-process cache miss the bumps made by other workers, so lists
+    validated by tags are only answered conditionally when the cache is
+    shared.
+    """
+    conditional_tags = ()
+    conditional_timestamps = ('updated_at',)
+
+    def conditional_etag(self, queryset):
+        """Return the ETag of what the request would return, or None if unknown."""
+        if self.conditional_tags:
+            if not is_shared():
+                return None
+            parts = tag_versions(self.conditional_tags)
+        else:
+            aggregates = {f'last_{i}': Max(field) for i, field in enumerate(self.conditional_timestamps)}
+            stats = queryset.order_by().aggregate(count=Count('pk'), **aggregates)
+            timestamps = [stats[f'last_{i}'] for i in range(len(self.conditional_timestamps))]
+            parts = [stats['count']] + [moment.isoformat() for moment in timestamps if moment is not None]
+
+        # The URL (host and query string) is part of the validator, as the
+        # serialised output depends on it
+        seed = ':'.join([type(self).__name__, self.request.build_absolute_uri(), *map(str, parts)])
+        return '"%s"' % hashlib.sha1(seed.encode()).hexdigest()
+
+    def conditional_response(self, request, queryset, respond):
+        """Return a 304 if the client's copy is current, otherwise respond() with its ETag attached."""
+        etag = self.conditional_etag(queryset)
+        if etag is None:
+            return respond()
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = respond()
+        response['ETag'] = etag
+        # Clients keep their copy but revalidate it on every use
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional_response(
+            request,
+            self.filter_queryset(self.get_queryset()),
+            lambda: super(ConditionalGetMixin, self).list(request, *args, **kwargs),
+        )
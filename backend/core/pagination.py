@@ -0,0 +1,23 @@
+# core/pagination.py
+
+from rest_framework.pagination import CursorPagination
+
+
+class CreatedAtCursorPagination(CursorPagination):
+    """
+    Keyset pagination over (created_at, id), newest first.
+    Each page is fetched with a `created_at < cursor` range condition on an
+    index instead of an OFFSET, so deep pages cost the same as the first one.
+    """
+    ordering = ('-created_at', '-id')
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+
+
+class TimestampCursorPagination(CreatedAtCursorPagination):
+    """
+    Keyset pagination over (timestamp, id), newest first, for log tables
+    such as wallet transactions.
+    """
+    ordering = ('-timestamp', '-id')
@@ -40,6 +40,7 @@ INSTALLED_APPS = [
     'orders',
     'wallets',
     'contracts',
+    'ledger',
 ]
 
 # ==================== Middleware ====================
@@ -87,6 +88,34 @@ DATABASES = {
     )
 }
 
+# ==================== Cache ====================
+# A bounded, per-process LRU cache by default. Each worker process then holds
+# its own copy and only sees its own invalidations, so values that other
+# workers must see expire (production plans, rendered menus, cached lists) are
+# not cached with it. Deployments running several workers set REDIS_URL to
+# share one cache and enable them (requires the `redis` package).
+REDIS_URL = os.environ.get('REDIS_URL')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': 'ehsan',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'ehsan-default',
+            'OPTIONS': {
+                # The least recently used quarter is evicted when the cache is full
+                'MAX_ENTRIES': int(os.environ.get('CACHE_MAX_ENTRIES', '5000')),
+                'CULL_FREQUENCY': 4,
+            },
+        }
+    }
+
 # ==================== Authentication ====================
 AUTH_USER_MODEL = 'users.User'
 LOGIN_REDIRECT_URL = '/admin/'
@@ -147,6 +176,11 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # ==================== Custom Settings ====================
 RESERVATION_LEAD_DAYS = 2
+
+# 'sync' charges budgets while the order request is handled.
+# 'queued' accepts orders into a settlement queue that the
+# `settle_orders` worker charges in batches.
+ORDER_INTAKE_MODE = os.environ.get('ORDER_INTAKE_MODE', 'sync')
 CSRF_TRUSTED_ORIGINS = [
     'https://ehsan-backend.darkube.app',
     'http://ehsan-backend.darkube.app',
@@ -0,0 +1,11 @@
+# core/tests/caches.py
+
+# The test run is a single process, so a local-memory cache is seen by every
+# "worker" and can stand in for a shared one.
+SHARED_LOCMEM_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'ehsan-tests',
+        'SHARED': True,
+    }
+}
@@ -0,0 +1,41 @@
+# core/tests/concurrency.py
+
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import OperationalError, connections
+
+
+def _is_lock_error(exc):
+    message = str(exc).lower()
+    return 'locked' in message or 'deadlock' in message or 'could not serialize' in message
+
+
+def run_concurrently(func, calls, workers=16, retries=1000):
+    """
+    Test helper that runs func(*args) for every args tuple in `calls` on a
+    pool of threads, each with its own database connection, and returns the
+    results in call order. A call that raised returns its exception instead.
+
+    SQLite (and PostgreSQL on deadlock or serialization failure) reports lock
+    contention as an OperationalError; such calls are retried after a short
+    random, growing pause, which is what a client would do. Use it from a
+    TransactionTestCase so the threads can see each other's commits.
+    """
+    def run(args):
+        try:
+            for attempt in range(retries):
+                try:
+                    return func(*args)
+                except OperationalError as exc:
+                    if not _is_lock_error(exc) or attempt == retries - 1:
+                        return exc
+                    time.sleep(random.uniform(0, 0.001 * 2 ** min(attempt, 5)))
+                except Exception as exc:
+                    return exc
+        finally:
+            connections.close_all()
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run, calls))
@@ -0,0 +1,157 @@
+# core/tests/fake_redis.py
+
+import socketserver
+import threading
+import time
+
+
+class _RespHandler(socketserver.StreamRequestHandler):
+    """Serves one client connection: reads RESP commands, writes RESP replies."""
+
+    def handle(self):
+        self.protocol = 2
+        queued = None  # commands buffered between MULTI and EXEC
+        while True:
+            command = self._read_command()
+            if command is None:
+                return
+            name = command[0].decode().upper()
+            if name == 'HELLO' and len(command) > 1:
+                self.protocol = int(command[1])
+            if name == 'MULTI':
+                queued = []
+                self._write('+OK')
+            elif name == 'EXEC':
+                replies = [self.server.execute(*queued_command) for queued_command in queued or []]
+                queued = None
+                self._write(replies)
+            elif queued is not None:
+                queued.append(command)
+                self._write('+QUEUED')
+            else:
+                self._write(self.server.execute(*command))
+
+    def _read_command(self):
+        header = self.rfile.readline()
+        if not header:
+            return None
+        args = []
+        for _ in range(int(header[1:])):
+            length = int(self.rfile.readline()[1:])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+    def _encode(self, reply):
+        if reply is None:
+            return b'_\r\n' if self.protocol == 3 else b'$-1\r\n'
+        if isinstance(reply, int):
+            return b':%d\r\n' % reply
+        if isinstance(reply, str):  # status ('+OK') or error ('-ERR ...') line
+            return reply.encode() + b'\r\n'
+        if isinstance(reply, dict):  # RESP3 map, only sent to HELLO 3
+            return b'%%%d\r\n' % len(reply) + b''.join(
+                self._encode(key) + self._encode(value) for key, value in reply.items()
+            )
+        if isinstance(reply, list):
+            return b'*%d\r\n' % len(reply) + b''.join(self._encode(item) for item in reply)
+        return b'$%d\r\n%s\r\n' % (len(reply), reply)
+
+    def _write(self, reply):
+        self.wfile.write(self._encode(reply))
+
+
+class FakeRedisServer(socketserver.ThreadingTCPServer):
+    """
+    Test helper: an in-memory server speaking the Redis protocol (RESP2) on a
+    free local port, implementing the commands Django's RedisCache sends.
+    Use it as a context manager; `url` is the LOCATION for the cache backend.
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), _RespHandler)
+        self.data = {}
+        self.expires = {}
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return 'redis://%s:%d/0' % self.server_address
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        self.server_close()
+
+    def _alive(self, key):
+        expires_at = self.expires.get(key)
+        if expires_at is not None and expires_at <= time.monotonic():
+            self.data.pop(key, None)
+            self.expires.pop(key, None)
+        return key in self.data
+
+    def _set(self, key, value, ex=None):
+        self.data[key] = value
+        self.expires.pop(key, None)
+        if ex is not None:
+            self.expires[key] = time.monotonic() + ex
+
+    def execute(self, name, *args):
+        with self.lock:
+            return self._execute(name.decode().upper(), *args)
+
+    def _execute(self, name, *args):
+        if name == 'HELLO':
+            # Apart from nulls, the RESP2 replies used here are valid RESP3 too
+            protocol = int(args[0]) if args else 2
+            info = {b'server': b'fake-redis', b'proto': protocol}
+            return info if protocol == 3 else [item for pair in info.items() for item in pair]
+        if name == 'PING':
+            return '+PONG'
+        if name in ('CLIENT', 'SELECT'):
+            return '+OK'
+        if name == 'GET':
+            return self.data[args[0]] if self._alive(args[0]) else None
+        if name == 'MGET':
+            return [self.data[key] if self._alive(key) else None for key in args]
+        if name == 'SET':
+            key, value, options = args[0], args[1], [arg.decode().upper() for arg in args[2:]]
+            if 'NX' in options and self._alive(key):
+                return None
+            ex = int(options[options.index('EX') + 1]) if 'EX' in options else None
+            self._set(key, value, ex)
+            return '+OK'
+        if name == 'MSET':
+            for key, value in zip(args[::2], args[1::2]):
+                self._set(key, value)
+            return '+OK'
+        if name == 'DEL':
+            deleted = 0
+            for key in args:
+                if self._alive(key):
+                    del self.data[key]
+                    self.expires.pop(key, None)
+                    deleted += 1
+            return deleted
+        if name == 'EXISTS':
+            return sum(self._alive(key) for key in args)
+        if name == 'EXPIRE':
+            if not self._alive(args[0]):
+                return 0
+            self.expires[args[0]] = time.monotonic() + int(args[1])
+            return 1
+        if name == 'PERSIST':
+            return int(self._alive(args[0]) and self.expires.pop(args[0], None) is not None)
+        if name == 'INCRBY':
+            value = int(self.data[args[0]]) + int(args[1]) if self._alive(args[0]) else int(args[1])
+            self.data[args[0]] = str(value).encode()
+            return value
+        if name == 'FLUSHDB':
+            self.data.clear()
+            self.expires.clear()
+            return '+OK'
+        return f'-ERR unknown command {name}'
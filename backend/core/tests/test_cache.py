@@ -0,0 +1,114 @@
+# core/tests/test_cache.py
+
+import unittest
+from django.core.cache import cache, caches
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from users.models import User
+from companies.models import Company
+from core.cache import CacheNamespace, invalidate_tags, is_shared
+from core.tests.caches import SHARED_LOCMEM_CACHES
+from core.tests.fake_redis import FakeRedisServer
+
+try:
+    import redis
+except ImportError:  # the shared backend is optional
+    redis = None
+
+
+@override_settings(CACHES=SHARED_LOCMEM_CACHES)
+class CacheNamespaceTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.namespace = CacheNamespace('test-ns')
+        self.computed = 0
+
+    def compute(self):
+        self.computed += 1
+        return {'value': self.computed}
+
+    def test_values_are_computed_once(self):
+        """VERIFY: A second lookup is a hit, counted in the hit rate, and None can be cached."""
+        self.assertEqual(self.namespace.get_or_set(['a'], self.compute), {'value': 1})
+        self.assertEqual(self.namespace.get_or_set(['a'], self.compute), {'value': 1})
+        self.assertEqual(self.namespace.get_or_set(['b'], self.compute), {'value': 2})
+        self.assertEqual((self.namespace.hits, self.namespace.misses), (1, 2))
+        self.assertAlmostEqual(self.namespace.hit_rate, 1 / 3)
+
+        self.assertIsNone(self.namespace.get_or_set(['none'], lambda: None))
+        self.assertIsNone(self.namespace.get_or_set(['none'], self.compute))
+
+    def test_tags_and_namespace_invalidation(self):
+        """VERIFY: Bumping a tag expires only the entries carrying it, and only after commit."""
+        self.namespace.get_or_set(['a'], self.compute, tags=['red'])
+        self.namespace.get_or_set(['b'], self.compute, tags=['blue'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_tags('red')
+            self.assertEqual(self.namespace.get_or_set(['a'], self.compute, tags=['red']), {'value': 1})
+        self.assertEqual(self.namespace.get_or_set(['a'], self.compute, tags=['red']), {'value': 3})
+        self.assertEqual(self.namespace.get_or_set(['b'], self.compute, tags=['blue']), {'value': 2})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.namespace.invalidate()
+        self.assertEqual(self.namespace.get_or_set(['b'], self.compute, tags=['blue']), {'value': 4})
+
+    def test_per_process_cache_is_not_used(self):
+        """VERIFY: A local-memory cache only counts as shared when configured so, and otherwise every lookup computes."""
+        with override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}):
+            self.assertFalse(is_shared())
+            self.assertEqual(self.namespace.get_or_set(['a'], self.compute), {'value': 1})
+            self.assertEqual(self.namespace.get_or_set(['a'], self.compute), {'value': 2})
+        self.assertTrue(is_shared())
+
+
+@override_settings(CACHES=SHARED_LOCMEM_CACHES)
+class CompanyListCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        Company.objects.create(name="Beta")
+        self.client.force_authenticate(
+            user=User.objects.create_user(username='list_super', password='password123', role=User.Role.SUPER_ADMIN)
+        )
+        self.url = reverse('company-list')
+
+    def test_list_is_cached_until_a_company_changes(self):
+        """VERIFY: The list is served without queries once cached and refreshed after a write."""
+        self.assertEqual([c['name'] for c in self.client.get(self.url).data], ["Beta"])
+        # Only the conditional GET validator is queried
+        with self.assertNumQueries(1):
+            self.client.get(self.url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Company.objects.create(name="Alpha")
+        self.assertEqual([c['name'] for c in self.client.get(self.url).data], ["Alpha", "Beta"])
+
+
+@unittest.skipIf(redis is None, "the redis package is not installed")
+class SharedCacheTests(TestCase):
+    """
+    Runs the namespace against Django's Redis backend talking to the fake
+    server, with two cache aliases standing in for two worker processes.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = FakeRedisServer().__enter__()
+        cls.addClassCleanup(cls.server.__exit__, None, None, None)
+
+    def test_invalidation_is_seen_by_every_worker(self):
+        """VERIFY: A tag bumped through one worker's cache expires the entry for the other."""
+        backend = {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': self.server.url}
+        with override_settings(CACHES={'default': backend, 'worker': backend}):
+            first = CacheNamespace('shared', using='default')
+            second = CacheNamespace('shared', using='worker')
+            self.assertEqual(first.get_or_set(['menu'], lambda: 'v1', tags=['company:1'], timeout=60), 'v1')
+            self.assertEqual(second.get_or_set(['menu'], lambda: 'v2', tags=['company:1']), 'v1')
+
+            with self.captureOnCommitCallbacks(execute=True):
+                invalidate_tags('company:1', using='default')
+            self.assertEqual(second.get_or_set(['menu'], lambda: 'v2', tags=['company:1']), 'v2')
+            self.assertEqual(caches['worker'].get('missing', 'default'), 'default')
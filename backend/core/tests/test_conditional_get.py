@@ -0,0 +1,97 @@
+# core/tests/test_conditional_get.py
+
+from decimal import Decimal
+from datetime import timedelta
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from users.models import User
+from companies.models import Company
+from menu.models import FoodCategory, FoodItem
+from schedules.models import Schedule, DailyMenu
+from core.tests.caches import SHARED_LOCMEM_CACHES
+
+
+class ConditionalGetTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.category = FoodCategory.objects.create(name="Mains")
+        self.kebab = FoodItem.objects.create(name="Kebab", description="", price=Decimal('150.00'), category=self.category)
+        FoodItem.objects.create(name="Pasta", description="", price=Decimal('90.00'))
+        self.client.force_authenticate(user=User.objects.create_user(username='cond_user', password='password123'))
+        self.url = reverse('fooditem-list')
+
+    def test_unchanged_list_returns_304_after_one_query(self):
+        """VERIFY: A matching ETag is answered with one aggregate query."""
+        first = self.client.get(self.url)
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(first.data), 2)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b'')
+
+        # The validator follows the filters and query string of the request
+        self.assertNotEqual(self.client.get(self.url, {'page': 2})['ETag'], first['ETag'])
+
+    def test_updates_deletes_and_related_rows_change_the_etag(self):
+        """VERIFY: Editing an item or its category, or deleting an item, invalidates the client's copy."""
+        etags = [self.client.get(self.url)['ETag']]
+
+        FoodItem.objects.filter(pk=self.kebab.pk).update(updated_at=timezone.now() + timedelta(seconds=5))
+        etags.append(self.client.get(self.url)['ETag'])
+
+        FoodCategory.objects.filter(pk=self.category.pk).update(updated_at=timezone.now() + timedelta(seconds=10))
+        etags.append(self.client.get(self.url)['ETag'])
+
+        FoodItem.objects.filter(name="Pasta").delete()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etags[-1])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etags.append(response['ETag'])
+        self.assertEqual(len(set(etags)), 4)
+
+    def test_deleting_an_older_row_is_not_hidden_by_if_modified_since(self):
+        """VERIFY: Lists send no Last-Modified, so deleting a row other than the newest cannot be answered with a 304."""
+        FoodItem.objects.filter(pk=self.kebab.pk).update(updated_at=timezone.now() + timedelta(seconds=5))
+        first = self.client.get(self.url)
+        self.assertNotIn('Last-Modified', first)
+
+        FoodItem.objects.filter(name="Pasta").delete()
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE='Fri, 01 Jan 2100 00:00:00 GMT')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+
+    @override_settings(CACHES=SHARED_LOCMEM_CACHES)
+    def test_schedule_list_follows_cache_tags(self):
+        """VERIFY: The schedule list revalidates on its tags and changes when one of its menus does."""
+        today = timezone.localdate()
+        schedule = Schedule.objects.create(
+            name="Week", company=Company.objects.create(name="Cond Co"), start_date=today, end_date=today
+        )
+        url = reverse('schedule-list')
+        etag = self.client.get(url)['ETag']
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            DailyMenu.objects.create(schedule=schedule, date=today).available_foods.add(self.kebab)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]['menu_count'], 1)
+
+    def test_schedule_list_is_not_validated_by_a_per_process_cache(self):
+        """VERIFY: Without a shared cache the schedule list carries no validator, so a stale copy is never confirmed."""
+        today = timezone.localdate()
+        Schedule.objects.create(name="Week", company=Company.objects.create(name="Cond Co"), start_date=today, end_date=today)
+
+        response = self.client.get(reverse('schedule-list'), HTTP_IF_NONE_MATCH='*')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('ETag', response)
+        self.assertEqual(response.data[0]['menu_count'], 0)
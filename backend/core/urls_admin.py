@@ -5,6 +5,7 @@ from rest_framework.routers import DefaultRouter
 from orders.views_admin import (
     AdminOrderViewSet,
     DailyOrderSummaryView,
+    ProductionPlanView,
     DashboardStatsView,
     AdminReportsView,
 )
@@ -18,11 +19,13 @@ urlpatterns = [
     # --- Dashboard & Reports ---
     path('dashboard-stats/', DashboardStatsView.as_view(), name='dashboard-stats'),
     path('reports/daily-summary/', DailyOrderSummaryView.as_view(), name='daily-summary'),
+    path('reports/production-plan/', ProductionPlanView.as_view(), name='production-plan'),
     path('reports/', AdminReportsView.as_view(), name='admin-reports'),
 
     # --- Wallet, Contract, and User Management ---
     path('wallets/', include('wallets.urls')),
     path('contracts/', include('contracts.urls')),  # [NEW] Contracts management endpoints
+    path('ledger/', include('ledger.urls')),
     path('', include('users.urls_admin')),  # Employee/user management routes
 
     # --- Orders ViewSet routes ---
@@ -0,0 +1,50 @@
+# ledger/admin.py
+from django.contrib import admin
+from .models import Account, JournalEntry, Posting, Statement
+
+
+class ReadOnlyAdmin(admin.ModelAdmin):
+    """The ledger is append-only, so it is never edited through the admin."""
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(Account)
+class AccountAdmin(ReadOnlyAdmin):
+    list_display = ('id', 'kind', 'company', 'user', 'balance', 'updated_at')
+    list_filter = ('kind',)
+    search_fields = ('company__name', 'user__username')
+    list_select_related = ('company', 'user')
+
+
+class PostingInline(admin.TabularInline):
+    model = Posting
+    extra = 0
+    can_delete = False
+    readonly_fields = ('account', 'amount')
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(JournalEntry)
+class JournalEntryAdmin(ReadOnlyAdmin):
+    list_display = ('id', 'entry_type', 'reference', 'description', 'created_by', 'created_at')
+    list_filter = ('entry_type', 'created_at')
+    search_fields = ('reference', 'description')
+    list_select_related = ('created_by',)
+    inlines = [PostingInline]
+
+
+@admin.register(Statement)
+class StatementAdmin(ReadOnlyAdmin):
+    list_display = ('account', 'period', 'starts_at', 'opening_balance', 'closing_balance', 'posting_count')
+    list_filter = ('period', 'starts_at')
+    search_fields = ('account__company__name', 'account__user__username')
+    list_select_related = ('account__company', 'account__user')
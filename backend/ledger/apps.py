@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+class LedgerConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'ledger'
+
+    def ready(self):
+        # Register the signals that open accounts for new companies and users.
+        import ledger.signals
@@ -0,0 +1,210 @@
+# ledger/journal.py
+
+from collections import defaultdict, namedtuple
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import F, Q, Sum
+from django.utils import timezone
+
+from .models import Account, JournalEntry, Posting
+
+Kind = Account.Kind
+EntryType = JournalEntry.EntryType
+
+# An entry to post: legs is a list of (account key, signed amount) pairs summing to zero
+Entry = namedtuple('Entry', ['entry_type', 'legs', 'description', 'reference'])
+
+CENT = Decimal('0.01')
+
+FUNDING = ('system', Kind.FUNDING)
+SALES = ('system', Kind.SALES)
+
+
+def company_key(company_id):
+    return ('company', company_id)
+
+
+def user_key(user_id):
+    return ('user', user_id)
+
+
+def _account_key(account):
+    if account.kind == Kind.COMPANY_WALLET:
+        return company_key(account.company_id)
+    if account.kind == Kind.EMPLOYEE_BUDGET:
+        return user_key(account.user_id)
+    return ('system', account.kind)
+
+
+def _key_filter(keys):
+    company_ids = [owner for kind, owner in keys if kind == 'company']
+    user_ids = [owner for kind, owner in keys if kind == 'user']
+    system_kinds = [owner for kind, owner in keys if kind == 'system']
+    return (
+        Q(kind=Kind.COMPANY_WALLET, company_id__in=company_ids)
+        | Q(kind=Kind.EMPLOYEE_BUDGET, user_id__in=user_ids)
+        | Q(kind__in=system_kinds)
+    )
+
+
+def _new_account(key):
+    kind, owner = key
+    if kind == 'company':
+        return Account(kind=Kind.COMPANY_WALLET, company_id=owner)
+    if kind == 'user':
+        return Account(kind=Kind.EMPLOYEE_BUDGET, user_id=owner)
+    return Account(kind=owner)
+
+
+def get_accounts(keys):
+    """
+    Return {key: Account} for the given account keys in one query.
+    Accounts are normally opened by signals; any that are missing are created.
+    """
+    keys = set(keys)
+    accounts = {_account_key(account): account for account in Account.objects.filter(_key_filter(keys))}
+    missing = keys - accounts.keys()
+    if missing:
+        Account.objects.bulk_create([_new_account(key) for key in missing], ignore_conflicts=True)
+        accounts.update(
+            (_account_key(account), account) for account in Account.objects.filter(_key_filter(missing))
+        )
+    return accounts
+
+
+def post_entries(entries, created_by=None):
+    """
+    Write a batch of balanced journal entries. Entries and postings are bulk
+    inserted, and the cached balances of the wallet and budget accounts involved
+    are moved with one UPDATE of F() increments, in account id order. Only
+    those account rows are locked; system accounts are never updated.
+    Returns the created JournalEntry objects.
+    """
+    entries = [entry for entry in entries if any(amount for _, amount in entry.legs)]
+    if not entries:
+        return []
+    for entry in entries:
+        if sum(amount for _, amount in entry.legs) != 0:
+            raise ValueError(f"Unbalanced {entry.entry_type} entry: {entry.legs}")
+
+    accounts = get_accounts(key for entry in entries for key, _ in entry.legs)
+
+    now = timezone.now()
+    with transaction.atomic():
+        journal_entries = JournalEntry.objects.bulk_create([
+            JournalEntry(
+                entry_type=entry.entry_type,
+                description=entry.description[:255],
+                reference=entry.reference,
+                created_by=created_by,
+            )
+            for entry in entries
+        ])
+
+        deltas = defaultdict(Decimal)
+        postings = []
+        for journal_entry, entry in zip(journal_entries, entries):
+            for key, amount in entry.legs:
+                account = accounts[key]
+                postings.append(Posting(entry=journal_entry, account=account, amount=amount, posted_at=now))
+                if account.caches_balance:
+                    deltas[account.pk] += amount
+        Posting.objects.bulk_create(postings)
+
+        to_update = []
+        for pk in sorted(deltas):
+            if deltas[pk]:
+                to_update.append(Account(pk=pk, balance=F('balance') + deltas[pk], updated_at=now))
+        if to_update:
+            Account.objects.bulk_update(to_update, ['balance', 'updated_at'])
+
+    return journal_entries
+
+
+# --- Money movements ---
+
+def record_deposit(company_id, amount, created_by=None, description=''):
+    """Money paid in by a company: funding -> company wallet."""
+    return post_entries([Entry(
+        EntryType.DEPOSIT,
+        [(FUNDING, -amount), (company_key(company_id), amount)],
+        description, f'company:{company_id}',
+    )], created_by)
+
+
+def record_allocations(company_id, allocations, created_by=None, description=''):
+    """
+    Budget allocations from a company wallet, given as (user_id, amount) pairs:
+    company wallet -> employee budget, one entry per employee.
+    """
+    return post_entries([
+        Entry(
+            EntryType.ALLOCATION,
+            [(company_key(company_id), -amount), (user_key(user_id), amount)],
+            description, f'user:{user_id}',
+        )
+        for user_id, amount in allocations
+    ], created_by)
+
+
+def record_order_charges(orders):
+    """Charge orders to their users' budgets: employee budget -> sales."""
+    return post_entries([
+        Entry(
+            EntryType.ORDER,
+            [(user_key(order.user_id), -order.total_price), (SALES, order.total_price)],
+            f"Order #{order.pk}", f'order:{order.pk}',
+        )
+        for order in orders
+    ])
+
+
+def record_order_adjustment(user_id, order_id, amount, description=''):
+    """
+    Move money between a user's budget and sales for an existing order.
+    A positive amount is a refund to the user, a negative one an extra charge.
+    """
+    entry_type = EntryType.REFUND if amount > 0 else EntryType.ORDER
+    return post_entries([Entry(
+        entry_type,
+        [(SALES, -amount), (user_key(user_id), amount)],
+        description, f'order:{order_id}',
+    )])
+
+
+# --- Verification ---
+
+def derived_balances():
+    """Return {account_id: sum of postings} for every account with postings, in one grouped query."""
+    rows = Posting.objects.values('account_id').annotate(total=Sum('amount')).values_list('account_id', 'total')
+    return {account_id: total.quantize(CENT) for account_id, total in rows}
+
+
+def verify_balances(fix=False):
+    """
+    Re-derive the cached balance of every wallet and budget account from its
+    postings. Returns a list of (account, cached, derived) mismatches; with
+    fix=True the cached balances are rewritten to the derived values.
+    """
+    derived = derived_balances()
+    mismatches = []
+    for account in Account.objects.filter(kind__in=Account.CACHED_KINDS).order_by('pk'):
+        total = derived.get(account.pk, Decimal('0.00'))
+        if account.balance != total:
+            mismatches.append((account, account.balance, total))
+
+    if fix and mismatches:
+        with transaction.atomic():
+            for account, _, total in mismatches:
+                account.balance = total
+            Account.objects.bulk_update([account for account, _, _ in mismatches], ['balance'])
+    return mismatches
+
+
+def unbalanced_entries():
+    """Return the ids of journal entries whose postings do not sum to zero."""
+    return list(
+        Posting.objects.values('entry_id').annotate(total=Sum('amount'))
+        .exclude(total=0).values_list('entry_id', flat=True)
+    )
@@ -0,0 +1,41 @@
+# ledger/management/commands/close_statements.py
+
+from datetime import datetime, time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from ledger.models import Statement
+from ledger.statements import close_periods
+
+
+class Command(BaseCommand):
+    """
+    Closes the daily and/or monthly ledger statements that are due.
+    Meant to run from cron shortly after midnight.
+    """
+    help = 'Materialises wallet and budget statements for every complete period not yet closed.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--period', choices=['day', 'month', 'all'], default='all',
+            help='Which statements to close (default: both).'
+        )
+        parser.add_argument('--until', help='Only close periods ending by this date (YYYY-MM-DD); default: now.')
+
+    def handle(self, *args, **options):
+        until = None
+        if options['until']:
+            day = parse_date(options['until'])
+            if day is None:
+                raise CommandError(f"Invalid date '{options['until']}'. Use YYYY-MM-DD.")
+            until = timezone.make_aware(datetime.combine(day, time.min))
+
+        periods = [Statement.Period.DAY, Statement.Period.MONTH]
+        if options['period'] != 'all':
+            periods = [Statement.Period(options['period'].upper())]
+
+        for period in periods:
+            written = close_periods(period, until)
+            self.stdout.write(self.style.SUCCESS(f"Wrote {written} {period.label.lower()} statements."))
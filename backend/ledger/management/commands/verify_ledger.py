@@ -0,0 +1,31 @@
+# ledger/management/commands/verify_ledger.py
+
+from django.core.management.base import BaseCommand
+
+from ledger.journal import unbalanced_entries, verify_balances
+
+
+class Command(BaseCommand):
+    """
+    Re-derives the cached ledger balances from the postings and reports drift.
+    """
+    help = 'Verifies that every journal entry balances and that cached account balances match their postings.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--fix', action='store_true', help='Rewrite mismatched cached balances to the derived values.')
+
+    def handle(self, *args, **options):
+        unbalanced = unbalanced_entries()
+        for entry_id in unbalanced:
+            self.stdout.write(self.style.ERROR(f"Journal entry #{entry_id} does not balance."))
+
+        mismatches = verify_balances(fix=options['fix'])
+        for account, cached, derived in mismatches:
+            self.stdout.write(self.style.WARNING(
+                f"Account #{account.pk} ({account.get_kind_display()}): cached {cached}, postings sum to {derived}."
+            ))
+
+        if not unbalanced and not mismatches:
+            self.stdout.write(self.style.SUCCESS("Ledger is consistent."))
+        elif options['fix'] and mismatches:
+            self.stdout.write(self.style.SUCCESS(f"Rewrote {len(mismatches)} cached balances."))
@@ -0,0 +1,48 @@
+from decimal import Decimal
+
+from django.db import migrations
+
+
+def open_accounts(apps, schema_editor):
+    """
+    Open the system accounts and one account per existing company and user,
+    carrying over the current wallet balances and budgets as opening entries.
+    """
+    Account = apps.get_model('ledger', 'Account')
+    JournalEntry = apps.get_model('ledger', 'JournalEntry')
+    Posting = apps.get_model('ledger', 'Posting')
+    Wallet = apps.get_model('wallets', 'Wallet')
+    User = apps.get_model('users', 'User')
+
+    funding = Account.objects.create(kind='FUNDING')
+    Account.objects.create(kind='SALES')
+
+    openings = []
+    for wallet in Wallet.objects.all():
+        account = Account.objects.create(kind='COMPANY_WALLET', company_id=wallet.company_id, balance=wallet.balance)
+        openings.append((account, wallet.balance))
+    for user in User.objects.all():
+        account = Account.objects.create(kind='EMPLOYEE_BUDGET', user_id=user.pk, balance=user.budget)
+        openings.append((account, user.budget))
+
+    for account, amount in openings:
+        if amount == Decimal('0.00'):
+            continue
+        entry = JournalEntry.objects.create(entry_type='OPENING', description="Opening balance")
+        Posting.objects.bulk_create([
+            Posting(entry=entry, account=funding, amount=-amount),
+            Posting(entry=entry, account=account, amount=amount),
+        ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ledger', '0001_initial'),
+        ('users', '0001_initial'),
+        ('wallets', '0002_transaction_history_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(open_accounts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:14
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def copy_entry_times(apps, schema_editor):
+    """Give existing postings the time of their journal entry."""
+    Posting = apps.get_model('ledger', 'Posting')
+    JournalEntry = apps.get_model('ledger', 'JournalEntry')
+    Posting.objects.update(
+        posted_at=models.Subquery(JournalEntry.objects.filter(pk=models.OuterRef('entry_id')).values('created_at')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ledger', '0002_open_accounts'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Statement',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.CharField(choices=[('DAY', 'Daily'), ('MONTH', 'Monthly')], max_length=10)),
+                ('starts_at', models.DateTimeField()),
+                ('ends_at', models.DateTimeField()),
+                ('opening_balance', models.DecimalField(decimal_places=2, max_digits=14)),
+                ('closing_balance', models.DecimalField(decimal_places=2, max_digits=14)),
+                ('totals', models.JSONField(default=dict)),
+                ('posting_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.RemoveIndex(
+            model_name='posting',
+            name='ledger_posting_account_idx',
+        ),
+        migrations.AddField(
+            model_name='posting',
+            name='posted_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.RunPython(copy_entry_times, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='posting',
+            index=models.Index(fields=['account', 'posted_at'], name='ledger_posting_account_ts_idx'),
+        ),
+        migrations.AddField(
+            model_name='statement',
+            name='account',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='statements', to='ledger.account'),
+        ),
+        migrations.AddIndex(
+            model_name='statement',
+            index=models.Index(fields=['account', 'ends_at'], name='ledger_statement_account_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='statement',
+            constraint=models.UniqueConstraint(fields=('account', 'period', 'starts_at'), name='ledger_statement_unique_period'),
+        ),
+    ]
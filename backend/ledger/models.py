@@ -0,0 +1,170 @@
+# ledger/models.py
+
+from decimal import Decimal
+from django.db import models
+from django.utils import timezone
+from django.conf import settings
+
+
+class Account(models.Model):
+    """
+    A ledger account: one per company wallet, one per employee budget, plus
+    the system accounts money enters from (FUNDING) and leaves to (SALES).
+    Wallet and budget accounts cache their running balance; system accounts
+    do not, so the many postings they receive never contend on one row.
+    Accounts outlive their owner, so the history stays balanced.
+    """
+    class Kind(models.TextChoices):
+        COMPANY_WALLET = "COMPANY_WALLET", "Company Wallet"
+        EMPLOYEE_BUDGET = "EMPLOYEE_BUDGET", "Employee Budget"
+        FUNDING = "FUNDING", "Funding"
+        SALES = "SALES", "Catering Sales"
+
+    kind = models.CharField(max_length=20, choices=Kind.choices)
+    company = models.OneToOneField(
+        'companies.Company',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='ledger_account'
+    )
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='ledger_account'
+    )
+    balance = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=Decimal('0.00'),
+        help_text="Running total of the account's postings (wallet and budget accounts only)."
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    CACHED_KINDS = (Kind.COMPANY_WALLET, Kind.EMPLOYEE_BUDGET)
+    SYSTEM_KINDS = (Kind.FUNDING, Kind.SALES)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['kind'],
+                condition=models.Q(kind__in=['FUNDING', 'SALES']),
+                name='ledger_account_unique_system_kind',
+            ),
+        ]
+
+    @property
+    def caches_balance(self):
+        return self.kind in self.CACHED_KINDS
+
+    def __str__(self):
+        owner = self.company or self.user or self.get_kind_display()
+        return f"{self.get_kind_display()} account of {owner}"
+
+
+class JournalEntry(models.Model):
+    """
+    One money movement. Its postings always sum to zero, and neither the
+    entry nor its postings are changed after they are written; mistakes are
+    corrected with a new entry.
+    """
+    class EntryType(models.TextChoices):
+        OPENING = "OPENING", "Opening Balance"
+        DEPOSIT = "DEPOSIT", "Deposit"
+        ALLOCATION = "ALLOCATION", "Budget Allocation"
+        ORDER = "ORDER", "Order Charge"
+        REFUND = "REFUND", "Refund"
+        ADJUSTMENT = "ADJUSTMENT", "Adjustment"
+
+    entry_type = models.CharField(max_length=20, choices=EntryType.choices)
+    description = models.CharField(max_length=255, blank=True)
+    # Free-form pointer to what caused the entry, e.g. 'order:42'
+    reference = models.CharField(max_length=64, blank=True, db_index=True)
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='journal_entries'
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name_plural = 'journal entries'
+
+    def save(self, *args, **kwargs):
+        if self.pk is not None:
+            raise ValueError("Journal entries are append-only.")
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        raise ValueError("Journal entries are append-only.")
+
+    def __str__(self):
+        return f"{self.get_entry_type_display()} #{self.pk}"
+
+
+class Posting(models.Model):
+    """
+    One side of a journal entry: a signed amount booked to an account.
+    """
+    entry = models.ForeignKey(JournalEntry, on_delete=models.PROTECT, related_name='postings')
+    account = models.ForeignKey(Account, on_delete=models.PROTECT, related_name='postings')
+    amount = models.DecimalField(max_digits=12, decimal_places=2)
+    # Copy of the entry's time, so per-account date ranges are read from one index
+    posted_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            # Account histories, statements and balance queries read postings per account and time
+            models.Index(fields=['account', 'posted_at'], name='ledger_posting_account_ts_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        if self.pk is not None:
+            raise ValueError("Postings are append-only.")
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        raise ValueError("Postings are append-only.")
+
+    def __str__(self):
+        return f"{self.amount} to account #{self.account_id}"
+
+
+class Statement(models.Model):
+    """
+    Closed snapshot of one wallet or budget account over a day or a month:
+    opening and closing balance plus the total of each entry type.
+    Historical balances are answered from the nearest statement plus the
+    postings after it, instead of summing the account's whole history.
+    """
+    class Period(models.TextChoices):
+        DAY = "DAY", "Daily"
+        MONTH = "MONTH", "Monthly"
+
+    account = models.ForeignKey(Account, on_delete=models.PROTECT, related_name='statements')
+    period = models.CharField(max_length=10, choices=Period.choices)
+    starts_at = models.DateTimeField()
+    ends_at = models.DateTimeField()
+    opening_balance = models.DecimalField(max_digits=14, decimal_places=2)
+    closing_balance = models.DecimalField(max_digits=14, decimal_places=2)
+    # {entry_type: signed total} for the postings of the period, amounts as strings
+    totals = models.JSONField(default=dict)
+    posting_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['account', 'period', 'starts_at'], name='ledger_statement_unique_period'),
+        ]
+        indexes = [
+            # The nearest statement before a moment is found by ends_at
+            models.Index(fields=['account', 'ends_at'], name='ledger_statement_account_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.get_period_display()} statement of account #{self.account_id} from {self.starts_at:%Y-%m-%d}"
@@ -0,0 +1,23 @@
+# ledger/signals.py
+from django.conf import settings
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from companies.models import Company
+from .models import Account
+
+@receiver(post_save, sender=Company)
+def create_company_account(sender, instance, created, **kwargs):
+    """
+    Open the ledger account of a company's wallet when the company is created.
+    """
+    if created:
+        Account.objects.create(kind=Account.Kind.COMPANY_WALLET, company=instance)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def create_user_account(sender, instance, created, **kwargs):
+    """
+    Open the ledger account of a user's budget when the user is created.
+    """
+    if created:
+        Account.objects.create(kind=Account.Kind.EMPLOYEE_BUDGET, user=instance)
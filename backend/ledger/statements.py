@@ -0,0 +1,167 @@
+# ledger/statements.py
+
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Count, Max, Min, OuterRef, Q, Subquery, Sum
+from django.utils import timezone
+
+from .models import Account, Posting, Statement
+
+Period = Statement.Period
+ZERO = Decimal('0.00')
+CENT = Decimal('0.01')
+
+
+# --- Period boundaries ---
+
+def period_start(moment, period):
+    """Return the start (local midnight) of the day or month containing `moment`."""
+    day = timezone.localtime(moment).date()
+    if period == Period.MONTH:
+        day = day.replace(day=1)
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def next_period_start(start, period):
+    day = timezone.localtime(start).date()
+    if period == Period.MONTH:
+        day = (day.replace(day=1) + timedelta(days=32)).replace(day=1)
+    else:
+        day = day + timedelta(days=1)
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+# --- Closing ---
+
+def close_periods(period, until=None):
+    """
+    Materialise the statements of the wallet and budget accounts for all
+    complete periods that are not closed yet, ending before `until` (default:
+    now). Only accounts with postings in a period get a statement for it; the
+    others keep their last closing balance, which balance_at() carries
+    forward. Each period is one grouped query over its postings plus one bulk
+    insert, and is committed on its own. Returns the number of statements written.
+    """
+    until = until or timezone.now()
+    last_end = Statement.objects.filter(period=period).aggregate(last=Max('ends_at'))['last']
+
+    if last_end is None:
+        first_posting = Posting.objects.filter(account__kind__in=Account.CACHED_KINDS).aggregate(first=Min('posted_at'))
+        if first_posting['first'] is None:
+            return 0
+        start = period_start(first_posting['first'], period)
+        openings = {}
+    else:
+        start = last_end
+        # The latest closing balance of every account, whichever period it was last active in
+        latest = Statement.objects.filter(period=period, account_id=OuterRef('account_id')).order_by('-ends_at')
+        openings = dict(
+            Statement.objects.filter(period=period, pk=Subquery(latest.values('pk')[:1]))
+            .values_list('account_id', 'closing_balance')
+        )
+
+    written = 0
+    end = next_period_start(start, period)
+    while end <= until:
+        openings, count = _close_period(period, start, end, openings)
+        written += count
+        start, end = end, next_period_start(end, period)
+    return written
+
+
+@transaction.atomic
+def _close_period(period, start, end, openings):
+    rows = Posting.objects.filter(
+        posted_at__gte=start, posted_at__lt=end, account__kind__in=Account.CACHED_KINDS
+    ).values('account_id', 'entry__entry_type').annotate(total=Sum('amount'), count=Count('id')).order_by()
+
+    totals = defaultdict(dict)
+    counts = defaultdict(int)
+    for row in rows:
+        totals[row['account_id']][row['entry__entry_type']] = row['total']
+        counts[row['account_id']] += row['count']
+
+    closings = dict(openings)
+    statements = []
+    for account_id in sorted(totals):
+        opening = openings.get(account_id, ZERO)
+        closing = (opening + sum(totals[account_id].values(), ZERO)).quantize(CENT)
+        closings[account_id] = closing
+        statements.append(Statement(
+            account_id=account_id,
+            period=period,
+            starts_at=start,
+            ends_at=end,
+            opening_balance=opening,
+            closing_balance=closing,
+            totals={entry_type: str(total.quantize(CENT)) for entry_type, total in totals[account_id].items()},
+            posting_count=counts[account_id],
+        ))
+    Statement.objects.bulk_create(statements, batch_size=1000)
+    return closings, len(statements)
+
+
+# --- Historical queries ---
+
+def balance_at(account, moment):
+    """
+    Return the account's balance at `moment`: the closing balance of the
+    latest statement ending by then, plus the postings made after it.
+    """
+    statement = Statement.objects.filter(account=account, ends_at__lte=moment).order_by('-ends_at').first()
+    postings = Posting.objects.filter(account=account, posted_at__lt=moment)
+    base = ZERO
+    if statement is not None:
+        base = statement.closing_balance
+        postings = postings.filter(posted_at__gte=statement.ends_at)
+    return (base + (postings.aggregate(total=Sum('amount'))['total'] or ZERO)).quantize(CENT)
+
+
+def activity(account, start, end):
+    """
+    Return the opening and closing balance and the per-entry-type totals of
+    an account over [start, end). Closed statements inside the range are used
+    as they are (the longest first), and only the postings in the gaps
+    between them are summed.
+    """
+    covered = []
+    gaps = []
+    cursor = start
+    statements = Statement.objects.filter(
+        account=account, starts_at__gte=start, ends_at__lte=end
+    ).order_by('starts_at', '-ends_at')
+    for statement in statements:
+        if statement.starts_at < cursor:
+            continue
+        if statement.starts_at > cursor:
+            gaps.append((cursor, statement.starts_at))
+        covered.append(statement)
+        cursor = statement.ends_at
+    if cursor < end:
+        gaps.append((cursor, end))
+
+    totals = defaultdict(lambda: ZERO)
+    for statement in covered:
+        for entry_type, total in statement.totals.items():
+            totals[entry_type] += Decimal(total)
+
+    if gaps:
+        ranges = Q()
+        for gap_start, gap_end in gaps:
+            ranges |= Q(posted_at__gte=gap_start, posted_at__lt=gap_end)
+        rows = Posting.objects.filter(ranges, account=account).values('entry__entry_type').annotate(
+            total=Sum('amount')
+        ).order_by()
+        for row in rows:
+            totals[row['entry__entry_type']] += row['total']
+
+    opening = balance_at(account, start)
+    totals = {entry_type: total.quantize(CENT) for entry_type, total in totals.items()}
+    return {
+        'opening_balance': opening,
+        'closing_balance': opening + sum(totals.values(), ZERO),
+        'totals': totals,
+    }
@@ -0,0 +1,111 @@
+# ledger/tests/test_journal.py
+
+from io import StringIO
+from decimal import Decimal
+from datetime import timedelta
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from users.models import User
+from companies.models import Company
+from menu.models import FoodItem
+from schedules.models import Schedule, DailyMenu
+from ledger import journal
+from ledger.models import Account, JournalEntry, Posting
+
+
+class LedgerFlowTests(APITestCase):
+    def setUp(self):
+        self.super_admin = User.objects.create_user(username='ledger_super', password='password123', role=User.Role.SUPER_ADMIN)
+        self.company = Company.objects.create(name="Ledger Co")
+        self.company_admin = User.objects.create_user(
+            username='ledger_admin', password='password123', role=User.Role.COMPANY_ADMIN, company=self.company
+        )
+        self.employee = User.objects.create_user(username='ledger_emp', password='password123', company=self.company)
+
+        self.food = FoodItem.objects.create(name="Kebab", description="", price=Decimal('150.00'))
+        today = timezone.now().date()
+        schedule = Schedule.objects.create(name="S", company=self.company, start_date=today, end_date=today + timedelta(days=10))
+        self.menu = DailyMenu.objects.create(schedule=schedule, date=today + timedelta(days=5))
+        self.menu.available_foods.add(self.food)
+
+    def _balance(self, **owner):
+        return Account.objects.get(**owner).balance
+
+    def test_accounts_are_opened_for_new_companies_and_users(self):
+        """VERIFY: Creating a company or user opens its ledger account."""
+        self.assertEqual(Account.objects.get(company=self.company).kind, Account.Kind.COMPANY_WALLET)
+        self.assertEqual(Account.objects.get(user=self.employee).kind, Account.Kind.EMPLOYEE_BUDGET)
+
+    def test_deposit_allocation_order_and_refund_post_balanced_entries(self):
+        """VERIFY: Each money movement posts a balanced entry and moves the cached balances."""
+        self.client.force_authenticate(user=self.super_admin)
+        self.client.post(reverse('wallet-deposit', kwargs={'company_id': self.company.id}), {'amount': '1000.00'})
+
+        self.client.force_authenticate(user=self.company_admin)
+        self.client.post(reverse('admin-allocate-budget', kwargs={'user_id': self.employee.id}), {'amount': '400.00'})
+
+        self.employee.refresh_from_db()
+        self.client.force_authenticate(user=self.employee)
+        response = self.client.post(reverse('order-list'), {'daily_menu': self.menu.id, 'food_item': self.food.id}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+
+        self.assertEqual(self._balance(company=self.company), Decimal('600.00'))
+        self.assertEqual(self._balance(user=self.employee), Decimal('250.00'))
+        self.assertEqual(
+            list(JournalEntry.objects.order_by('id').values_list('entry_type', flat=True)),
+            ['DEPOSIT', 'ALLOCATION', 'ORDER'],
+        )
+        self.assertEqual(journal.unbalanced_entries(), [])
+
+        response = self.client.delete(reverse('order-detail', kwargs={'pk': response.data['id']}))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self._balance(user=self.employee), Decimal('400.00'))
+        self.employee.refresh_from_db()
+        self.assertEqual(self.employee.budget, self._balance(user=self.employee))
+
+    def test_unbalanced_entry_is_rejected(self):
+        """VERIFY: An entry whose legs do not sum to zero is never written."""
+        entry = journal.Entry('ADJUSTMENT', [(journal.user_key(self.employee.id), Decimal('5.00'))], '', '')
+        with self.assertRaises(ValueError):
+            journal.post_entries([entry])
+        self.assertFalse(Posting.objects.exists())
+
+    def test_entries_are_append_only(self):
+        """VERIFY: Journal entries cannot be edited or deleted."""
+        entry, = journal.record_deposit(self.company.id, Decimal('10.00'))
+        with self.assertRaises(ValueError):
+            entry.save()
+        with self.assertRaises(ValueError):
+            entry.delete()
+
+    def test_batch_posting_uses_a_fixed_number_of_queries(self):
+        """VERIFY: Allocating to many employees costs the same queries as to one."""
+        employees = [
+            User.objects.create_user(username=f'batch_{i}', password='password123', company=self.company)
+            for i in range(20)
+        ]
+        with CaptureQueriesContext(connection) as one:
+            journal.record_allocations(self.company.id, [(employees[0].id, Decimal('1.00'))])
+        with CaptureQueriesContext(connection) as many:
+            journal.record_allocations(self.company.id, [(employee.id, Decimal('1.00')) for employee in employees])
+        self.assertEqual(len(one.captured_queries), len(many.captured_queries))
+        self.assertEqual(self._balance(company=self.company), Decimal('-21.00'))
+
+    def test_verify_ledger_reports_and_fixes_drift(self):
+        """VERIFY: The verify command re-derives cached balances from postings."""
+        journal.record_deposit(self.company.id, Decimal('100.00'))
+        Account.objects.filter(company=self.company).update(balance=Decimal('90.00'))
+
+        out = StringIO()
+        call_command('verify_ledger', stdout=out)
+        self.assertIn('cached 90.00, postings sum to 100.00', out.getvalue())
+
+        call_command('verify_ledger', '--fix', stdout=StringIO())
+        self.assertEqual(self._balance(company=self.company), Decimal('100.00'))
+        self.assertEqual(journal.verify_balances(), [])
@@ -0,0 +1,110 @@
+# ledger/tests/test_statements.py
+
+from io import StringIO
+from decimal import Decimal
+from datetime import datetime
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from users.models import User
+from companies.models import Company
+from orders.models import Order
+from ledger import journal
+from ledger.models import Account, Posting, Statement
+from ledger.statements import activity, balance_at, close_periods
+
+
+def at(month, day, hour=12):
+    return timezone.make_aware(datetime(2025, month, day, hour))
+
+
+class StatementTests(APITestCase):
+    def setUp(self):
+        self.company = Company.objects.create(name="Statement Co")
+        self.admin = User.objects.create_user(
+            username='stmt_admin', password='password123', role=User.Role.COMPANY_ADMIN, company=self.company
+        )
+        self.employee = User.objects.create_user(username='stmt_emp', password='password123', company=self.company)
+        self.other = User.objects.create_user(username='stmt_other', password='password123', company=self.company)
+
+        self._post_at(journal.record_deposit(self.company.id, Decimal('1000.00')), at(1, 10))
+        self._post_at(journal.record_allocations(self.company.id, [(self.employee.id, Decimal('300.00'))]), at(1, 15))
+        self._post_at(journal.record_order_charges([self._order(1, '50.00')]), at(2, 3))
+        self._post_at(journal.record_order_adjustment(self.employee.id, 1, Decimal('20.00')), at(2, 4))
+        self._post_at(journal.record_order_charges([self._order(2, '30.00')]), at(3, 2))
+
+        self.employee_account = Account.objects.get(user=self.employee)
+        self.company_account = Account.objects.get(company=self.company)
+
+    def _order(self, pk, total):
+        return Order(pk=pk, user_id=self.employee.id, total_price=Decimal(total))
+
+    def _post_at(self, entries, moment):
+        Posting.objects.filter(entry__in=entries).update(posted_at=moment)
+
+    def test_monthly_statements_carry_balances_forward(self):
+        """VERIFY: Each closed month opens with the previous closing balance and totals its entry types."""
+        self.assertEqual(close_periods(Statement.Period.MONTH, until=at(3, 1, 0)), 3)
+        self.assertEqual(close_periods(Statement.Period.MONTH, until=at(3, 1, 0)), 0)
+
+        february = Statement.objects.get(account=self.employee_account, starts_at=at(2, 1, 0))
+        self.assertEqual(february.opening_balance, Decimal('300.00'))
+        self.assertEqual(february.closing_balance, Decimal('270.00'))
+        self.assertEqual(february.totals, {'ORDER': '-50.00', 'REFUND': '20.00'})
+        self.assertEqual(february.posting_count, 2)
+
+        # An account without postings in a month gets no statement for it
+        self.assertFalse(Statement.objects.filter(account=self.company_account, starts_at=at(2, 1, 0)).exists())
+        self.assertEqual(balance_at(self.company_account, at(3, 1, 0)), Decimal('700.00'))
+
+        # A later month opens from the closing balance of the account's last active month
+        self._post_at(journal.record_deposit(self.company.id, Decimal('50.00')), at(3, 20))
+        close_periods(Statement.Period.MONTH, until=at(4, 1, 0))
+        company_march = Statement.objects.get(account=self.company_account, starts_at=at(3, 1, 0))
+        self.assertEqual(company_march.opening_balance, Decimal('700.00'))
+        self.assertEqual(company_march.closing_balance, Decimal('750.00'))
+
+    def test_historical_queries_use_the_nearest_statement(self):
+        """VERIFY: Balances and totals match the raw postings and read closed statements instead of them."""
+        close_periods(Statement.Period.MONTH, until=at(3, 1, 0))
+
+        self.assertEqual(balance_at(self.employee_account, at(2, 10)), Decimal('270.00'))
+        self.assertEqual(balance_at(self.employee_account, at(3, 5)), Decimal('240.00'))
+        self.assertEqual(balance_at(self.company_account, at(1, 12)), Decimal('1000.00'))
+
+        result = activity(self.employee_account, at(2, 1, 0), at(3, 6, 0))
+        self.assertEqual(result['opening_balance'], Decimal('300.00'))
+        self.assertEqual(result['totals'], {'ORDER': Decimal('-80.00'), 'REFUND': Decimal('20.00')})
+        self.assertEqual(result['closing_balance'], Decimal('240.00'))
+
+        # Removing February's postings from the gap query proves the statement was used
+        Posting.objects.filter(account=self.employee_account, posted_at__lt=at(3, 1, 0)).update(amount=Decimal('0.00'))
+        self.assertEqual(activity(self.employee_account, at(2, 1, 0), at(3, 1, 0))['totals']['ORDER'], Decimal('-50.00'))
+
+    def test_daily_statements_and_command(self):
+        """VERIFY: The command closes daily statements from the first posting onwards, for active days only."""
+        call_command('close_statements', '--period', 'day', '--until', '2025-01-12', stdout=StringIO())
+        days = Statement.objects.filter(account=self.company_account, period=Statement.Period.DAY).order_by('starts_at')
+        self.assertEqual([s.closing_balance for s in days], [Decimal('1000.00')])
+        self.assertEqual(days[0].totals, {'DEPOSIT': '1000.00'})
+        self.assertEqual(balance_at(self.company_account, at(1, 12, 0)), Decimal('1000.00'))
+
+    def test_activity_endpoint_permissions(self):
+        """VERIFY: Employees see their own budget, company admins their company's accounts."""
+        url = reverse('ledger-account-activity')
+        params = {'user_id': self.employee.id, 'from': '2025-02-01', 'to': '2025-02-28'}
+
+        self.client.force_authenticate(user=self.employee)
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['closing_balance'], Decimal('270.00'))
+
+        self.client.force_authenticate(user=self.other)
+        self.assertEqual(self.client.get(url, params).status_code, status.HTTP_403_FORBIDDEN)
+
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(url, {'company_id': self.company.id, 'from': '2025-01-01', 'to': '2025-01-31'})
+        self.assertEqual(response.data['totals'], {'DEPOSIT': Decimal('1000.00'), 'ALLOCATION': Decimal('-300.00')})
@@ -0,0 +1,7 @@
+# ledger/urls.py
+from django.urls import path
+from .views import AccountActivityView
+
+urlpatterns = [
+    path('activity/', AccountActivityView.as_view(), name='ledger-account-activity'),
+]
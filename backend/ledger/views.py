@@ -0,0 +1,66 @@
+# ledger/views.py
+from datetime import datetime, time, timedelta
+
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+
+from users.models import User
+from .models import Account
+from .statements import activity
+
+
+class AccountActivityView(APIView):
+    """
+    Opening balance, closing balance and per-type totals of a company wallet
+    (?company_id=) or an employee budget (?user_id=) between two dates
+    (?from=&to=, inclusive; default: the current month so far).
+    Super Admins can query any account, Company Admins the accounts of their
+    company, and employees their own budget.
+    """
+
+    def get(self, request, *args, **kwargs):
+        today = timezone.localdate()
+        try:
+            start_date = datetime.fromisoformat(request.query_params.get('from', today.replace(day=1).isoformat())).date()
+            end_date = datetime.fromisoformat(request.query_params.get('to', today.isoformat())).date()
+        except ValueError:
+            return Response({"error": "Invalid date format. Use YYYY-MM-DD."}, status=400)
+        if end_date < start_date:
+            return Response({"error": "'to' must not be before 'from'."}, status=400)
+
+        user_id = request.query_params.get('user_id')
+        company_id = request.query_params.get('company_id')
+        if bool(user_id) == bool(company_id):
+            return Response({"error": "Provide exactly one of user_id or company_id."}, status=400)
+        if not (user_id or company_id).isdigit():
+            return Response({"error": "Invalid id."}, status=400)
+
+        if user_id:
+            account = get_object_or_404(Account.objects.select_related('user'), kind=Account.Kind.EMPLOYEE_BUDGET, user_id=user_id)
+            owner_company_id = account.user.company_id
+        else:
+            account = get_object_or_404(Account, kind=Account.Kind.COMPANY_WALLET, company_id=company_id)
+            owner_company_id = account.company_id
+
+        if not self._can_view(request.user, account, owner_company_id):
+            return Response({"error": "You do not have access to this account."}, status=status.HTTP_403_FORBIDDEN)
+
+        start = timezone.make_aware(datetime.combine(start_date, time.min))
+        end = timezone.make_aware(datetime.combine(end_date + timedelta(days=1), time.min))
+        return Response({
+            'account_id': account.pk,
+            'kind': account.kind,
+            'from': start_date,
+            'to': end_date,
+            **activity(account, start, end),
+        })
+
+    def _can_view(self, user, account, owner_company_id):
+        if user.role == User.Role.SUPER_ADMIN:
+            return True
+        if user.role == User.Role.COMPANY_ADMIN:
+            return owner_company_id is not None and owner_company_id == user.company_id
+        return account.user_id == user.pk
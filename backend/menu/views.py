@@ -4,20 +4,23 @@ from .models import FoodCategory, FoodItem, SideDish
 from .serializers import FoodCategorySerializer, FoodItemSerializer, SideDishSerializer
 # [MODIFIED] Use the new, clearly named permission class.
 from core.permissions import IsSuperAdminOrReadOnly
+from core.mixins import ConditionalGetMixin
 
-class FoodCategoryViewSet(viewsets.ModelViewSet):
+class FoodCategoryViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     queryset = FoodCategory.objects.all()
     serializer_class = FoodCategorySerializer
     # [FIXED] Permissions are now consistent and clear.
     permission_classes = [IsSuperAdminOrReadOnly]
 
-class FoodItemViewSet(viewsets.ModelViewSet):
-    queryset = FoodItem.objects.all()
+class FoodItemViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
+    queryset = FoodItem.objects.select_related('category')
     serializer_class = FoodItemSerializer
+    # The category name is part of each item
+    conditional_timestamps = ('updated_at', 'category__updated_at')
     # [FIXED] Permissions are now consistent and clear.
     permission_classes = [IsSuperAdminOrReadOnly]
 
-class SideDishViewSet(viewsets.ModelViewSet):
+class SideDishViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     queryset = SideDish.objects.all()
     serializer_class = SideDishSerializer
     # [FIXED] Permissions are now consistent and clear.
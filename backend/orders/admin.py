@@ -1,10 +1,12 @@
 # start of orders/admin.py
 from django.contrib import admin
-from .models import Order
+from django.db import transaction
+from .models import Order, DailySalesRollup, OrderSettlement
+from . import rollups
 
 @admin.register(Order)
 class OrderAdmin(admin.ModelAdmin):
-    list_display = ('id', 'user', 'get_company', 'get_date', 'food_item', 'status')
+    list_display = ('id', 'user', 'get_company', 'get_date', 'food_item', 'total_price', 'status')
     list_filter = ('status', 'daily_menu__date', 'daily_menu__schedule__company')
     search_fields = ('user__username', 'food_item__name')
     list_select_related = ('user', 'daily_menu', 'food_item', 'daily_menu__schedule__company')
@@ -16,4 +18,37 @@ class OrderAdmin(admin.ModelAdmin):
     @admin.display(description='Date')
     def get_date(self, obj):
         return obj.daily_menu.date
+
+    # Edits made here bypass OrderViewSet, so the daily sales rollup is kept in step explicitly.
+    def save_model(self, request, obj, form, change):
+        old = Order.objects.select_related('daily_menu__schedule').get(pk=obj.pk) if change else None
+        super().save_model(request, obj, form, change)
+        if old is None:
+            rollups.record_orders([obj])
+        else:
+            rollups.record_order_change(rollups.rollup_key(old), old.total_price, obj)
+
+    def delete_model(self, request, obj):
+        rollups.record_orders([obj], sign=-1)
+        super().delete_model(request, obj)
+
+    @transaction.atomic
+    def delete_queryset(self, request, queryset):
+        rollups.record_orders(queryset.select_related('daily_menu__schedule'), sign=-1)
+        super().delete_queryset(request, queryset)
+
+
+@admin.register(DailySalesRollup)
+class DailySalesRollupAdmin(admin.ModelAdmin):
+    list_display = ('date', 'company', 'food_item', 'order_count', 'revenue')
+    list_filter = ('date', 'company')
+    list_select_related = ('company', 'food_item')
+
+
+@admin.register(OrderSettlement)
+class OrderSettlementAdmin(admin.ModelAdmin):
+    list_display = ('order', 'user', 'amount', 'status', 'attempts', 'created_at', 'settled_at')
+    list_filter = ('status',)
+    search_fields = ('user__username', 'error')
+    list_select_related = ('order', 'user')
 # end of orders/admin.py
@@ -0,0 +1,49 @@
+# orders/management/commands/backfill_order_prices.py
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from orders.models import Order
+from orders import rollups
+
+
+class Command(BaseCommand):
+    """
+    Fills the price snapshot columns of orders that have no stored total from
+    the current food item and side dish prices. Orders with a total keep it:
+    it is the amount that was charged, and refunds and adjustments rely on it.
+    """
+    help = 'Backfills food_price, sides_price and total_price on orders without a stored total.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help='Number of orders updated per query.'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        queryset = Order.objects.filter(total_price=0).select_related(
+            'food_item', 'daily_menu__schedule'
+        ).prefetch_related('side_dishes').order_by('id')
+
+        updated = 0
+        batch = []
+        for order in queryset.iterator(chunk_size=batch_size):
+            old_total = order.total_price
+            for field, value in Order.calculate_prices(order.food_item, order.side_dishes.all()).items():
+                setattr(order, field, value)
+            batch.append((order, old_total))
+            if len(batch) >= batch_size:
+                updated += self._flush(batch)
+                batch = []
+        if batch:
+            updated += self._flush(batch)
+
+        self.stdout.write(self.style.SUCCESS(f"Backfilled prices for {updated} orders."))
+
+    def _flush(self, batch):
+        with transaction.atomic():
+            Order.objects.bulk_update([order for order, _ in batch], ['food_price', 'sides_price', 'total_price'])
+            rollups.record_price_changes(batch)
+        return len(batch)
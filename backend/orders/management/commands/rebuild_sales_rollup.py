@@ -0,0 +1,28 @@
+# orders/management/commands/rebuild_sales_rollup.py
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from orders.rollups import rebuild_sales_rollup
+
+
+class Command(BaseCommand):
+    """
+    Recomputes the DailySalesRollup table from the order table.
+    """
+    help = 'Rebuilds the daily sales rollup from scratch, optionally for a date range only.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--from', dest='start_date', help='First date to rebuild (YYYY-MM-DD).')
+        parser.add_argument('--to', dest='end_date', help='Last date to rebuild (YYYY-MM-DD).')
+
+    def handle(self, *args, **options):
+        dates = {}
+        for option in ('start_date', 'end_date'):
+            value = options[option]
+            dates[option] = parse_date(value) if value else None
+            if value and dates[option] is None:
+                raise CommandError(f"Invalid date '{value}'. Use YYYY-MM-DD.")
+
+        rows = rebuild_sales_rollup(**dates)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt daily sales rollup with {rows} rows."))
@@ -0,0 +1,90 @@
+# orders/management/commands/settle_orders.py
+
+import multiprocessing
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from orders.settlement import settle_pending
+
+
+def run_worker(batch_size, poll_interval, once):
+    """
+    Settle batches until the queue is empty (once=True) or forever.
+    Returns the total (settled, failed) counts.
+    """
+    settled_total = failed_total = 0
+    try:
+        while True:
+            settled, failed = settle_pending(batch_size=batch_size)
+            settled_total += settled
+            failed_total += failed
+            if settled or failed:
+                continue
+            if once:
+                break
+            time.sleep(poll_interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        connections.close_all()
+    return settled_total, failed_total
+
+
+def _process_main(batch_size, poll_interval, once):
+    run_worker(batch_size, poll_interval, once)
+
+
+class Command(BaseCommand):
+    """
+    Worker that charges budgets for orders accepted in queued intake mode
+    (ORDER_INTAKE_MODE = 'queued').
+    """
+    help = 'Settles queued orders: deducts budgets and writes wallet transactions in batches.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--processes', type=int, default=1,
+            help='Number of worker processes to run in parallel.'
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=100,
+            help='Maximum number of queued orders settled per transaction.'
+        )
+        parser.add_argument(
+            '--poll-interval', type=float, default=1.0,
+            help='Seconds to wait before polling an empty queue again.'
+        )
+        parser.add_argument(
+            '--once', action='store_true',
+            help='Exit once the queue is empty instead of polling forever.'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        poll_interval = options['poll_interval']
+        once = options['once']
+        processes = max(1, options['processes'])
+
+        if processes == 1:
+            settled, failed = run_worker(batch_size, poll_interval, once)
+            self.stdout.write(self.style.SUCCESS(f"Settled {settled} orders, {failed} failed."))
+            return
+
+        # Forked children must not share the parent's database connections
+        connections.close_all()
+        workers = [
+            multiprocessing.Process(target=_process_main, args=(batch_size, poll_interval, once))
+            for _ in range(processes)
+        ]
+        for worker in workers:
+            worker.start()
+        self.stdout.write(f"Started {processes} settlement workers.")
+        try:
+            for worker in workers:
+                worker.join()
+        except KeyboardInterrupt:
+            for worker in workers:
+                worker.terminate()
+        self.stdout.write(self.style.SUCCESS("Settlement workers stopped."))
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.18 on 2026-10-17 14:44
+
+from decimal import Decimal
+from django.db import migrations, models
+
+
+def backfill_prices(apps, schema_editor):
+    """
+    Fill the price snapshot of existing orders from the current food item
+    and side dish prices, so refunds and adjustments use a real total.
+    """
+    Order = apps.get_model('orders', 'Order')
+    orders = Order.objects.select_related('food_item').prefetch_related('side_dishes').order_by('id')
+
+    batch = []
+    for order in orders.iterator(chunk_size=1000):
+        order.food_price = order.food_item.price if order.food_item else Decimal('0.00')
+        order.sides_price = sum((side.price for side in order.side_dishes.all()), Decimal('0.00'))
+        order.total_price = order.food_price + order.sides_price
+        batch.append(order)
+        if len(batch) >= 1000:
+            Order.objects.bulk_update(batch, ['food_price', 'sides_price', 'total_price'])
+            batch = []
+    if batch:
+        Order.objects.bulk_update(batch, ['food_price', 'sides_price', 'total_price'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='food_price',
+            field=models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=10),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='sides_price',
+            field=models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=10),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='total_price',
+            field=models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=10),
+        ),
+        migrations.RunPython(backfill_prices, migrations.RunPython.noop),
+    ]
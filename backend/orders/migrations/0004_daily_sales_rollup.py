@@ -0,0 +1,63 @@
+# Generated by Django 5.2.18 on 2026-10-17 14:46
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def build_rollup(apps, schema_editor):
+    """Populate the rollup from the existing non-canceled orders."""
+    Order = apps.get_model('orders', 'Order')
+    DailySalesRollup = apps.get_model('orders', 'DailySalesRollup')
+
+    rows = Order.objects.filter(daily_menu__isnull=False).exclude(status='CANCELED').values(
+        date=models.F('daily_menu__date'),
+        company_id=models.F('daily_menu__schedule__company_id'),
+        item_id=models.F('food_item_id'),
+    ).annotate(
+        order_count=models.Count('id'),
+        revenue=Coalesce(models.Sum('total_price'), Decimal('0.00')),
+    ).order_by()
+
+    DailySalesRollup.objects.bulk_create(
+        [
+            DailySalesRollup(
+                date=row['date'],
+                company_id=row['company_id'],
+                food_item_id=row['item_id'],
+                order_count=row['order_count'],
+                revenue=row['revenue'],
+            )
+            for row in rows
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('companies', '0001_initial'),
+        ('menu', '0001_initial'),
+        ('orders', '0003_order_price_snapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailySalesRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('order_count', models.IntegerField(default=0)),
+                ('revenue', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=14)),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_sales', to='companies.company')),
+                ('food_item', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='daily_sales', to='menu.fooditem')),
+            ],
+            options={
+                'ordering': ['date'],
+                'unique_together': {('date', 'company', 'food_item')},
+            },
+        ),
+        migrations.RunPython(build_rollup, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 5.2.18 on 2026-10-17 14:51
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def check_duplicate_orders(apps, schema_editor):
+    """Stop before adding the unique constraint if a user has several orders for one daily menu."""
+    Order = apps.get_model('orders', 'Order')
+
+    duplicates = list(
+        Order.objects.filter(daily_menu__isnull=False)
+        .values('user_id', 'daily_menu_id')
+        .annotate(count=models.Count('id'))
+        .filter(count__gt=1)
+        .order_by('user_id', 'daily_menu_id')
+    )
+    if not duplicates:
+        return
+
+    lines = []
+    for row in duplicates:
+        order_ids = Order.objects.filter(
+            user_id=row['user_id'], daily_menu_id=row['daily_menu_id']
+        ).order_by('id').values_list('id', flat=True)
+        lines.append(
+            f"  user {row['user_id']}, daily menu {row['daily_menu_id']}: orders {', '.join(map(str, order_ids))}"
+        )
+    raise RuntimeError(
+        "Cannot add the one-order-per-user-per-day constraint; these users have several orders "
+        "for the same daily menu. Cancel and refund the extra orders, then run the migration again:\n"
+        + "\n".join(lines)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu', '0001_initial'),
+        ('orders', '0005_order_settlement_queue'),
+        ('schedules', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['daily_menu', 'status'], name='orders_order_menu_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['user', 'created_at'], name='orders_order_user_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['created_at', 'id'], name='orders_order_created_id_idx'),
+        ),
+        migrations.RunPython(check_duplicate_orders, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='order',
+            constraint=models.UniqueConstraint(fields=('user', 'daily_menu'), name='orders_order_unique_user_daily_menu'),
+        ),
+    ]
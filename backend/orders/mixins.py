@@ -0,0 +1,38 @@
+# orders/mixins.py
+
+from rest_framework.response import Response
+
+from .projections import ORDER_COMPACT_COLUMNS, attach_side_dishes, order_values
+
+COMPACT_PROFILE = 'compact'
+
+
+def wants_compact(request):
+    """
+    True if the client asked for the compact order representation, either with
+    ?view=compact or with an Accept header such as `application/json; profile=compact`.
+    """
+    if request.query_params.get('view') == COMPACT_PROFILE:
+        return True
+    media_type = getattr(request, 'accepted_media_type', '') or ''
+    params = (part.strip() for part in media_type.split(';')[1:])
+    return f'profile={COMPACT_PROFILE}' in params
+
+
+class CompactOrderListMixin:
+    """
+    Serves list requests in the compact representation when asked for.
+    Rows come straight from a values() projection (ids, names and prices)
+    instead of the nested OrderReadSerializer, and the viewset's pagination
+    and filters still apply.
+    """
+
+    def list(self, request, *args, **kwargs):
+        if not wants_compact(request):
+            return super().list(request, *args, **kwargs)
+
+        queryset = order_values(self.filter_queryset(self.get_queryset()), ORDER_COMPACT_COLUMNS)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(attach_side_dishes(list(page)))
+        return Response(attach_side_dishes(list(queryset)))
@@ -1,5 +1,6 @@
 # backend/orders/models.py
 # start of orders/models.py
+from decimal import Decimal
 from django.db import models
 from django.conf import settings
 
@@ -44,7 +45,111 @@ class Order(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # --- Price Snapshot ---
+    # Prices are copied from the menu when the order is placed or changed,
+    # so reports can aggregate revenue in the database.
+    food_price = models.DecimalField(max_digits=10, decimal_places=2, default=Decimal('0.00'))
+    sides_price = models.DecimalField(max_digits=10, decimal_places=2, default=Decimal('0.00'))
+    total_price = models.DecimalField(max_digits=10, decimal_places=2, default=Decimal('0.00'))
+
+    class Meta:
+        constraints = [
+            # One order per user per day; enforced by the database instead of a racy exists() check
+            models.UniqueConstraint(fields=['user', 'daily_menu'], name='orders_order_unique_user_daily_menu'),
+        ]
+        indexes = [
+            # Daily summaries and pending counts filter by menu and status
+            models.Index(fields=['daily_menu', 'status'], name='orders_order_menu_status_idx'),
+            # Employee order history and admin order listings
+            models.Index(fields=['user', 'created_at'], name='orders_order_user_created_idx'),
+            models.Index(fields=['created_at', 'id'], name='orders_order_created_id_idx'),
+        ]
+
+    @staticmethod
+    def calculate_prices(food_item, side_dishes):
+        """
+        Return the price snapshot fields for the given food item and side dishes.
+        """
+        food_price = food_item.price if food_item else Decimal('0.00')
+        sides_price = sum((side.price for side in side_dishes), Decimal('0.00'))
+        return {
+            'food_price': food_price,
+            'sides_price': sides_price,
+            'total_price': food_price + sides_price,
+        }
+
     def __str__(self):
         return f"سفارش #{self.id} برای {self.user.username} در {self.daily_menu.date}"
 
+
+class DailySalesRollup(models.Model):
+    """
+    Pre-aggregated order counts and revenue per day, company and food item,
+    excluding canceled orders. Maintained incrementally wherever an order is
+    written (order endpoints, settlement, admin, price backfill) and rebuilt
+    by the `rebuild_sales_rollup` management command.
+    """
+    date = models.DateField()
+    company = models.ForeignKey(
+        'companies.Company',
+        on_delete=models.CASCADE,
+        related_name='daily_sales'
+    )
+    food_item = models.ForeignKey(
+        'menu.FoodItem',
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name='daily_sales'
+    )
+    order_count = models.IntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=Decimal('0.00'))
+
+    class Meta:
+        unique_together = ('date', 'company', 'food_item')
+        ordering = ['date']
+
+    def __str__(self):
+        return f"{self.date} / {self.company_id} / {self.food_item_id}: {self.order_count} orders"
+
+class OrderSettlement(models.Model):
+    """
+    Durable queue entry for an order accepted in queued intake mode.
+    The budget deduction and wallet transaction are written later by the
+    `settle_orders` worker.
+    """
+    class SettlementStatus(models.TextChoices):
+        PENDING = "PENDING", "Pending"
+        SETTLED = "SETTLED", "Settled"
+        FAILED = "FAILED", "Failed"
+
+    order = models.OneToOneField(
+        Order,
+        on_delete=models.CASCADE,
+        related_name='settlement'
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='order_settlements'
+    )
+    amount = models.DecimalField(max_digits=10, decimal_places=2)
+    status = models.CharField(
+        max_length=20,
+        choices=SettlementStatus.choices,
+        default=SettlementStatus.PENDING
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    error = models.CharField(max_length=255, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    settled_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # The worker claims the oldest pending entries first
+            models.Index(fields=['status', 'id'], name='orders_settlement_queue_idx'),
+        ]
+
+    def __str__(self):
+        return f"Settlement of Order #{self.order_id}: {self.status}"
+
 # end of orders/models.py
\ No newline at end of file
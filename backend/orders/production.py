@@ -0,0 +1,139 @@
+# orders/production.py
+
+from datetime import timedelta
+
+from django.db.models import Count, F, Q
+
+from core.cache import CacheNamespace, invalidate_tags
+from .models import Order
+
+# Maximum number of days a single production plan may cover
+MAX_PLAN_DAYS = 31
+# Plans are dropped after this many seconds even without an order write
+CACHE_TIMEOUT = 60 * 60
+
+# Statuses the kitchen still has to (or already did) prepare food for
+PLAN_STATUSES = [
+    Order.OrderStatus.PLACED,
+    Order.OrderStatus.CONFIRMED,
+    Order.OrderStatus.PREPARING,
+    Order.OrderStatus.DELIVERED,
+]
+
+
+# --- Cache versioning ---
+# Each delivery date is a cache tag; a plan depends on the tags of all its dates.
+
+plans = CacheNamespace('production-plan', timeout=CACHE_TIMEOUT)
+
+
+def _date_tag(day):
+    return f'orders:date:{day.isoformat()}'
+
+
+def _date_range(start_date, end_date):
+    return [start_date + timedelta(days=offset) for offset in range((end_date - start_date).days + 1)]
+
+
+def invalidate_dates(dates):
+    """
+    Expire the cached production plans covering any of the given dates
+    once the surrounding transaction commits.
+    """
+    invalidate_tags(*(_date_tag(day) for day in set(dates) if day is not None))
+
+
+def invalidate_orders(orders):
+    """Expire the cached production plans for the delivery dates of the given orders."""
+    invalidate_dates(order.daily_menu.date for order in orders if order.daily_menu_id)
+
+
+# --- Aggregation ---
+
+def _status_counts(prefix=''):
+    """Conditional Count() annotations, one per plan status, computed in the same pass."""
+    counts = {'count': Count('id')}
+    for status in PLAN_STATUSES:
+        counts[status.lower()] = Count('id', filter=Q(**{f'{prefix}status': status}))
+    return counts
+
+
+def _item_row(row, id_field, name_field):
+    return {
+        'id': row[id_field],
+        'name': row[name_field],
+        'count': row['count'],
+        **{status.lower(): row[status.lower()] for status in PLAN_STATUSES},
+    }
+
+
+def build_production_plan(start_date, end_date, company_id=None):
+    """
+    Count the food items and side dishes to prepare per delivery date and company.
+    Each of the two grouped queries covers the whole date range at once, and the
+    per-status breakdown comes from conditional aggregation in the same pass.
+    """
+    orders = Order.objects.filter(
+        daily_menu__date__range=(start_date, end_date),
+        status__in=PLAN_STATUSES,
+    )
+    if company_id:
+        orders = orders.filter(daily_menu__schedule__company_id=company_id)
+
+    food_rows = orders.values(
+        date=F('daily_menu__date'),
+        company_id=F('daily_menu__schedule__company_id'),
+        company_name=F('daily_menu__schedule__company__name'),
+        item_id=F('food_item_id'),
+        item_name=F('food_item__name'),
+    ).annotate(**_status_counts()).order_by('date', 'company_name', '-count', 'item_name')
+
+    side_rows = Order.side_dishes.through.objects.filter(order__in=orders).values(
+        date=F('order__daily_menu__date'),
+        company_id=F('order__daily_menu__schedule__company_id'),
+        item_id=F('sidedish_id'),
+        item_name=F('sidedish__name'),
+    ).annotate(**_status_counts('order__')).order_by('date', '-count', 'item_name')
+
+    days = {}
+    for row in food_rows:
+        day = days.setdefault(row['date'], {})
+        company = day.setdefault(row['company_id'], {
+            'company_id': row['company_id'],
+            'company_name': row['company_name'],
+            'order_count': 0,
+            'foods': [],
+            'side_dishes': [],
+        })
+        company['order_count'] += row['count']
+        company['foods'].append(_item_row(row, 'item_id', 'item_name'))
+
+    for row in side_rows:
+        company = days.get(row['date'], {}).get(row['company_id'])
+        if company is not None:
+            company['side_dishes'].append(_item_row(row, 'item_id', 'item_name'))
+
+    return {
+        'from': start_date,
+        'to': end_date,
+        'days': [
+            {
+                'date': day,
+                'order_count': sum(company['order_count'] for company in companies.values()),
+                'companies': list(companies.values()),
+            }
+            for day, companies in sorted(days.items())
+        ],
+    }
+
+
+def get_production_plan(start_date, end_date, company_id=None):
+    """
+    Return the production plan for the range, from the cache when no order for
+    any of its dates has been written since it was computed.
+    """
+    return plans.get_or_set(
+        [start_date.isoformat(), end_date.isoformat(), company_id or 'all'],
+        lambda: build_production_plan(start_date, end_date, company_id),
+        tags=[_date_tag(day) for day in _date_range(start_date, end_date)],
+    )
@@ -0,0 +1,84 @@
+# orders/projections.py
+
+from django.db.models import F
+
+from .models import Order
+
+# Flat column name -> ORM path for an order row
+ORDER_EXPORT_COLUMNS = {
+    'id': 'id',
+    'date': 'daily_menu__date',
+    'status': 'status',
+    'company_id': 'daily_menu__schedule__company_id',
+    'company_name': 'daily_menu__schedule__company__name',
+    'user_id': 'user_id',
+    'username': 'user__username',
+    'food_item_id': 'food_item_id',
+    'food_name': 'food_item__name',
+    'food_price': 'food_price',
+    'sides_price': 'sides_price',
+    'total_price': 'total_price',
+    'created_at': 'created_at',
+}
+
+
+def order_values(queryset, columns=ORDER_EXPORT_COLUMNS):
+    """
+    Project an Order queryset onto flat dict rows with the given columns.
+    """
+    plain = [name for name, path in columns.items() if name == path]
+    aliased = {name: F(path) for name, path in columns.items() if name != path}
+    # Prefetches cannot be applied to dict rows, so drop any the queryset carries
+    return queryset.prefetch_related(None).values(*plain, **aliased)
+
+
+# Columns of the compact order representation used by list endpoints
+ORDER_COMPACT_COLUMNS = {
+    'id': 'id',
+    'date': 'daily_menu__date',
+    'status': 'status',
+    'company_name': 'daily_menu__schedule__company__name',
+    'food_item_id': 'food_item_id',
+    'food_name': 'food_item__name',
+    'total_price': 'total_price',
+    'created_at': 'created_at',
+}
+
+
+def side_dishes_by_order(order_ids):
+    """
+    Return {order_id: [{'id': ..., 'name': ...}]} for the given orders in one query.
+    """
+    sides = {}
+    rows = Order.side_dishes.through.objects.filter(order_id__in=order_ids).values_list(
+        'order_id', 'sidedish_id', 'sidedish__name'
+    ).order_by('order_id', 'sidedish__name')
+    for order_id, side_id, name in rows:
+        sides.setdefault(order_id, []).append({'id': side_id, 'name': name})
+    return sides
+
+
+def attach_side_dishes(rows):
+    """
+    Add a 'side_dishes' list to each flat order row, with one query for all rows.
+    """
+    sides = side_dishes_by_order([row['id'] for row in rows])
+    for row in rows:
+        row['side_dishes'] = sides.get(row['id'], [])
+    return rows
+
+
+def iter_order_rows(queryset, chunk_size=2000):
+    """
+    Stream flat order rows, reading the database through a server-side cursor.
+    Side dish names are attached per chunk with a single extra query, so
+    memory use is bounded by the chunk size rather than the result size.
+    """
+    chunk = []
+    for row in order_values(queryset).iterator(chunk_size=chunk_size):
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            yield from attach_side_dishes(chunk)
+            chunk = []
+    if chunk:
+        yield from attach_side_dishes(chunk)
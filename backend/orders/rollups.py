@@ -0,0 +1,178 @@
+# orders/rollups.py
+
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import Coalesce
+
+from .models import Order, DailySalesRollup
+
+
+def rollup_key(order):
+    """
+    Return the (date, company_id, food_item_id) rollup key of an order,
+    or None if the order is canceled or not attached to a daily menu.
+    Canceled orders are not part of the rollup.
+    """
+    if order.daily_menu is None or order.status == Order.OrderStatus.CANCELED:
+        return None
+    return (order.daily_menu.date, order.daily_menu.schedule.company_id, order.food_item_id)
+
+
+def record_orders(orders, sign=1):
+    """
+    Add (sign=1) or remove (sign=-1) the given orders from the daily sales rollup.
+    Orders sharing a key are merged so each rollup row is written once.
+    """
+    deltas = defaultdict(lambda: [0, Decimal('0.00')])
+    for order in orders:
+        key = rollup_key(order)
+        if key is None:
+            continue
+        deltas[key][0] += sign
+        deltas[key][1] += sign * order.total_price
+    apply_deltas(deltas)
+
+
+def record_order_change(old_key, old_total, order):
+    """
+    Move an updated order from its previous rollup key and total to its current ones.
+    """
+    new_key = rollup_key(order)
+    if old_key == new_key and old_total == order.total_price:
+        return
+    deltas = defaultdict(lambda: [0, Decimal('0.00')])
+    if old_key is not None:
+        deltas[old_key][0] -= 1
+        deltas[old_key][1] -= old_total
+    if new_key is not None:
+        deltas[new_key][0] += 1
+        deltas[new_key][1] += order.total_price
+    apply_deltas(deltas)
+
+
+def record_price_changes(changes):
+    """
+    Apply the revenue difference of orders whose price changed in place,
+    given as (order, old_total) pairs.
+    """
+    deltas = defaultdict(lambda: [0, Decimal('0.00')])
+    for order, old_total in changes:
+        key = rollup_key(order)
+        if key is not None:
+            deltas[key][1] += order.total_price - old_total
+    apply_deltas(deltas)
+
+
+def apply_deltas(deltas):
+    """
+    Apply {(date, company_id, food_item_id): (count, revenue)} increments to the
+    rollup table. Existing rows are incremented with a single bulk UPDATE of F()
+    expressions and missing rows are inserted with a single bulk INSERT, so the
+    query count does not depend on how many keys are touched.
+    """
+    deltas = {key: value for key, value in deltas.items() if value[0] or value[1]}
+    if not deltas:
+        return
+
+    existing = {}
+    candidates = DailySalesRollup.objects.filter(
+        date__in={key[0] for key in deltas},
+        company_id__in={key[1] for key in deltas},
+    ).order_by('pk')
+    for row in candidates:
+        key = (row.date, row.company_id, row.food_item_id)
+        if key in deltas:
+            existing.setdefault(key, row)
+
+    to_update = []
+    for key, row in existing.items():
+        count, revenue = deltas[key]
+        row.order_count = F('order_count') + count
+        row.revenue = F('revenue') + revenue
+        to_update.append(row)
+    if to_update:
+        DailySalesRollup.objects.bulk_update(to_update, ['order_count', 'revenue'])
+
+    missing = [key for key in deltas if key not in existing]
+    if not missing:
+        return
+    try:
+        with transaction.atomic():
+            DailySalesRollup.objects.bulk_create([
+                DailySalesRollup(
+                    date=date, company_id=company_id, food_item_id=food_item_id,
+                    order_count=deltas[(date, company_id, food_item_id)][0],
+                    revenue=deltas[(date, company_id, food_item_id)][1],
+                )
+                for date, company_id, food_item_id in missing
+            ])
+    except IntegrityError:
+        # Another request created some of these rows first; fall back to per-key increments.
+        for key in missing:
+            _increment(*key, *deltas[key])
+
+
+def _increment(date, company_id, food_item_id, count, revenue):
+    rows = DailySalesRollup.objects.filter(date=date, company_id=company_id, food_item_id=food_item_id)
+    if food_item_id is None:
+        # NULL keys are not covered by the unique constraint, so target a single row.
+        rows = DailySalesRollup.objects.filter(pk__in=rows.values_list('pk', flat=True)[:1])
+
+    updated = rows.update(order_count=F('order_count') + count, revenue=F('revenue') + revenue)
+    if updated:
+        return
+
+    try:
+        with transaction.atomic():
+            DailySalesRollup.objects.create(
+                date=date, company_id=company_id, food_item_id=food_item_id,
+                order_count=count, revenue=revenue
+            )
+    except IntegrityError:
+        # Another request created the row first; add to it instead.
+        rows.update(order_count=F('order_count') + count, revenue=F('revenue') + revenue)
+
+
+@transaction.atomic
+def rebuild_sales_rollup(start_date=None, end_date=None):
+    """
+    Recompute the rollup from the order table, optionally limited to a date range.
+    Returns the number of rollup rows written.
+    """
+    orders = Order.objects.filter(daily_menu__isnull=False).exclude(status=Order.OrderStatus.CANCELED)
+    rollups = DailySalesRollup.objects.all()
+    if start_date:
+        orders = orders.filter(daily_menu__date__gte=start_date)
+        rollups = rollups.filter(date__gte=start_date)
+    if end_date:
+        orders = orders.filter(daily_menu__date__lte=end_date)
+        rollups = rollups.filter(date__lte=end_date)
+
+    rollups.delete()
+
+    rows = orders.values(
+        date=F('daily_menu__date'),
+        company_id=F('daily_menu__schedule__company_id'),
+        item_id=F('food_item_id'),
+    ).annotate(
+        order_count=Count('id'),
+        revenue=Coalesce(Sum('total_price'), Decimal('0.00')),
+    ).order_by()
+
+    created = DailySalesRollup.objects.bulk_create(
+        [
+            DailySalesRollup(
+                date=row['date'],
+                company_id=row['company_id'],
+                food_item_id=row['item_id'],
+                order_count=row['order_count'],
+                revenue=row['revenue'],
+            )
+            for row in rows
+        ],
+        batch_size=1000,
+    )
+    return len(created)
@@ -3,22 +3,55 @@
 from rest_framework import serializers
 from django.conf import settings
 from django.utils import timezone
+from decimal import Decimal
 from .models import Order
+from .transitions import WORKFLOW_TARGETS
 from schedules.models import DailyMenu
+from schedules.menu_index import menu_availability
+from menu.models import FoodItem, SideDish
 from menu.serializers import FoodItemSerializer, SideDishSerializer
 
 
+class SideDishesField(serializers.ManyRelatedField):
+    """
+    Many-to-many primary key field that resolves all submitted ids with a
+    single query, instead of one query per id like the default field.
+    """
+    def to_internal_value(self, data):
+        if isinstance(data, str) or not hasattr(data, '__iter__'):
+            self.fail('not_a_list', input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail('empty')
+
+        try:
+            ids = list(dict.fromkeys(int(pk) for pk in data))
+        except (TypeError, ValueError):
+            self.child_relation.fail('incorrect_type', data_type=type(data).__name__)
+
+        found = self.child_relation.get_queryset().in_bulk(ids)
+        for pk in ids:
+            if pk not in found:
+                self.child_relation.fail('does_not_exist', pk_value=pk)
+        return [found[pk] for pk in ids]
+
+
 class OrderWriteSerializer(serializers.ModelSerializer):
     """
     Serializer for creating and updating orders.
     Includes:
     - Company ownership validation
     - Menu item availability checks
-    - Duplicate order prevention
     - Budget validation
     - Reservation deadline enforcement
     """
-    daily_menu = serializers.PrimaryKeyRelatedField(queryset=DailyMenu.objects.all())
+    # The schedule is joined in so the company check needs no extra query
+    daily_menu = serializers.PrimaryKeyRelatedField(
+        queryset=DailyMenu.objects.select_related('schedule__company')
+    )
+    side_dishes = SideDishesField(
+        child_relation=serializers.PrimaryKeyRelatedField(queryset=SideDish.objects.all()),
+        required=False,
+    )
 
     class Meta:
         model = Order
@@ -26,35 +59,32 @@ class OrderWriteSerializer(serializers.ModelSerializer):
         read_only_fields = ['id']
 
     def validate(self, data):
-        daily_menu = data.get('daily_menu')
-        food_item = data.get('food_item')
+        daily_menu = data.get('daily_menu', getattr(self.instance, 'daily_menu', None))
+        food_item = data.get('food_item', getattr(self.instance, 'food_item', None))
         side_dishes = data.get('side_dishes', [])
         user = self.context['request'].user
 
         # 1️⃣ Ensure the user belongs to the same company as the menu
-        if user.company != daily_menu.schedule.company:
+        if user.company_id != daily_menu.schedule.company_id:
             raise serializers.ValidationError(
                 "You can only order from your own company's menu."
             )
 
-        # 2️⃣ Ensure the food item is available on that day's menu
-        if food_item not in daily_menu.available_foods.all():
+        # 2️⃣ + 3️⃣ Ensure the food item and all selected side dishes are on that day's menu.
+        # The menu's id sets come from the company's menu index and are compared with set operations.
+        available_foods, available_sides = menu_availability(user.company_id, [daily_menu.id])[daily_menu.id]
+        unavailable = []
+        if food_item and food_item.id not in available_foods:
+            unavailable.append(food_item)
+        unavailable.extend(side for side in side_dishes if side.id not in available_sides)
+        if unavailable:
+            names = ", ".join(f"'{item.name}'" for item in unavailable)
             raise serializers.ValidationError(
-                f"'{food_item.name}' is not an available food item on {daily_menu.date}."
+                f"The following items are not available on {daily_menu.date}: {names}."
             )
 
-        # 3️⃣ Ensure all selected side dishes are available
-        for side in side_dishes:
-            if side not in daily_menu.available_sides.all():
-                raise serializers.ValidationError(
-                    f"'{side.name}' is not an available side dish on {daily_menu.date}."
-                )
-
-        # 4️⃣ Prevent duplicate orders for the same day
-        if not self.instance and Order.objects.filter(daily_menu=daily_menu, user=user).exists():
-            raise serializers.ValidationError(
-                "You have already placed an order for this day."
-            )
+        # 4️⃣ Duplicate orders for the same day are rejected by the
+        # orders_order_unique_user_daily_menu constraint when the order is saved.
 
         # 5️⃣ Enforce reservation deadline (new)
         today = timezone.now().date()
@@ -68,9 +98,8 @@ class OrderWriteSerializer(serializers.ModelSerializer):
             )
 
         # 6️⃣ Check for sufficient budget
-        food_price = food_item.price if food_item else 0
-        sides_price = sum(side.price for side in side_dishes)
-        total_cost = food_price + sides_price
+        prices = Order.calculate_prices(food_item, side_dishes)
+        total_cost = prices['total_price']
 
         if user.budget < total_cost:
             raise serializers.ValidationError(
@@ -78,11 +107,137 @@ class OrderWriteSerializer(serializers.ModelSerializer):
             )
 
         # Store the calculated total cost for use in the view (atomic budget deduction)
+        # and the price snapshot that is saved on the order.
         self.context['total_cost'] = total_cost
+        self.context['prices'] = prices
 
         return data
 
 
+class BulkOrderItemSerializer(serializers.Serializer):
+    """
+    A single day's order inside a bulk order request.
+    Ids are resolved in batch by BulkOrderSerializer rather than per item.
+    """
+    daily_menu = serializers.IntegerField()
+    food_item = serializers.IntegerField()
+    side_dishes = serializers.ListField(child=serializers.IntegerField(), required=False, default=list)
+
+    def validate_side_dishes(self, value):
+        # Same as SideDishesField: a side submitted twice is ordered once.
+        return list(dict.fromkeys(value))
+
+
+class BulkOrderSerializer(serializers.Serializer):
+    """
+    Serializer for placing orders for several daily menus at once.
+    Runs the same checks as OrderWriteSerializer, but against data that is
+    prefetched for all items together, so the query count does not grow
+    with the number of orders.
+    """
+    orders = BulkOrderItemSerializer(many=True, allow_empty=False, max_length=31)
+
+    def validate(self, data):
+        items = data['orders']
+        user = self.context['request'].user
+
+        menu_ids = [item['daily_menu'] for item in items]
+        if len(set(menu_ids)) != len(menu_ids):
+            raise serializers.ValidationError("Each daily menu can only appear once in a bulk order.")
+
+        food_ids = {item['food_item'] for item in items}
+        side_ids = {side_id for item in items for side_id in item['side_dishes']}
+
+        menus = DailyMenu.objects.select_related('schedule__company').in_bulk(menu_ids)
+        availability = menu_availability(user.company_id, menus.keys())
+        foods = FoodItem.objects.in_bulk(food_ids)
+        sides = SideDish.objects.in_bulk(side_ids)
+        already_ordered = set(
+            Order.objects.filter(user=user, daily_menu_id__in=menu_ids).values_list('daily_menu_id', flat=True)
+        )
+
+        today = timezone.now().date()
+        errors = []
+        resolved = []
+        total_cost = Decimal('0.00')
+
+        for item in items:
+            daily_menu = menus.get(item['daily_menu'])
+            food_item = foods.get(item['food_item'])
+            side_dishes = [sides[side_id] for side_id in item['side_dishes'] if side_id in sides]
+
+            if daily_menu is None:
+                errors.append({'daily_menu': [f"Daily menu {item['daily_menu']} does not exist."]})
+                continue
+            if food_item is None:
+                errors.append({'food_item': [f"Food item {item['food_item']} does not exist."]})
+                continue
+
+            available_foods, available_sides = availability[daily_menu.id]
+            item_errors = []
+            if user.company_id != daily_menu.schedule.company_id:
+                item_errors.append("You can only order from your own company's menu.")
+            unavailable = [food_item.name] if food_item.id not in available_foods else []
+            unavailable.extend(
+                sides[side_id].name if side_id in sides else str(side_id)
+                for side_id in item['side_dishes'] if side_id not in available_sides
+            )
+            if unavailable:
+                names = ", ".join(f"'{name}'" for name in unavailable)
+                item_errors.append(f"The following items are not available on {daily_menu.date}: {names}.")
+            if daily_menu.id in already_ordered:
+                item_errors.append("You have already placed an order for this day.")
+            if (daily_menu.date - today).days < settings.RESERVATION_LEAD_DAYS:
+                item_errors.append(
+                    f"Reservation failed. You must place your order at least "
+                    f"{settings.RESERVATION_LEAD_DAYS} full days in advance."
+                )
+
+            if item_errors:
+                errors.append({'non_field_errors': item_errors})
+                continue
+
+            prices = Order.calculate_prices(food_item, side_dishes)
+            total_cost += prices['total_price']
+            errors.append({})
+            resolved.append({
+                'daily_menu': daily_menu,
+                'food_item': food_item,
+                'side_dishes': side_dishes,
+                'prices': prices,
+            })
+
+        if any(errors):
+            raise serializers.ValidationError({'orders': errors})
+
+        if user.budget < total_cost:
+            raise serializers.ValidationError(
+                f"Insufficient funds. Your budget is {user.budget}, but the orders cost {total_cost}."
+            )
+
+        data['resolved_orders'] = resolved
+        data['total_cost'] = total_cost
+        return data
+
+
+class OrderTransitionSerializer(serializers.Serializer):
+    """
+    Target status of a kitchen workflow transition for a single order.
+    """
+    status = serializers.ChoiceField(choices=WORKFLOW_TARGETS)
+
+
+class BulkOrderTransitionSerializer(OrderTransitionSerializer):
+    """
+    Selects the orders of one day to move to a new status at once,
+    optionally narrowed to a company, a food item or a current status.
+    """
+    date = serializers.DateField()
+    company_id = serializers.IntegerField(required=False)
+    food_item_id = serializers.IntegerField(required=False)
+    from_status = serializers.ChoiceField(choices=Order.OrderStatus.choices, required=False)
+
+
 class OrderReadSerializer(serializers.ModelSerializer):
     """
     Serializer for reading order details with nested related objects.
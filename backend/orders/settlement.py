@@ -0,0 +1,127 @@
+# orders/settlement.py
+
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .models import Order, OrderSettlement
+from . import production, rollups
+from users.models import User
+from wallets.models import Transaction
+from ledger import journal
+
+
+def is_queued_intake():
+    """Return True when orders are accepted into the settlement queue."""
+    return settings.ORDER_INTAKE_MODE == 'queued'
+
+
+def available_budget(user):
+    """
+    Return the user's budget minus the amounts of their still-pending orders.
+    """
+    pending = OrderSettlement.objects.filter(
+        user=user, status=OrderSettlement.SettlementStatus.PENDING
+    ).aggregate(total=Coalesce(Sum('amount'), Decimal('0.00')))['total']
+    return user.budget - pending
+
+
+def enqueue(orders):
+    """
+    Queue the given freshly created orders for settlement.
+    """
+    OrderSettlement.objects.bulk_create([
+        OrderSettlement(order=order, user_id=order.user_id, amount=order.total_price)
+        for order in orders
+    ])
+
+
+def lock_unsettled(order):
+    """
+    Lock and return the order's settlement entry if it has not been settled,
+    or None if the order was charged (settled, or placed in synchronous mode).
+    Must be called inside a transaction.
+    """
+    return OrderSettlement.objects.select_for_update().filter(
+        order=order
+    ).exclude(status=OrderSettlement.SettlementStatus.SETTLED).first()
+
+
+def settle_pending(batch_size=100):
+    """
+    Settle up to `batch_size` pending orders in one transaction.
+    Queue entries are claimed with SKIP LOCKED so several workers can run
+    side by side. The affected users are locked once, in id order, and
+    budgets, transactions and queue entries are written in bulk.
+    Returns a (settled, failed) tuple of counts.
+    """
+    with transaction.atomic():
+        batch = list(
+            OrderSettlement.objects.select_for_update(skip_locked=True)
+            .filter(status=OrderSettlement.SettlementStatus.PENDING)
+            .order_by('id')[:batch_size]
+        )
+        if not batch:
+            return 0, 0
+
+        users = {
+            user.pk: user
+            for user in User.objects.select_for_update(of=('self',))
+            .select_related('company__wallet')
+            .filter(pk__in={entry.user_id for entry in batch})
+            .order_by('pk')
+        }
+
+        now = timezone.now()
+        charged_users = {}
+        charged_entries = []
+        transactions = []
+        failed_order_ids = []
+
+        for entry in batch:
+            user = users[entry.user_id]
+            entry.attempts += 1
+            wallet = getattr(user.company, 'wallet', None) if user.company_id else None
+
+            if wallet is None:
+                entry.status = OrderSettlement.SettlementStatus.FAILED
+                entry.error = "User has no company wallet."
+            elif user.budget < entry.amount:
+                entry.status = OrderSettlement.SettlementStatus.FAILED
+                entry.error = f"Insufficient funds. Budget is {user.budget}, order costs {entry.amount}."
+            else:
+                user.budget -= entry.amount
+                charged_users[user.pk] = user
+                entry.status = OrderSettlement.SettlementStatus.SETTLED
+                entry.settled_at = now
+                charged_entries.append(entry)
+                transactions.append(Transaction(
+                    wallet=wallet,
+                    user=user,
+                    transaction_type=Transaction.TransactionType.ORDER_DEDUCTION,
+                    amount=-entry.amount,
+                    description=f"Deduction for Order #{entry.order_id}"
+                ))
+
+            if entry.status == OrderSettlement.SettlementStatus.FAILED:
+                failed_order_ids.append(entry.order_id)
+
+        if charged_users:
+            User.objects.bulk_update(charged_users.values(), ['budget'])
+        Transaction.objects.bulk_create(transactions)
+        journal.record_order_charges(
+            Order(pk=entry.order_id, user_id=entry.user_id, total_price=entry.amount) for entry in charged_entries
+        )
+        OrderSettlement.objects.bulk_update(batch, ['status', 'attempts', 'error', 'settled_at'])
+        if failed_order_ids:
+            failed_orders = Order.objects.filter(pk__in=failed_order_ids)
+            # Unpaid orders leave the sales rollup; read them before their status changes
+            rollups.record_orders(failed_orders.select_related('daily_menu__schedule'), sign=-1)
+            production.invalidate_dates(set(failed_orders.values_list('daily_menu__date', flat=True)))
+            failed_orders.update(status=Order.OrderStatus.CANCELED, updated_at=now)
+
+    return len(transactions), len(failed_order_ids)
@@ -5,6 +5,7 @@ from rest_framework import status
 from rest_framework.test import APITestCase
 from django.utils import timezone
 from datetime import timedelta
+from decimal import Decimal
 
 # Import all necessary models to create test data
 from users.models import User
@@ -12,6 +13,7 @@ from companies.models import Company
 from menu.models import FoodItem
 from schedules.models import Schedule, DailyMenu
 from orders.models import Order
+from orders.rollups import rebuild_sales_rollup
 
 class AdminReportsAPITests(APITestCase):
     def setUp(self):
@@ -25,15 +27,18 @@ class AdminReportsAPITests(APITestCase):
 
         # === Create Users ===
         self.admin_user = User.objects.create_user(
-            username='admin_reports', password='password123', role=User.Role.ADMIN, company=self.company_a
+            username='admin_reports', password='password123', role=User.Role.SUPER_ADMIN, company=self.company_a
         )
         self.employee_a = User.objects.create_user(
             username='employee_reports_a', password='password123', role=User.Role.EMPLOYEE, company=self.company_a
         )
+        self.employee_a2 = User.objects.create_user(
+            username='employee_reports_a2', password='password123', role=User.Role.EMPLOYEE, company=self.company_a
+        )
 
         # === Create Menu Items ===
-        self.food_kebab = FoodItem.objects.create(name="Test Kebab", price=100.00)
-        self.food_pizza = FoodItem.objects.create(name="Test Pizza", price=150.00)
+        self.food_kebab = FoodItem.objects.create(name="Test Kebab", price=Decimal('100.00'))
+        self.food_pizza = FoodItem.objects.create(name="Test Pizza", price=Decimal('150.00'))
 
         # === Create Schedules and Menus ===
         schedule_a = Schedule.objects.create(
@@ -50,10 +55,16 @@ class AdminReportsAPITests(APITestCase):
 
         # === Create Orders ===
         # 2 orders for today
-        Order.objects.create(user=self.employee_a, daily_menu=self.daily_menu_today, food_item=self.food_kebab)
-        Order.objects.create(user=self.employee_a, daily_menu=self.daily_menu_today, food_item=self.food_pizza)
+        Order.objects.create(user=self.employee_a, daily_menu=self.daily_menu_today, food_item=self.food_kebab,
+                             **Order.calculate_prices(self.food_kebab, []))
+        Order.objects.create(user=self.employee_a2, daily_menu=self.daily_menu_today, food_item=self.food_pizza,
+                             **Order.calculate_prices(self.food_pizza, []))
         # 1 order for yesterday
-        Order.objects.create(user=self.employee_a, daily_menu=self.daily_menu_yesterday, food_item=self.food_kebab)
+        Order.objects.create(user=self.employee_a, daily_menu=self.daily_menu_yesterday, food_item=self.food_kebab,
+                             **Order.calculate_prices(self.food_kebab, []))
+
+        # Orders were created directly, so build the sales rollup the reports read from
+        rebuild_sales_rollup()
 
         # URL for the reports endpoint
         self.reports_url = reverse('admin-reports')
@@ -119,8 +130,8 @@ class AdminReportsAPITests(APITestCase):
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        # 'orders_today' should be 0 because we are filtering for yesterday
-        self.assertEqual(response.data['summary']['orders_today'], 0)
+        # Today's summary is not limited by the requested range
+        self.assertEqual(response.data['summary']['orders_today'], 2)
         # The sales by date should only contain one entry for yesterday
         self.assertEqual(len(response.data['sales_by_date']), 1)
         self.assertEqual(response.data['sales_by_date'][0]['date'], self.yesterday.isoformat())
\ No newline at end of file
@@ -6,7 +6,8 @@ from users.models import User
 from companies.models import Company
 from menu.models import FoodItem, SideDish
 from schedules.models import Schedule, DailyMenu
-from .models import Order
+from orders.models import Order
+from decimal import Decimal
 
 class OrderAPITests(APITestCase):
     def setUp(self):
@@ -16,8 +17,8 @@ class OrderAPITests(APITestCase):
         self.company_b = Company.objects.create(name="Company B")
 
         # Create Users
-        self.admin_user = User.objects.create_user(username='admin', password='password123', role=User.Role.ADMIN, company=self.company_a)
-        self.employee_a = User.objects.create_user(username='employee_a', password='password123', role=User.Role.EMPLOYEE, company=self.company_a)
+        self.admin_user = User.objects.create_user(username='admin', password='password123', role=User.Role.SUPER_ADMIN, company=self.company_a)
+        self.employee_a = User.objects.create_user(username='employee_a', password='password123', role=User.Role.EMPLOYEE, company=self.company_a, budget=Decimal('100.00'))
         self.employee_b = User.objects.create_user(username='employee_b', password='password123', role=User.Role.EMPLOYEE, company=self.company_b)
 
         # Create Menu Items
@@ -33,7 +34,7 @@ class OrderAPITests(APITestCase):
             start_date=today,
             end_date=today + timezone.timedelta(days=7)
         )
-        self.daily_menu_a = DailyMenu.objects.create(schedule=self.schedule_a, date=today)
+        self.daily_menu_a = DailyMenu.objects.create(schedule=self.schedule_a, date=today + timezone.timedelta(days=3))
         self.daily_menu_a.available_foods.set([self.food_item_1, self.food_item_2])
         self.daily_menu_a.available_sides.set([self.side_dish_1])
 
@@ -86,10 +87,10 @@ class OrderAPITests(APITestCase):
         url = reverse('order-list')
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data['results']), 1)
 
         # Authenticate as employee_b and check
         self.client.force_authenticate(user=self.employee_b)
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 0) # Should see no orders
\ No newline at end of file
+        self.assertEqual(len(response.data['results']), 0) # Should see no orders
\ No newline at end of file
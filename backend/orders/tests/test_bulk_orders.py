@@ -0,0 +1,99 @@
+# orders/tests/test_bulk_orders.py
+
+from decimal import Decimal
+from datetime import timedelta
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from users.models import User
+from companies.models import Company
+from menu.models import FoodItem, SideDish
+from schedules.models import Schedule, DailyMenu
+from schedules.menu_index import company_index
+from core.tests.caches import SHARED_LOCMEM_CACHES
+from orders.models import Order
+from wallets.models import Transaction
+
+
+class BulkOrderAPITests(APITestCase):
+    def setUp(self):
+        self.company = Company.objects.create(name="Bulk Co")
+        self.employee = User.objects.create_user(
+            username='bulk_employee', password='password123', role=User.Role.EMPLOYEE,
+            company=self.company, budget=Decimal('10000.00')
+        )
+        self.food = FoodItem.objects.create(name="Kebab", description="", price=Decimal('150.00'))
+        self.other_food = FoodItem.objects.create(name="Pasta", description="", price=Decimal('120.00'))
+        self.salad = SideDish.objects.create(name="Salad", price=Decimal('25.00'))
+        self.drink = SideDish.objects.create(name="Doogh", price=Decimal('15.00'))
+
+        start = timezone.now().date() + timedelta(days=3)
+        schedule = Schedule.objects.create(
+            name="Bulk Schedule", company=self.company, start_date=start, end_date=start + timedelta(days=9)
+        )
+        self.menus = []
+        for offset in range(10):
+            menu = DailyMenu.objects.create(schedule=schedule, date=start + timedelta(days=offset))
+            menu.available_foods.set([self.food])
+            menu.available_sides.set([self.salad, self.drink])
+            self.menus.append(menu)
+
+        self.url = reverse('order-bulk')
+        self.client.force_authenticate(user=self.employee)
+
+    def _payload(self, menus):
+        return {'orders': [
+            {'daily_menu': menu.id, 'food_item': self.food.id, 'side_dishes': [self.salad.id, self.drink.id]}
+            for menu in menus
+        ]}
+
+    def test_bulk_order_creates_orders_and_deducts_budget(self):
+        """VERIFY: All orders, side dishes and transactions are written and the budget is charged once."""
+        response = self.client.post(self.url, self._payload(self.menus[:5]), format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data), 5)
+
+        self.assertEqual(Order.objects.filter(user=self.employee).count(), 5)
+        self.assertEqual(Order.side_dishes.through.objects.count(), 10)
+        self.assertEqual(Transaction.objects.filter(user=self.employee).count(), 5)
+        self.employee.refresh_from_db()
+        self.assertEqual(self.employee.budget, Decimal('10000.00') - 5 * Decimal('190.00'))
+
+    @override_settings(CACHES=SHARED_LOCMEM_CACHES)
+    def test_bulk_order_query_count_is_constant(self):
+        """VERIFY: Ordering a week costs the same number of queries as ordering two days."""
+        # Build the company's menu index first, so both requests read it warm
+        company_index(self.company.id)
+        with CaptureQueriesContext(connection) as small:
+            self.client.post(self.url, self._payload(self.menus[:2]), format='json')
+        with CaptureQueriesContext(connection) as large:
+            self.client.post(self.url, self._payload(self.menus[2:9]), format='json')
+        self.assertEqual(len(small.captured_queries), len(large.captured_queries))
+
+    def test_bulk_order_rejects_whole_batch_on_invalid_item(self):
+        """VERIFY: One unavailable food item fails the request and nothing is written."""
+        payload = self._payload(self.menus[:3])
+        payload['orders'][1]['food_item'] = self.other_food.id
+        response = self.client.post(self.url, payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('not available', str(response.data['orders'][1]))
+        self.assertEqual(Order.objects.count(), 0)
+
+    def test_bulk_order_counts_repeated_side_once(self):
+        """VERIFY: A side dish listed twice in one item is ordered and charged once."""
+        payload = self._payload(self.menus[:1])
+        payload['orders'][0]['side_dishes'] = [self.salad.id, self.salad.id]
+        response = self.client.post(self.url, payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        order = Order.objects.get(user=self.employee)
+        self.assertEqual(order.total_price, Decimal('175.00'))
+        self.assertEqual(list(order.side_dishes.all()), [self.salad])
+        self.employee.refresh_from_db()
+        self.assertEqual(self.employee.budget, Decimal('10000.00') - Decimal('175.00'))
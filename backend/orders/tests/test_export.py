@@ -0,0 +1,75 @@
+# orders/tests/test_export.py
+
+import csv
+import io
+import json
+from decimal import Decimal
+from datetime import date
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from users.models import User
+from companies.models import Company
+from menu.models import FoodItem, SideDish
+from schedules.models import Schedule, DailyMenu
+from orders.models import Order
+
+
+class AdminOrderExportTests(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(username='export_admin', password='password123', role=User.Role.SUPER_ADMIN)
+        food = FoodItem.objects.create(name="Kebab", description="", price=Decimal('150.00'))
+        salad = SideDish.objects.create(name="Salad", price=Decimal('25.00'))
+
+        self.companies = []
+        for name in ("Export A", "Export B"):
+            company = Company.objects.create(name=name)
+            employee = User.objects.create_user(username=f'export_{name}', password='password123', company=company)
+            schedule = Schedule.objects.create(name=name, company=company, start_date=date(2025, 3, 1), end_date=date(2025, 3, 31))
+            for day in (1, 2, 3):
+                menu = DailyMenu.objects.create(schedule=schedule, date=date(2025, 3, day))
+                order = Order.objects.create(user=employee, daily_menu=menu, food_item=food,
+                                             **Order.calculate_prices(food, [salad]))
+                order.side_dishes.add(salad)
+            self.companies.append(company)
+
+        self.url = reverse('admin-order-export')
+        self.client.force_authenticate(user=self.admin)
+
+    def _content(self, response):
+        return b''.join(response.streaming_content).decode('utf-8')
+
+    def test_csv_export_applies_order_filter(self):
+        """VERIFY: The CSV stream contains a header and only the filtered company's orders."""
+        response = self.client.get(self.url, {'company_id': self.companies[0].id, 'end_date': '2025-03-02'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+
+        rows = list(csv.DictReader(io.StringIO(self._content(response))))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual({row['company_name'] for row in rows}, {"Export A"})
+        self.assertEqual(rows[0]['side_dishes'], "Salad")
+        self.assertEqual(rows[0]['total_price'], "175.00")
+
+    def test_jsonl_export(self):
+        """VERIFY: JSON Lines export yields one object per order."""
+        response = self.client.get(self.url, {'export_format': 'jsonl'})
+        lines = self._content(response).splitlines()
+        self.assertEqual(len(lines), 6)
+        self.assertEqual([side['name'] for side in json.loads(lines[0])['side_dishes']], ["Salad"])
+
+    def test_compact_order_list(self):
+        """VERIFY: ?view=compact and the Accept profile return flat rows with ids, names and prices."""
+        list_url = reverse('admin-order-list')
+        for kwargs in ({'data': {'view': 'compact'}}, {'HTTP_ACCEPT': 'application/json; profile=compact'}):
+            response = self.client.get(list_url, **kwargs)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            row = response.data['results'][0]
+            self.assertEqual(row['food_name'], "Kebab")
+            self.assertEqual(row['total_price'], Decimal('175.00'))
+            self.assertEqual([side['name'] for side in row['side_dishes']], ["Salad"])
+            self.assertNotIn('description', str(row))
+
+        response = self.client.get(list_url)
+        self.assertIn('description', response.data['results'][0]['food_item'])
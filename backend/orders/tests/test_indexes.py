@@ -0,0 +1,97 @@
+# orders/tests/test_indexes.py
+
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest import skipUnless
+from django.db import IntegrityError, connection, transaction
+from django.test import TestCase
+from rest_framework.exceptions import ValidationError
+
+from users.models import User
+from companies.models import Company
+from menu.models import FoodItem
+from schedules.models import Schedule, DailyMenu
+from orders.models import Order
+from orders.views import _raise_if_duplicate_order
+from wallets.models import Transaction
+
+
+@skipUnless(connection.vendor in ('sqlite', 'postgresql'), "Query plan assertions are written for SQLite and PostgreSQL.")
+class QueryPlanIndexTests(TestCase):
+    """
+    Generates a dataset and checks that the hot order and transaction
+    queries are planned on the dedicated indexes.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        start = date(2025, 1, 1)
+        food = FoodItem.objects.create(name="Kebab", description="", price=Decimal('100.00'))
+        companies = [Company.objects.create(name=f"Index Co {i}") for i in range(3)]
+
+        users, menus = [], []
+        for company in companies:
+            users.extend(User.objects.bulk_create([
+                User(username=f"index_{company.id}_{i}", company=company) for i in range(20)
+            ]))
+            schedule = Schedule.objects.create(
+                name="Index Schedule", company=company, start_date=start, end_date=start + timedelta(days=59)
+            )
+            menus.extend(DailyMenu.objects.bulk_create([
+                DailyMenu(schedule=schedule, date=start + timedelta(days=offset)) for offset in range(60)
+            ]))
+
+        Order.objects.bulk_create([
+            Order(user=user, daily_menu=menu, food_item=food, total_price=Decimal('100.00'))
+            for user in users for menu in menus if menu.schedule.company_id == user.company_id
+        ])
+        Transaction.objects.bulk_create([
+            Transaction(wallet=user.company.wallet, user=user, transaction_type=Transaction.TransactionType.REFUND, amount=1)
+            for user in users for _ in range(5)
+        ])
+
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+
+        cls.user = users[0]
+        cls.menu = menus[0]
+        cls.day = start + timedelta(days=10)
+
+    def assertUsesIndex(self, queryset, *index_names):
+        """Assert the query plan mentions at least one of the given index names."""
+        plan = queryset.explain()
+        self.assertTrue(any(name in plan for name in index_names), plan)
+
+    def test_duplicate_order_lookup_uses_unique_constraint(self):
+        self.assertUsesIndex(
+            Order.objects.filter(user=self.user, daily_menu=self.menu),
+            'orders_order_unique_user_daily_menu',
+            # SQLite backs inline unique constraints with an automatic index
+            'sqlite_autoindex_orders_order',
+        )
+
+    def test_daily_summary_uses_menu_date_and_status_indexes(self):
+        queryset = Order.objects.filter(daily_menu__date=self.day, status__in=['PLACED', 'CONFIRMED'])
+        self.assertUsesIndex(queryset, 'schedules_dailymenu_date_idx')
+        self.assertUsesIndex(queryset, 'orders_order_menu_status_idx')
+
+    def test_wallet_history_uses_timestamp_index(self):
+        self.assertUsesIndex(
+            Transaction.objects.filter(wallet=self.user.company.wallet).order_by('-timestamp')[:20],
+            'wallets_txn_wallet_ts_idx',
+        )
+
+    def test_second_order_for_same_day_is_rejected(self):
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Order.objects.create(user=self.user, daily_menu=self.menu)
+
+    def test_only_the_unique_constraint_is_reported_as_duplicate(self):
+        """VERIFY: The duplicate-order message is used for the unique constraint only."""
+        with self.assertRaises(IntegrityError) as duplicate, transaction.atomic():
+            Order.objects.create(user=self.user, daily_menu=self.menu)
+        with self.assertRaises(ValidationError):
+            _raise_if_duplicate_order(duplicate.exception)
+
+        with self.assertRaises(IntegrityError) as missing_user, transaction.atomic():
+            Order.objects.create(user_id=None, daily_menu=self.menu)
+        self.assertIsNone(_raise_if_duplicate_order(missing_user.exception))
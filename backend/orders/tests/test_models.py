@@ -0,0 +1,43 @@
+# orders/tests/test_models.py
+
+import importlib
+from decimal import Decimal
+from django.apps import apps
+from django.test import TestCase
+
+from users.models import User
+from menu.models import FoodItem, SideDish
+from orders.models import Order
+
+
+class OrderPriceSnapshotTests(TestCase):
+    def setUp(self):
+        self.food = FoodItem.objects.create(name="Kebab", description="", price=Decimal('150.00'))
+        self.salad = SideDish.objects.create(name="Salad", price=Decimal('25.00'))
+        self.drink = SideDish.objects.create(name="Doogh", price=Decimal('15.00'))
+
+    def test_calculate_prices_sums_food_and_sides(self):
+        """VERIFY: The snapshot splits the food and side prices and stores their total."""
+        prices = Order.calculate_prices(self.food, [self.salad, self.drink])
+        self.assertEqual(prices['food_price'], Decimal('150.00'))
+        self.assertEqual(prices['sides_price'], Decimal('40.00'))
+        self.assertEqual(prices['total_price'], Decimal('190.00'))
+
+    def test_calculate_prices_without_food_item(self):
+        """VERIFY: A missing food item contributes nothing to the total."""
+        prices = Order.calculate_prices(None, [])
+        self.assertEqual(prices['total_price'], Decimal('0.00'))
+
+    def test_migration_backfills_existing_orders(self):
+        """VERIFY: Orders created before the snapshot columns get their prices filled in."""
+        user = User.objects.create_user(username='snapshot_user', password='password123')
+        order = Order.objects.create(user=user, food_item=self.food)
+        order.side_dishes.set([self.salad, self.drink])
+
+        migration = importlib.import_module('orders.migrations.0003_order_price_snapshot')
+        migration.backfill_prices(apps, None)
+
+        order.refresh_from_db()
+        self.assertEqual(order.food_price, Decimal('150.00'))
+        self.assertEqual(order.sides_price, Decimal('40.00'))
+        self.assertEqual(order.total_price, Decimal('190.00'))
@@ -0,0 +1,69 @@
+# orders/tests/test_order_validation.py
+
+from decimal import Decimal
+from datetime import timedelta
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from users.models import User
+from companies.models import Company
+from menu.models import FoodItem, SideDish
+from schedules.models import Schedule, DailyMenu
+from schedules.menu_index import company_index
+from core.tests.caches import SHARED_LOCMEM_CACHES
+
+
+class OrderValidationTests(APITestCase):
+    def setUp(self):
+        self.company = Company.objects.create(name="Validation Co")
+        self.employee = User.objects.create_user(
+            username='validation_employee', password='password123', role=User.Role.EMPLOYEE,
+            company=self.company, budget=Decimal('1000.00')
+        )
+        self.food = FoodItem.objects.create(name="Kebab", description="", price=Decimal('150.00'))
+        self.sides = [SideDish.objects.create(name=f"Side {i}", price=Decimal('10.00')) for i in range(5)]
+        self.missing_side = SideDish.objects.create(name="Off Menu", price=Decimal('10.00'))
+
+        menu_date = timezone.now().date() + timedelta(days=5)
+        schedule = Schedule.objects.create(
+            name="Validation Schedule", company=self.company, start_date=menu_date, end_date=menu_date + timedelta(days=1)
+        )
+        self.menus = []
+        for offset in range(2):
+            menu = DailyMenu.objects.create(schedule=schedule, date=menu_date + timedelta(days=offset))
+            menu.available_foods.set([self.food])
+            menu.available_sides.set(self.sides)
+            self.menus.append(menu)
+
+        self.client.force_authenticate(user=self.employee)
+
+    def _post(self, menu, sides):
+        return self.client.post(reverse('order-list'), {
+            'daily_menu': menu.id,
+            'food_item': self.food.id,
+            'side_dishes': [side.id for side in sides],
+        }, format='json')
+
+    @override_settings(CACHES=SHARED_LOCMEM_CACHES)
+    def test_query_count_does_not_depend_on_side_count(self):
+        """VERIFY: Ordering five side dishes costs the same queries as ordering one."""
+        # Build the company's menu index first, so both requests read it warm
+        company_index(self.company.id)
+        with CaptureQueriesContext(connection) as one_side:
+            self.assertEqual(self._post(self.menus[0], self.sides[:1]).status_code, status.HTTP_201_CREATED)
+        with CaptureQueriesContext(connection) as five_sides:
+            self.assertEqual(self._post(self.menus[1], self.sides).status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(one_side.captured_queries), len(five_sides.captured_queries))
+
+    def test_all_unavailable_items_reported_together(self):
+        """VERIFY: Every unavailable side dish is listed in a single error."""
+        other_side = SideDish.objects.create(name="Also Off Menu", price=Decimal('10.00'))
+        response = self._post(self.menus[0], [self.sides[0], self.missing_side, other_side])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("'Off Menu'", str(response.data))
+        self.assertIn("'Also Off Menu'", str(response.data))
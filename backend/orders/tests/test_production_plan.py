@@ -0,0 +1,98 @@
+# orders/tests/test_production_plan.py
+
+from decimal import Decimal
+from datetime import date
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from users.models import User
+from companies.models import Company
+from menu.models import FoodItem, SideDish
+from schedules.models import Schedule, DailyMenu
+from orders.models import Order
+from core.tests.caches import SHARED_LOCMEM_CACHES
+
+
+@override_settings(CACHES=SHARED_LOCMEM_CACHES)
+class ProductionPlanTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_user(username='plan_admin', password='password123', role=User.Role.SUPER_ADMIN)
+        self.kebab = FoodItem.objects.create(name="Kebab", description="", price=Decimal('150.00'))
+        self.pasta = FoodItem.objects.create(name="Pasta", description="", price=Decimal('90.00'))
+        self.salad = SideDish.objects.create(name="Salad", price=Decimal('25.00'))
+
+        self.companies = []
+        for name in ("Plan A", "Plan B"):
+            company = Company.objects.create(name=name)
+            schedule = Schedule.objects.create(name=name, company=company, start_date=date(2025, 5, 1), end_date=date(2025, 5, 7))
+            menus = [DailyMenu.objects.create(schedule=schedule, date=date(2025, 5, day)) for day in (1, 2)]
+            for i, food in enumerate((self.kebab, self.kebab, self.pasta)):
+                employee = User.objects.create_user(username=f'{name}_{i}', password='password123', company=company)
+                for menu in menus:
+                    order = Order.objects.create(user=employee, daily_menu=menu, food_item=food,
+                                                 **Order.calculate_prices(food, [self.salad]))
+                    if food == self.kebab:
+                        order.side_dishes.add(self.salad)
+            self.companies.append(company)
+
+        # A canceled order is not part of the plan
+        Order.objects.filter(user__username='Plan A_2', daily_menu__date=date(2025, 5, 1)).update(
+            status=Order.OrderStatus.CANCELED
+        )
+
+        self.url = reverse('production-plan')
+        self.client.force_authenticate(user=self.admin)
+
+    def _plan(self, **params):
+        response = self.client.get(self.url, {'from': '2025-05-01', 'to': '2025-05-07', **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_plan_groups_by_date_and_company(self):
+        """VERIFY: Foods and side dishes are counted per date and company, without canceled orders."""
+        plan = self._plan()
+        self.assertEqual([day['date'] for day in plan['days']], [date(2025, 5, 1), date(2025, 5, 2)])
+
+        first_day = plan['days'][0]
+        self.assertEqual(first_day['order_count'], 5)
+        company_a = first_day['companies'][0]
+        self.assertEqual(company_a['company_name'], "Plan A")
+        self.assertEqual([(food['name'], food['count']) for food in company_a['foods']], [("Kebab", 2)])
+        self.assertEqual(company_a['foods'][0]['placed'], 2)
+        self.assertEqual([(side['name'], side['count']) for side in company_a['side_dishes']], [("Salad", 2)])
+
+        plan = self._plan(company_id=self.companies[1].id)
+        self.assertEqual({c['company_name'] for day in plan['days'] for c in day['companies']}, {"Plan B"})
+
+    def test_plan_is_cached_until_an_order_write(self):
+        """VERIFY: A repeated request is served from the cache, and a transition for one of its dates expires it."""
+        self._plan()
+        with self.assertNumQueries(0):
+            cached = self.client.get(self.url, {'from': '2025-05-01', 'to': '2025-05-07'})
+        self.assertEqual(cached.data['days'][0]['companies'][0]['foods'][0]['confirmed'], 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse('admin-order-bulk-transition'),
+                             {'date': '2025-05-01', 'status': 'CONFIRMED'}, format='json')
+
+        plan = self._plan()
+        self.assertEqual(plan['days'][0]['companies'][0]['foods'][0]['confirmed'], 2)
+
+    def test_plan_is_not_cached_by_a_per_process_cache(self):
+        """VERIFY: With a per-process cache, a write whose invalidation never reached this worker is still seen."""
+        with override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}):
+            self._plan()
+            # Committed by another worker: its tag bump only reached that worker's cache
+            Order.objects.filter(daily_menu__date=date(2025, 5, 1)).update(status=Order.OrderStatus.CONFIRMED)
+
+            plan = self._plan()
+        self.assertEqual(plan['days'][0]['companies'][0]['foods'][0]['confirmed'], 2)
+
+    def test_invalid_ranges_are_rejected(self):
+        """VERIFY: Reversed or overly long ranges return 400."""
+        self.assertEqual(self.client.get(self.url, {'from': '2025-05-07', 'to': '2025-05-01'}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {'from': '2025-05-01', 'to': '2025-07-01'}).status_code, 400)
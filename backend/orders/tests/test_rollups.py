@@ -0,0 +1,144 @@
+# orders/tests/test_rollups.py
+
+import importlib
+from decimal import Decimal
+from io import StringIO
+from datetime import timedelta
+from django.apps import apps
+from django.contrib.admin.sites import AdminSite
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from users.models import User
+from companies.models import Company
+from menu.models import FoodItem, SideDish
+from schedules.models import Schedule, DailyMenu
+from orders.admin import OrderAdmin
+from orders.models import Order, DailySalesRollup
+from orders.rollups import rebuild_sales_rollup
+
+
+class DailySalesRollupTests(APITestCase):
+    def setUp(self):
+        self.company = Company.objects.create(name="Rollup Co")
+        self.employee = User.objects.create_user(
+            username='rollup_employee', password='password123', role=User.Role.EMPLOYEE,
+            company=self.company, budget=Decimal('1000.00')
+        )
+        self.food = FoodItem.objects.create(name="Kebab", description="", price=Decimal('150.00'))
+        self.side = SideDish.objects.create(name="Salad", price=Decimal('25.00'))
+
+        menu_date = timezone.now().date() + timedelta(days=5)
+        schedule = Schedule.objects.create(
+            name="Rollup Schedule", company=self.company, start_date=menu_date, end_date=menu_date
+        )
+        self.daily_menu = DailyMenu.objects.create(schedule=schedule, date=menu_date)
+        self.daily_menu.available_foods.set([self.food])
+        self.daily_menu.available_sides.set([self.side])
+
+        self.client.force_authenticate(user=self.employee)
+
+    def _place_order(self):
+        response = self.client.post(reverse('order-list'), {
+            'daily_menu': self.daily_menu.id,
+            'food_item': self.food.id,
+            'side_dishes': [self.side.id],
+        })
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.data['id']
+
+    def test_order_create_and_delete_maintain_rollup(self):
+        """VERIFY: Placing and canceling an order adds and removes it from the rollup."""
+        order_id = self._place_order()
+
+        rollup = DailySalesRollup.objects.get(date=self.daily_menu.date, company=self.company, food_item=self.food)
+        self.assertEqual(rollup.order_count, 1)
+        self.assertEqual(rollup.revenue, Decimal('175.00'))
+
+        response = self.client.delete(reverse('order-detail', args=[order_id]))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        rollup.refresh_from_db()
+        self.assertEqual(rollup.order_count, 0)
+        self.assertEqual(rollup.revenue, Decimal('0.00'))
+
+    def test_rebuild_matches_incremental_rollup(self):
+        """VERIFY: Rebuilding from scratch yields the same figures as incremental updates."""
+        self._place_order()
+        before = list(DailySalesRollup.objects.values('date', 'company', 'food_item', 'order_count', 'revenue'))
+
+        rebuild_sales_rollup()
+
+        after = list(DailySalesRollup.objects.values('date', 'company', 'food_item', 'order_count', 'revenue'))
+        self.assertEqual(before, after)
+        self.assertEqual(Order.objects.count(), 1)
+
+    def _rollup_rows(self):
+        return list(DailySalesRollup.objects.filter(order_count__gt=0).values(
+            'date', 'company', 'food_item', 'order_count', 'revenue'
+        ))
+
+    def test_rebuild_excludes_canceled_orders(self):
+        """VERIFY: Canceled orders are not counted by the rebuild, matching the incremental rollup."""
+        order_id = self._place_order()
+        Order.objects.filter(pk=order_id).update(status=Order.OrderStatus.CANCELED)
+
+        rebuild_sales_rollup()
+
+        self.assertEqual(self._rollup_rows(), [])
+
+    def test_admin_edits_and_kitchen_transitions_keep_rollup_in_step(self):
+        """VERIFY: Admin status and price edits and workflow transitions leave the rollup equal to a rebuild."""
+        order = Order.objects.get(pk=self._place_order())
+        model_admin = OrderAdmin(Order, AdminSite())
+
+        order.total_price = Decimal('200.00')
+        model_admin.save_model(None, order, None, change=True)
+        self.assertEqual(self._rollup_rows()[0]['revenue'], Decimal('200.00'))
+
+        admin_user = User.objects.create_user(
+            username='rollup_admin', password='password123', role=User.Role.SUPER_ADMIN
+        )
+        self.client.force_authenticate(user=admin_user)
+        response = self.client.post(reverse('admin-order-transition', args=[order.id]), {'status': 'CONFIRMED'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        incremental = self._rollup_rows()
+        rebuild_sales_rollup()
+        self.assertEqual(self._rollup_rows(), incremental)
+
+        order.refresh_from_db()
+        order.status = Order.OrderStatus.CANCELED
+        model_admin.save_model(None, order, None, change=True)
+        self.assertEqual(self._rollup_rows(), [])
+
+    def test_price_backfill_updates_rollup(self):
+        """VERIFY: Backfilling orders without a stored total moves the rollup revenue, and charged totals are kept."""
+        order_id = self._place_order()
+        Order.objects.filter(pk=order_id).update(food_price=0, sides_price=0, total_price=0)
+        rebuild_sales_rollup()
+        self.food.price = Decimal('170.00')
+        self.food.save()
+
+        call_command('backfill_order_prices', stdout=StringIO())
+        self.assertEqual(self._rollup_rows()[0]['revenue'], Decimal('195.00'))
+
+        self.food.price = Decimal('200.00')
+        self.food.save()
+        call_command('backfill_order_prices', stdout=StringIO())
+        self.assertEqual(Order.objects.get(pk=order_id).total_price, Decimal('195.00'))
+        self.assertEqual(self._rollup_rows()[0]['revenue'], Decimal('195.00'))
+
+    def test_migration_populates_rollup(self):
+        """VERIFY: The rollup migration fills the table from the orders that already exist."""
+        self._place_order()
+        expected = self._rollup_rows()
+        DailySalesRollup.objects.all().delete()
+
+        migration = importlib.import_module('orders.migrations.0004_daily_sales_rollup')
+        migration.build_rollup(apps, None)
+
+        self.assertEqual(self._rollup_rows(), expected)
@@ -0,0 +1,91 @@
+# orders/tests/test_settlement.py
+
+from decimal import Decimal
+from datetime import timedelta
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from users.models import User
+from companies.models import Company
+from menu.models import FoodItem
+from schedules.models import Schedule, DailyMenu
+from orders.models import Order, OrderSettlement, DailySalesRollup
+from orders.settlement import settle_pending
+from wallets.models import Transaction
+
+
+@override_settings(ORDER_INTAKE_MODE='queued')
+class QueuedIntakeTests(APITestCase):
+    def setUp(self):
+        self.company = Company.objects.create(name="Queue Co")
+        self.employee = User.objects.create_user(
+            username='queue_employee', password='password123', role=User.Role.EMPLOYEE,
+            company=self.company, budget=Decimal('200.00')
+        )
+        self.food = FoodItem.objects.create(name="Kebab", description="", price=Decimal('150.00'))
+
+        start = timezone.now().date() + timedelta(days=5)
+        schedule = Schedule.objects.create(
+            name="Queue Schedule", company=self.company, start_date=start, end_date=start + timedelta(days=1)
+        )
+        self.menus = []
+        for offset in range(2):
+            menu = DailyMenu.objects.create(schedule=schedule, date=start + timedelta(days=offset))
+            menu.available_foods.set([self.food])
+            self.menus.append(menu)
+
+        self.client.force_authenticate(user=self.employee)
+
+    def _place_order(self, menu):
+        return self.client.post(reverse('order-list'), {
+            'daily_menu': menu.id, 'food_item': self.food.id,
+        }, format='json')
+
+    def test_order_is_queued_then_settled(self):
+        """VERIFY: The API accepts the order without charging, and the worker charges it."""
+        self.assertEqual(self._place_order(self.menus[0]).status_code, status.HTTP_201_CREATED)
+
+        self.employee.refresh_from_db()
+        self.assertEqual(self.employee.budget, Decimal('200.00'))
+        self.assertFalse(Transaction.objects.exists())
+
+        self.assertEqual(settle_pending(), (1, 0))
+
+        self.employee.refresh_from_db()
+        self.assertEqual(self.employee.budget, Decimal('50.00'))
+        self.assertEqual(Transaction.objects.get().amount, Decimal('-150.00'))
+        self.assertEqual(OrderSettlement.objects.get().status, OrderSettlement.SettlementStatus.SETTLED)
+
+    def test_pending_orders_count_against_available_budget(self):
+        """VERIFY: A second order that the budget cannot cover with the first still pending is rejected."""
+        self.assertEqual(self._place_order(self.menus[0]).status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self._place_order(self.menus[1]).status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_failed_settlement_cancels_order(self):
+        """VERIFY: An order whose budget is gone by settlement time is canceled, not charged."""
+        self.assertEqual(self._place_order(self.menus[0]).status_code, status.HTTP_201_CREATED)
+        User.objects.filter(pk=self.employee.pk).update(budget=Decimal('10.00'))
+
+        self.assertEqual(settle_pending(), (0, 1))
+        self.assertEqual(Order.objects.get().status, Order.OrderStatus.CANCELED)
+        self.assertFalse(Transaction.objects.exists())
+
+        # The unpaid order no longer counts as revenue, and deleting it later does not subtract it twice
+        rollup = DailySalesRollup.objects.get()
+        self.assertEqual((rollup.order_count, rollup.revenue), (0, Decimal('0.00')))
+        self.client.delete(reverse('order-detail', args=[Order.objects.get().pk]))
+        rollup.refresh_from_db()
+        self.assertEqual((rollup.order_count, rollup.revenue), (0, Decimal('0.00')))
+
+    def test_deleting_pending_order_does_not_refund(self):
+        """VERIFY: Canceling an order that was never charged leaves the budget untouched."""
+        order_id = self._place_order(self.menus[0]).data['id']
+        response = self.client.delete(reverse('order-detail', args=[order_id]))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        self.employee.refresh_from_db()
+        self.assertEqual(self.employee.budget, Decimal('200.00'))
+        self.assertFalse(OrderSettlement.objects.exists())
@@ -0,0 +1,90 @@
+# orders/tests/test_transitions.py
+
+from decimal import Decimal
+from datetime import date
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from users.models import User
+from companies.models import Company
+from menu.models import FoodItem
+from schedules.models import Schedule, DailyMenu
+from orders.models import Order, OrderSettlement
+
+
+class OrderTransitionTests(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(username='kitchen_admin', password='password123', role=User.Role.SUPER_ADMIN)
+        self.kebab = FoodItem.objects.create(name="Kebab", description="", price=Decimal('150.00'))
+        self.pasta = FoodItem.objects.create(name="Pasta", description="", price=Decimal('90.00'))
+        self.day = date(2025, 4, 1)
+
+        self.companies = []
+        for name in ("Kitchen A", "Kitchen B"):
+            company = Company.objects.create(name=name)
+            schedule = Schedule.objects.create(name=name, company=company, start_date=self.day, end_date=self.day)
+            menu = DailyMenu.objects.create(schedule=schedule, date=self.day)
+            for i in range(3):
+                employee = User.objects.create_user(username=f'{name}_{i}', password='password123', company=company)
+                food = self.kebab if i < 2 else self.pasta
+                Order.objects.create(user=employee, daily_menu=menu, food_item=food,
+                                     **Order.calculate_prices(food, []))
+            self.companies.append(company)
+
+        self.bulk_url = reverse('admin-order-bulk-transition')
+        self.client.force_authenticate(user=self.admin)
+
+    def test_bulk_transition_is_a_single_update(self):
+        """VERIFY: All of a day's placed orders are confirmed with one UPDATE statement."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.bulk_url, {'date': '2025-04-01', 'status': 'CONFIRMED'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['updated'], 6)
+        self.assertEqual(sum(q['sql'].startswith('UPDATE') for q in queries.captured_queries), 1)
+        self.assertFalse(Order.objects.exclude(status=Order.OrderStatus.CONFIRMED).exists())
+
+    def test_bulk_transition_filters_and_skips_disallowed(self):
+        """VERIFY: Filters narrow the orders and orders in a disallowed state are left alone."""
+        response = self.client.post(self.bulk_url, {
+            'date': '2025-04-01', 'status': 'DELIVERED',
+        }, format='json')
+        self.assertEqual(response.data['updated'], 0)
+
+        self.client.post(self.bulk_url, {
+            'date': '2025-04-01', 'status': 'CONFIRMED',
+            'company_id': self.companies[0].id, 'food_item_id': self.kebab.id,
+        }, format='json')
+        self.assertEqual(Order.objects.filter(status=Order.OrderStatus.CONFIRMED).count(), 2)
+
+    def test_bulk_transition_skips_unsettled_orders(self):
+        """VERIFY: Orders still waiting for settlement are not picked up by the kitchen."""
+        order = Order.objects.first()
+        OrderSettlement.objects.create(order=order, user=order.user, amount=order.total_price)
+        response = self.client.post(self.bulk_url, {'date': '2025-04-01', 'status': 'CONFIRMED'}, format='json')
+        self.assertEqual(response.data['updated'], 5)
+        order.refresh_from_db()
+        self.assertEqual(order.status, Order.OrderStatus.PLACED)
+
+    def test_single_transition_enforces_state_machine(self):
+        """VERIFY: A single order follows the workflow and cannot skip steps or be canceled here."""
+        order = Order.objects.first()
+        url = reverse('admin-order-transition', kwargs={'pk': order.pk})
+
+        response = self.client.post(url, {'status': 'PREPARING'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.post(url, {'status': 'CANCELED'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        for target in ('CONFIRMED', 'PREPARING', 'DELIVERED'):
+            response = self.client.post(url, {'status': target}, format='json')
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.data['status'], target)
+
+    def test_transitions_require_super_admin(self):
+        """VERIFY: Employees cannot move orders."""
+        self.client.force_authenticate(user=User.objects.get(username='Kitchen A_0'))
+        response = self.client.post(self.bulk_url, {'date': '2025-04-01', 'status': 'CONFIRMED'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
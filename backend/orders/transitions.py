@@ -0,0 +1,69 @@
+# orders/transitions.py
+
+from django.utils import timezone
+
+from .models import Order, OrderSettlement
+
+Status = Order.OrderStatus
+
+# Allowed kitchen workflow steps: current status -> statuses it may move to.
+# Canceling is not a workflow step: it goes through order deletion (which
+# refunds the user) or a failed settlement.
+ALLOWED_TRANSITIONS = {
+    Status.PLACED: {Status.CONFIRMED},
+    Status.CONFIRMED: {Status.PREPARING, Status.DELIVERED},
+    Status.PREPARING: {Status.DELIVERED},
+    Status.DELIVERED: set(),
+    Status.CANCELED: set(),
+}
+
+WORKFLOW_TARGETS = sorted({target for targets in ALLOWED_TRANSITIONS.values() for target in targets})
+
+
+def can_transition(current, target):
+    """Return True if an order may move from `current` to `target`."""
+    return target in ALLOWED_TRANSITIONS.get(current, set())
+
+
+def source_statuses(target):
+    """Return the statuses an order may be in to move to `target`."""
+    return sorted(status for status, targets in ALLOWED_TRANSITIONS.items() if target in targets)
+
+
+def transitionable(queryset, target, from_status=None):
+    """
+    Narrow an Order queryset to the orders that may move to `target`.
+    Orders still waiting in (or rejected by) the settlement queue have not
+    been charged yet, so the kitchen cannot pick them up.
+    """
+    sources = source_statuses(target)
+    if from_status is not None:
+        sources = [status for status in sources if status == from_status]
+    return queryset.filter(status__in=sources).exclude(
+        settlement__status__in=[
+            OrderSettlement.SettlementStatus.PENDING,
+            OrderSettlement.SettlementStatus.FAILED,
+        ]
+    )
+
+
+def bulk_transition(queryset, target, from_status=None):
+    """
+    Move every eligible order in the queryset to `target` with a single
+    UPDATE ... WHERE status IN (...) statement. Returns the number of orders moved.
+    """
+    return transitionable(queryset, target, from_status).update(status=target, updated_at=timezone.now())
+
+
+def transition_order(order, target):
+    """
+    Move a single order to `target`. The update is conditional on the status
+    the order was read with, so a concurrent change is never overwritten.
+    Returns True if the order was moved.
+    """
+    if not can_transition(order.status, target):
+        return False
+    moved = bulk_transition(Order.objects.filter(pk=order.pk), target, from_status=order.status)
+    if moved:
+        order.status = target
+    return bool(moved)
@@ -1,28 +1,50 @@
 # start of orders/views.py
 # orders/views.py
 
-from rest_framework import viewsets, permissions, serializers
-from django.db import transaction
+from rest_framework import viewsets, permissions, serializers, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from django.db import IntegrityError, transaction
 from django.conf import settings
 from django.utils import timezone
 from decimal import Decimal
 
 from .models import Order
-from .serializers import OrderReadSerializer, OrderWriteSerializer
+from .serializers import OrderReadSerializer, OrderWriteSerializer, BulkOrderSerializer
+from . import production, rollups, settlement
+from .mixins import CompactOrderListMixin
 from wallets.models import Transaction
+from ledger import journal
 from users.models import User
 # [MODIFIED] Import the new permission class
 from core.permissions import CanModifyOrder
+from core.pagination import CreatedAtCursorPagination
 
+DUPLICATE_ORDER_MESSAGE = "You have already placed an order for this day."
+DUPLICATE_ORDER_CONSTRAINT = 'orders_order_unique_user_daily_menu'
 
-class OrderViewSet(viewsets.ModelViewSet):
+
+def _raise_if_duplicate_order(error):
+    """
+    Turn a violation of the one-order-per-day constraint into a validation
+    error. PostgreSQL names the constraint; SQLite only lists its columns.
+    Any other integrity error is left for the caller to re-raise.
+    """
+    message = str(error)
+    if DUPLICATE_ORDER_CONSTRAINT in message or 'orders_order.user_id, orders_order.daily_menu_id' in message:
+        raise serializers.ValidationError(DUPLICATE_ORDER_MESSAGE)
+
+
+class OrderViewSet(CompactOrderListMixin, viewsets.ModelViewSet):
     """
     API endpoint for managing orders.
     Users can only see and modify their own orders.
     Includes budget deduction, refunds, and transaction logging.
+    Lists can be requested in the compact representation (?view=compact).
     """
     # [MODIFIED] Add the new permission class. It will run after IsAuthenticated.
     permission_classes = [permissions.IsAuthenticated, CanModifyOrder]
+    pagination_class = CreatedAtCursorPagination
 
     # ... (get_queryset and get_serializer_class methods are unchanged) ...
     def get_queryset(self):
@@ -42,24 +64,45 @@ class OrderViewSet(viewsets.ModelViewSet):
         """
         if self.action in ['create', 'update', 'partial_update']:
             return OrderWriteSerializer
+        if self.action == 'bulk':
+            return BulkOrderSerializer
         return OrderReadSerializer
 
     def perform_create(self, serializer):
         """
         Wrap order creation and budget deduction in a transaction.
         """
+        try:
+            self._create_order(serializer)
+        except IntegrityError as error:
+            _raise_if_duplicate_order(error)
+            raise
+
+    def _create_order(self, serializer):
         user = self.request.user
         total_cost = serializer.context.get('total_cost', Decimal('0.00'))
+        prices = serializer.context.get('prices', {})
+
+        if settlement.is_queued_intake():
+            # Accept the order now; the settlement worker charges the budget later.
+            if settlement.available_budget(user) < total_cost:
+                raise serializers.ValidationError("Insufficient funds.")
+            with transaction.atomic():
+                order = serializer.save(user=user, **prices)
+                settlement.enqueue([order])
+                rollups.record_orders([order])
+                production.invalidate_orders([order])
+            return
 
         with transaction.atomic():
             # Lock the user row to prevent race conditions on their budget.
-            user_for_update = User.objects.select_for_update().get(pk=user.pk)
+            user_for_update = User.objects.select_for_update(of=('self',)).select_related('company__wallet').get(pk=user.pk)
             
             # Re-check budget inside the transaction for safety
             if user_for_update.budget < total_cost:
                 raise serializers.ValidationError("Insufficient funds.")
 
-            order = serializer.save(user=user_for_update)
+            order = serializer.save(user=user_for_update, **prices)
             user_for_update.budget -= total_cost
             user_for_update.save(update_fields=['budget'])
 
@@ -70,7 +113,82 @@ class OrderViewSet(viewsets.ModelViewSet):
                 amount=-total_cost,
                 description=f"Deduction for Order #{order.id}"
             )
+            journal.record_order_charges([order])
+
+            rollups.record_orders([order])
+            production.invalidate_orders([order])
     
+    @action(detail=False, methods=['post'], url_path='bulk')
+    def bulk(self, request):
+        """
+        Place orders for several daily menus in one request and one transaction.
+        The user row is locked once and orders, side dishes and transactions
+        are written with bulk inserts.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        resolved = serializer.validated_data['resolved_orders']
+        total_cost = serializer.validated_data['total_cost']
+        queued = settlement.is_queued_intake()
+
+        if queued and settlement.available_budget(request.user) < total_cost:
+            raise serializers.ValidationError("Insufficient funds.")
+
+        try:
+            orders = self._create_bulk_orders(request.user, resolved, total_cost, queued)
+        except IntegrityError as error:
+            _raise_if_duplicate_order(error)
+            raise
+
+        created = self.get_queryset().filter(pk__in=[order.pk for order in orders])
+        return Response(OrderReadSerializer(created, many=True).data, status=status.HTTP_201_CREATED)
+
+    def _create_bulk_orders(self, request_user, resolved, total_cost, queued):
+        with transaction.atomic():
+            if queued:
+                user = request_user
+            else:
+                user = User.objects.select_for_update(of=('self',)).select_related('company__wallet').get(pk=request_user.pk)
+
+                # Re-check budget inside the transaction for safety
+                if user.budget < total_cost:
+                    raise serializers.ValidationError("Insufficient funds.")
+
+            orders = Order.objects.bulk_create([
+                Order(user=user, daily_menu=item['daily_menu'], food_item=item['food_item'], **item['prices'])
+                for item in resolved
+            ])
+
+            OrderSideDish = Order.side_dishes.through
+            OrderSideDish.objects.bulk_create([
+                OrderSideDish(order_id=order.id, sidedish_id=side.id)
+                for order, item in zip(orders, resolved)
+                for side in item['side_dishes']
+            ])
+
+            if queued:
+                settlement.enqueue(orders)
+            else:
+                user.budget -= total_cost
+                user.save(update_fields=['budget'])
+
+                Transaction.objects.bulk_create([
+                    Transaction(
+                        wallet=user.company.wallet,
+                        user=user,
+                        transaction_type=Transaction.TransactionType.ORDER_DEDUCTION,
+                        amount=-order.total_price,
+                        description=f"Deduction for Order #{order.id}"
+                    )
+                    for order in orders
+                ])
+                journal.record_order_charges(orders)
+
+            rollups.record_orders(orders)
+            production.invalidate_orders(orders)
+
+        return orders
+
     # --- REFACTORED CODE STARTS HERE ---
 
     # [REMOVED] The redundant helper function is no longer needed.
@@ -81,32 +199,54 @@ class OrderViewSet(viewsets.ModelViewSet):
         Handle order updates, calculate cost differences, and adjust the user's budget.
         The permission check is now handled automatically by CanModifyOrder.
         """
+        try:
+            self._update_order(serializer)
+        except IntegrityError as error:
+            _raise_if_duplicate_order(error)
+            raise
+
+    def _update_order(self, serializer):
         order_instance = serializer.instance
         
         # [REMOVED] The manual permission check is gone.
         # if not self._is_modification_allowed(order_instance.daily_menu.date): ...
 
-        # Calculate the cost of the order BEFORE the update
-        old_food_price = order_instance.food_item.price if order_instance.food_item else Decimal('0.00')
-        old_sides_price = sum(side.price for side in order_instance.side_dishes.all())
-        old_total_cost = old_food_price + old_sides_price
+        # The cost of the order BEFORE the update is the stored price snapshot
+        old_total_cost = order_instance.total_price
+        old_rollup_key = rollups.rollup_key(order_instance)
+        old_date = old_rollup_key[0] if old_rollup_key else None
 
         # Calculate the cost of the order AFTER the update
         new_food_item = serializer.validated_data.get('food_item', order_instance.food_item)
         new_side_dishes = serializer.validated_data.get('side_dishes', order_instance.side_dishes.all())
-        new_food_price = new_food_item.price if new_food_item else Decimal('0.00')
-        new_sides_price = sum(side.price for side in new_side_dishes)
-        new_total_cost = new_food_price + new_sides_price
+        new_prices = Order.calculate_prices(new_food_item, new_side_dishes)
+        new_total_cost = new_prices['total_price']
         
         cost_difference = old_total_cost - new_total_cost
 
+        with transaction.atomic():
+            unsettled = settlement.lock_unsettled(order_instance)
+            if unsettled is not None:
+                # Nothing has been charged for this order yet, so only the queued amount changes.
+                if unsettled.status == unsettled.SettlementStatus.FAILED:
+                    raise serializers.ValidationError("This order was canceled because its payment failed.")
+                order = serializer.save(**new_prices)
+                unsettled.amount = new_total_cost
+                unsettled.save(update_fields=['amount'])
+                rollups.record_order_change(old_rollup_key, old_total_cost, order)
+                production.invalidate_dates([old_date, order.daily_menu.date])
+                return
+
         if cost_difference == Decimal('0.00'):
             # If no price change, just save the order.
-            serializer.save()
+            with transaction.atomic():
+                order = serializer.save(**new_prices)
+                rollups.record_order_change(old_rollup_key, old_total_cost, order)
+                production.invalidate_dates([old_date, order.daily_menu.date])
             return
         
         with transaction.atomic():
-            user = User.objects.select_for_update().get(pk=self.request.user.pk)
+            user = User.objects.select_for_update(of=('self',)).select_related('company__wallet').get(pk=self.request.user.pk)
             
             # If the new order is more expensive, check if the user has enough budget for the difference.
             if cost_difference < 0 and user.budget < abs(cost_difference):
@@ -119,7 +259,9 @@ class OrderViewSet(viewsets.ModelViewSet):
             user.save(update_fields=['budget'])
             
             # Save the updated order
-            serializer.save()
+            order = serializer.save(**new_prices)
+            rollups.record_order_change(old_rollup_key, old_total_cost, order)
+            production.invalidate_dates([old_date, order.daily_menu.date])
             
             # Log the transaction for the budget adjustment
             transaction_type = Transaction.TransactionType.REFUND if cost_difference > 0 else Transaction.TransactionType.ORDER_DEDUCTION
@@ -130,6 +272,10 @@ class OrderViewSet(viewsets.ModelViewSet):
                 amount=cost_difference,
                 description=f"Price adjustment for updated Order #{order_instance.id}"
             )
+            journal.record_order_adjustment(
+                user.pk, order_instance.id, cost_difference,
+                f"Price adjustment for updated Order #{order_instance.id}"
+            )
 
     def perform_destroy(self, instance):
         """
@@ -139,13 +285,15 @@ class OrderViewSet(viewsets.ModelViewSet):
         # [REMOVED] The manual permission check is gone.
         # if not self._is_modification_allowed(instance.daily_menu.date): ...
         
-        food_price = instance.food_item.price if instance.food_item else Decimal('0.00')
-        sides_price = sum(side.price for side in instance.side_dishes.all())
-        refund_amount = food_price + sides_price
+        refund_amount = instance.total_price
         
-        if refund_amount > Decimal('0.00'):
-            with transaction.atomic():
-                user = User.objects.select_for_update().get(pk=instance.user.pk)
+        with transaction.atomic():
+            # Orders still waiting in the settlement queue were never charged
+            if settlement.lock_unsettled(instance) is not None:
+                refund_amount = Decimal('0.00')
+
+            if refund_amount > Decimal('0.00'):
+                user = User.objects.select_for_update(of=('self',)).select_related('company__wallet').get(pk=instance.user.pk)
                 user.budget += refund_amount
                 user.save(update_fields=['budget'])
                 
@@ -157,7 +305,13 @@ class OrderViewSet(viewsets.ModelViewSet):
                     amount=refund_amount,
                     description=f"Refund for canceled Order #{instance.id}"
                 )
+                journal.record_order_adjustment(
+                    user.pk, instance.id, refund_amount, f"Refund for canceled Order #{instance.id}"
+                )
+
+            rollups.record_orders([instance], sign=-1)
+            production.invalidate_orders([instance])
 
-        # Finally, delete the order instance
-        instance.delete()
+            # Finally, delete the order instance
+            instance.delete()
 # end of orders/views.py```
@@ -1,22 +1,29 @@
 # orders/views_admin.py
 
-from rest_framework import viewsets
+import csv
+import json
+
+from rest_framework import viewsets, status
+from rest_framework.decorators import action
 from rest_framework.views import APIView
 from rest_framework.response import Response
+from django.http import StreamingHttpResponse
 from django_filters import rest_framework as filters
 from django.db.models import Count, Sum, F, Q
 from django.db.models.functions import Coalesce, TruncDate
 from django.utils import timezone
 from datetime import timedelta
 from decimal import Decimal
-from collections import defaultdict # [NEW] Import defaultdict for easier processing
 
-from .models import Order
+from .models import Order, DailySalesRollup
 from users.models import User
 from companies.models import Company
-from menu.models import FoodItem
 from core.permissions import IsSuperAdmin 
-from .serializers import OrderReadSerializer
+from core.pagination import CreatedAtCursorPagination
+from .serializers import OrderReadSerializer, OrderTransitionSerializer, BulkOrderTransitionSerializer
+from .projections import ORDER_EXPORT_COLUMNS, iter_order_rows
+from .mixins import CompactOrderListMixin
+from . import production, transitions
 
 
 # --- FilterSet for the Order View ---
@@ -33,7 +40,7 @@ class OrderFilter(filters.FilterSet):
 
 # --- Admin ViewSet for All Orders ---
 
-class AdminOrderViewSet(viewsets.ReadOnlyModelViewSet):
+class AdminOrderViewSet(CompactOrderListMixin, viewsets.ReadOnlyModelViewSet):
     queryset = Order.objects.select_related(
         'user',
         'food_item',
@@ -42,6 +49,93 @@ class AdminOrderViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = OrderReadSerializer
     permission_classes = [IsSuperAdmin]
     filterset_class = OrderFilter
+    pagination_class = CreatedAtCursorPagination
+
+    @action(detail=False, methods=['get'], url_path='export')
+    def export(self, request):
+        """
+        Stream every order matching the OrderFilter parameters as CSV (default)
+        or JSON Lines (?export_format=jsonl). Rows are read with a server-side
+        cursor and flat values() projections, so memory use stays constant.
+        """
+        export_format = request.query_params.get('export_format', 'csv')
+        if export_format not in ('csv', 'jsonl'):
+            return Response({"error": "Invalid export_format. Use 'csv' or 'jsonl'."}, status=400)
+
+        queryset = self.filter_queryset(Order.objects.order_by('id'))
+        rows = iter_order_rows(queryset)
+
+        if export_format == 'jsonl':
+            content = (json.dumps(row, default=str, ensure_ascii=False) + '\n' for row in rows)
+            content_type = 'application/x-ndjson'
+        else:
+            content = _csv_lines(rows)
+            content_type = 'text/csv; charset=utf-8'
+
+        response = StreamingHttpResponse(content, content_type=content_type)
+        filename = f"orders-{timezone.now():%Y%m%d-%H%M%S}.{export_format}"
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
+    @action(detail=True, methods=['post'], url_path='transition')
+    def transition(self, request, pk=None):
+        """
+        Move a single order to the next kitchen workflow status.
+        """
+        order = self.get_object()
+        serializer = OrderTransitionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        target = serializer.validated_data['status']
+
+        if not transitions.can_transition(order.status, target):
+            return Response(
+                {"error": f"Cannot move an order from {order.status} to {target}."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if not transitions.transition_order(order, target):
+            return Response(
+                {"error": "The order was changed by another request or is awaiting settlement."},
+                status=status.HTTP_409_CONFLICT
+            )
+        production.invalidate_orders([order])
+        return Response(OrderReadSerializer(order).data)
+
+    @action(detail=False, methods=['post'], url_path='bulk-transition')
+    def bulk_transition(self, request):
+        """
+        Move every eligible order of a day (optionally for one company and/or
+        food item) to a new status with a single UPDATE statement. Orders whose
+        current status does not allow the move are left untouched.
+        """
+        serializer = BulkOrderTransitionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        queryset = Order.objects.filter(daily_menu__date=data['date'])
+        if 'company_id' in data:
+            queryset = queryset.filter(daily_menu__schedule__company_id=data['company_id'])
+        if 'food_item_id' in data:
+            queryset = queryset.filter(food_item_id=data['food_item_id'])
+
+        updated = transitions.bulk_transition(queryset, data['status'], data.get('from_status'))
+        if updated:
+            production.invalidate_dates([data['date']])
+        return Response({'status': data['status'], 'updated': updated})
+
+
+class _Echo:
+    """File-like object whose write() returns the value, for streaming csv.writer output."""
+    def write(self, value):
+        return value
+
+
+def _csv_lines(rows):
+    writer = csv.writer(_Echo())
+    columns = list(ORDER_EXPORT_COLUMNS) + ['side_dishes']
+    yield writer.writerow(columns)
+    for row in rows:
+        row['side_dishes'] = '; '.join(side['name'] for side in row['side_dishes'])
+        yield writer.writerow([row[column] for column in columns])
 
 
 # --- APIViews for Reports and Dashboard ---
@@ -55,22 +149,58 @@ class DailyOrderSummaryView(APIView):
             query_date = timezone.datetime.strptime(query_date_str, '%Y-%m-%d').date()
         except ValueError:
             return Response({"error": "Invalid date format. Use YYYY-MM-DD."}, status=400)
-        food_summary = Order.objects.filter(daily_menu__date=query_date, status__in=['PLACED', 'CONFIRMED']).values('food_item__name').annotate(count=Count('food_item')).order_by('-count')
-        side_dish_summary = Order.objects.filter(daily_menu__date=query_date, status__in=['PLACED', 'CONFIRMED']).values('side_dishes__name').annotate(count=Count('side_dishes')).order_by('-count')
+        orders_qs = Order.objects.filter(daily_menu__date=query_date, status__in=['PLACED', 'CONFIRMED'])
+        food_summary = orders_qs.values('food_item__name').annotate(count=Count('food_item')).order_by('-count')
+        side_dish_summary = orders_qs.values('side_dishes__name').annotate(count=Count('side_dishes')).order_by('-count')
         side_dish_summary = [item for item in side_dish_summary if item['side_dishes__name'] is not None]
-        return Response({'date': query_date, 'food_summary': list(food_summary), 'side_dish_summary': list(side_dish_summary)})
+        total_revenue = orders_qs.aggregate(total=Coalesce(Sum('total_price'), Decimal('0.00')))['total']
+        return Response({'date': query_date, 'food_summary': list(food_summary), 'side_dish_summary': list(side_dish_summary), 'total_revenue': total_revenue})
+
+
+class ProductionPlanView(APIView):
+    """
+    Kitchen prep sheet for a date range (default: the coming week), with food
+    item and side dish counts per delivery date and company, broken down by
+    order status. Cached until an order for one of the dates is written.
+    """
+    permission_classes = [IsSuperAdmin]
+
+    def get(self, request, *args, **kwargs):
+        today = timezone.now().date()
+        try:
+            start_date = timezone.datetime.fromisoformat(request.query_params.get('from', today.isoformat())).date()
+            end_date = timezone.datetime.fromisoformat(
+                request.query_params.get('to', (today + timedelta(days=6)).isoformat())
+            ).date()
+        except ValueError:
+            return Response({"error": "Invalid date format. Use YYYY-MM-DD."}, status=400)
+
+        if end_date < start_date:
+            return Response({"error": "'to' must not be before 'from'."}, status=400)
+        if (end_date - start_date).days >= production.MAX_PLAN_DAYS:
+            return Response({"error": f"The range cannot exceed {production.MAX_PLAN_DAYS} days."}, status=400)
+
+        company_id = request.query_params.get('company_id')
+        if company_id and not company_id.isdigit():
+            return Response({"error": "Invalid company_id."}, status=400)
+
+        return Response(production.get_production_plan(start_date, end_date, company_id and int(company_id)))
 
 
 class DashboardStatsView(APIView):
     permission_classes = [IsSuperAdmin]
     def get(self, request, *args, **kwargs):
-        # This view is unchanged but included for completeness
         today = timezone.now().date()
-        orders_today = Order.objects.filter(daily_menu__date=today).count()
+        today_totals = DailySalesRollup.objects.filter(date=today).aggregate(
+            count=Coalesce(Sum('order_count'), 0),
+            revenue=Coalesce(Sum('revenue'), Decimal('0.00')),
+        )
         pending_orders = Order.objects.filter(status__in=['PLACED', 'CONFIRMED']).count()
-        top_foods = FoodItem.objects.annotate(order_count=Count('orders')).order_by('-order_count')[:5]
-        top_foods_data = [{'name': f.name, 'count': f.order_count} for f in top_foods]
-        stats = {'orders_today': orders_today, 'pending_orders_total': pending_orders, 'top_5_foods': top_foods_data}
+        top_foods = DailySalesRollup.objects.filter(food_item__isnull=False).values('food_item__name').annotate(
+            order_count=Sum('order_count')
+        ).order_by('-order_count')[:5]
+        top_foods_data = [{'name': f['food_item__name'], 'count': f['order_count']} for f in top_foods]
+        stats = {'orders_today': today_totals['count'], 'sales_today': today_totals['revenue'], 'pending_orders_total': pending_orders, 'top_5_foods': top_foods_data}
         return Response(stats)
 
 
@@ -99,59 +229,62 @@ class AdminReportsView(APIView):
         company_id = request.query_params.get('companyId')
 
         # 2. Base QuerySets
+        # Sales figures come from the pre-aggregated rollup, so their cost depends
+        # on the number of days in range rather than on the number of orders.
         base_orders_queryset = Order.objects.filter(daily_menu__date__range=(start_date, end_date), daily_menu__isnull=False)
+        rollup_queryset = DailySalesRollup.objects.filter(date__range=(start_date, end_date))
         company_queryset = Company.objects.all()
         if company_id:
             base_orders_queryset = base_orders_queryset.filter(user__company_id=company_id)
+            rollup_queryset = rollup_queryset.filter(company_id=company_id)
             company_queryset = company_queryset.filter(id=company_id)
 
-        # 3. Aggregations (Now done in a safer way)
+        # 3. Aggregations
 
         # --- Summary Stats ---
-        orders_today_qs = Order.objects.filter(daily_menu__date=today)
+        # Today's figures ignore the requested range; only the company filter applies
+        today_rollup = DailySalesRollup.objects.filter(date=today)
         if company_id:
-            orders_today_qs = orders_today_qs.filter(user__company_id=company_id)
-        
-        total_sales_today = Decimal('0.0')
-        # Eager load related items to prevent many small queries
-        for order in orders_today_qs.select_related('food_item').prefetch_related('side_dishes'):
-            if order.food_item:
-                total_sales_today += order.food_item.price
-            total_sales_today += sum(side.price for side in order.side_dishes.all())
+            today_rollup = today_rollup.filter(company_id=company_id)
+        today_totals = today_rollup.aggregate(
+            count=Coalesce(Sum('order_count'), 0),
+            revenue=Coalesce(Sum('revenue'), Decimal('0.00')),
+        )
 
         summary_data = {
-            "orders_today": orders_today_qs.count(),
+            "orders_today": today_totals['count'],
             "pending_orders_total": base_orders_queryset.filter(status__in=['PLACED', 'CONFIRMED']).count(),
-            "total_sales_today": total_sales_today
+            "total_sales_today": today_totals['revenue']
         }
 
-        # --- Top Items (This query is generally safe) ---
-        top_items_data = base_orders_queryset.values('food_item__id', 'food_item__name').annotate(
+        # --- Top Items ---
+        top_items_data = rollup_queryset.filter(order_count__gt=0).values('food_item__id', 'food_item__name').annotate(
             foodId=F('food_item__id'),
             name=F('food_item__name'),
-            ordered=Count('food_item')
+            ordered=Sum('order_count')
         ).order_by('-ordered')[:5]
 
-        # --- Sales by Date (Calculated in Python for reliability) ---
-        sales_by_date = defaultdict(lambda: {'orders': 0, 'revenue': Decimal('0.0')})
-        
-        orders_for_revenue = base_orders_queryset.select_related('food_item', 'daily_menu').prefetch_related('side_dishes')
-        
-        for order in orders_for_revenue:
-            date_str = order.daily_menu.date.isoformat()
-            sales_by_date[date_str]['orders'] += 1
-            
-            order_total = order.food_item.price if order.food_item else Decimal('0.0')
-            order_total += sum(side.price for side in order.side_dishes.all())
-            sales_by_date[date_str]['revenue'] += order_total
-
-        sales_by_date_data = [{'date': date, **data} for date, data in sorted(sales_by_date.items())]
-
-        # --- Company & User Stats (These queries are safe) ---
-        company_stats_data = company_queryset.annotate(
-            active_users=Count('employees', filter=Q(employees__is_active=True), distinct=True),
-            orders=Count('employees__orders', filter=Q(employees__orders__daily_menu__date__range=(start_date, end_date)), distinct=True)
-        ).values('id', 'name', 'active_users', 'orders')
+        # --- Sales by Date ---
+        sales_by_date = rollup_queryset.values('date').annotate(
+            orders=Sum('order_count'),
+            revenue=Sum('revenue'),
+        ).filter(orders__gt=0).order_by('date')
+
+        sales_by_date_data = [
+            {'date': row['date'].isoformat(), 'orders': row['orders'], 'revenue': row['revenue']}
+            for row in sales_by_date
+        ]
+
+        # --- Company & User Stats ---
+        orders_by_company = dict(
+            rollup_queryset.values('company_id').annotate(orders=Sum('order_count')).values_list('company_id', 'orders')
+        )
+        company_stats_data = [
+            {**company, 'orders': orders_by_company.get(company['id'], 0)}
+            for company in company_queryset.annotate(
+                active_users=Count('employees', filter=Q(employees__is_active=True), distinct=True),
+            ).values('id', 'name', 'active_users')
+        ]
 
         user_stats_data = {
             "total_users": User.objects.count(),
@@ -163,7 +296,7 @@ class AdminReportsView(APIView):
             "summary": summary_data,
             "top_items": list(top_items_data),
             "sales_by_date": sales_by_date_data,
-            "company_stats": list(company_stats_data),
+            "company_stats": company_stats_data,
             "user_stats": user_stats_data,
         }
 
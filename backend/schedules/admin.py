@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Schedule, DailyMenu
+from .models import Schedule, DailyMenu, MenuPlan, MenuPlanDay
 
 class DailyMenuInline(admin.TabularInline):
     """
@@ -12,7 +12,23 @@ class DailyMenuInline(admin.TabularInline):
 
 @admin.register(Schedule)
 class ScheduleAdmin(admin.ModelAdmin):
-    list_display = ('name', 'company', 'start_date', 'end_date', 'is_active')
+    list_display = ('name', 'company', 'start_date', 'end_date', 'is_active', 'plan')
     list_filter = ('is_active', 'company')
     search_fields = ('name', 'company__name')
-    inlines = [DailyMenuInline] # Nest the daily menu editor
\ No newline at end of file
+    inlines = [DailyMenuInline] # Nest the daily menu editor
+
+
+class MenuPlanDayInline(admin.TabularInline):
+    """
+    Edits the shared days of a master plan.
+    """
+    model = MenuPlanDay
+    extra = 1
+    fields = ('date', 'available_foods', 'available_sides')
+    filter_horizontal = ('available_foods', 'available_sides')
+
+@admin.register(MenuPlan)
+class MenuPlanAdmin(admin.ModelAdmin):
+    list_display = ('name', 'start_date', 'end_date', 'updated_at')
+    search_fields = ('name',)
+    inlines = [MenuPlanDayInline]
@@ -2,4 +2,8 @@ from django.apps import AppConfig
 
 class SchedulesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'schedules'
\ No newline at end of file
+    name = 'schedules'
+
+    def ready(self):
+        # Register the signals that expire the cached company menus.
+        import schedules.signals
\ No newline at end of file
@@ -0,0 +1,41 @@
+# schedules/availability.py
+
+from .models import DailyMenu, MenuPlanDay
+
+
+def menu_links(menu_ids, relation, item_column, *columns):
+    """
+    (menu_id, item_id, *columns) rows of one relation: a menu's own rows, or
+    those of its plan day when it was published from a plan, in a single
+    UNION query. `columns` are extra paths on the through model, such as
+    'fooditem__name'.
+    """
+    own = getattr(DailyMenu, relation).through.objects.filter(
+        dailymenu_id__in=menu_ids, dailymenu__plan_day__isnull=True
+    ).values_list('dailymenu_id', item_column, *columns)
+    shared = getattr(MenuPlanDay, relation).through.objects.filter(
+        menuplanday__daily_menus__in=menu_ids
+    ).values_list('menuplanday__daily_menus', item_column, *columns)
+    return own.union(shared, all=True)
+
+
+def load_menu_availability(menu_ids):
+    """
+    Return {menu_id: (food_ids, side_ids)} for the given daily menus,
+    where both id collections are frozensets.
+    Reads the ManyToMany through tables directly, one query per relation.
+    """
+    menu_ids = set(menu_ids)
+    foods = {menu_id: set() for menu_id in menu_ids}
+    sides = {menu_id: set() for menu_id in menu_ids}
+
+    for menu_id, food_id in menu_links(menu_ids, 'available_foods', 'fooditem_id'):
+        foods[menu_id].add(food_id)
+
+    for menu_id, side_id in menu_links(menu_ids, 'available_sides', 'sidedish_id'):
+        sides[menu_id].add(side_id)
+
+    return {
+        menu_id: (frozenset(foods[menu_id]), frozenset(sides[menu_id]))
+        for menu_id in menu_ids
+    }
@@ -0,0 +1,98 @@
+# schedules/generation.py
+
+from collections import namedtuple
+from datetime import timedelta
+
+from django.db import transaction
+
+from .availability import load_menu_availability
+from .models import DailyMenu
+from . import menu_cache
+
+# Longest period a single generation may cover
+MAX_GENERATION_DAYS = 366
+
+# The foods and side dishes offered on one generated day
+MenuTemplate = namedtuple('MenuTemplate', ['food_ids', 'side_ids'])
+
+
+# --- Rules ---
+# A rule maps (date, index of the service day) to a MenuTemplate, or to None
+# when no menu is served that day.
+
+def service_days(start_date, end_date, skip_weekdays=(), holidays=()):
+    """Return the dates of the period, without the skipped weekdays (0 = Monday) and holidays."""
+    skip_weekdays, holidays = set(skip_weekdays), set(holidays)
+    days = (start_date + timedelta(days=offset) for offset in range((end_date - start_date).days + 1))
+    return [day for day in days if day.weekday() not in skip_weekdays and day not in holidays]
+
+
+def weekly_rule(pattern):
+    """Serve pattern[weekday] on each day; weekdays missing from the pattern get no menu."""
+    return lambda day, index: pattern.get(day.weekday())
+
+
+def rotation_rule(templates):
+    """Serve the templates in turn, starting over after the last one."""
+    templates = list(templates)
+    return lambda day, index: templates[index % len(templates)] if templates else None
+
+
+def copy_rule(source_schedule):
+    """
+    Serve the menus of an earlier schedule in date order, one per service day,
+    starting over when the source runs out. Costs three queries.
+    """
+    menu_ids = list(source_schedule.daily_menus.order_by('date').values_list('id', flat=True))
+    availability = load_menu_availability(menu_ids)
+    return rotation_rule(
+        MenuTemplate(*availability[menu_id]) for menu_id in menu_ids
+    )
+
+
+# --- Generation ---
+
+def generate_menus(plans):
+    """
+    Create the daily menus of many schedules at once.
+
+    `plans` is a list of (schedule, days, rule). Dates that already have a
+    menu in their schedule are kept and skipped. All menus are inserted by
+    one bulk_create, then the food and side dish links by one bulk_create per
+    through table, so the query count does not grow with the number of
+    schedules or days. Returns {schedule_id: (created, skipped)}.
+    """
+    schedule_ids = [schedule.pk for schedule, _, _ in plans]
+    existing = set(DailyMenu.objects.filter(schedule_id__in=schedule_ids).values_list('schedule_id', 'date'))
+
+    menus, templates, summary = [], [], {}
+    for schedule, days, rule in plans:
+        created = skipped = 0
+        for index, day in enumerate(days):
+            template = rule(day, index)
+            if template is None:
+                continue
+            if (schedule.pk, day) in existing:
+                skipped += 1
+                continue
+            menus.append(DailyMenu(schedule=schedule, date=day))
+            templates.append(template)
+            created += 1
+        summary[schedule.pk] = (created, skipped)
+
+    FoodLink = DailyMenu.available_foods.through
+    SideLink = DailyMenu.available_sides.through
+    with transaction.atomic():
+        DailyMenu.objects.bulk_create(menus, batch_size=1000)
+        FoodLink.objects.bulk_create([
+            FoodLink(dailymenu_id=menu.pk, fooditem_id=food_id)
+            for menu, template in zip(menus, templates) for food_id in set(template.food_ids)
+        ], batch_size=5000)
+        SideLink.objects.bulk_create([
+            SideLink(dailymenu_id=menu.pk, sidedish_id=side_id)
+            for menu, template in zip(menus, templates) for side_id in set(template.side_ids)
+        ], batch_size=5000)
+        # Bulk inserts send no signals, so expire the cached menus here
+        menu_cache.invalidate_companies({schedule.company_id for schedule, _, _ in plans})
+
+    return summary
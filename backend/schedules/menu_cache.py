@@ -0,0 +1,87 @@
+# schedules/menu_cache.py
+
+import hashlib
+import time
+
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from core.cache import CacheNamespace, invalidate_tags
+from .models import Schedule
+
+# Rendered menus are dropped after an hour even without a write. They are
+# only cached when the cache is shared by every worker (see core.cache.is_shared);
+# otherwise each request renders, and the content hash keeps the ETag valid.
+menus = CacheNamespace('company-menu', timeout=60 * 60)
+
+# A company's menu depends on its own schedules and daily menus (the company
+# tag) and on the shared food, side dish and category rows (the catalog tag).
+CATALOG_TAG = 'menu-catalog'
+# Bumped together with any company tag, for views listing every company's schedules
+SCHEDULES_TAG = 'schedules'
+
+
+def company_tag(company_id):
+    return f'company-menu:{company_id}'
+
+
+def company_tags(company_id):
+    return [company_tag(company_id), SCHEDULES_TAG]
+
+
+def invalidate_companies(company_ids):
+    """
+    Expire the cached menus of the given companies once the transaction
+    commits, and their menu indexes in this process at once.
+    """
+    # Imported here: the menu index builds its versions from this module's tags
+    from . import menu_index
+
+    company_ids = {company_id for company_id in company_ids if company_id is not None}
+    invalidate_tags(*(tag for company_id in company_ids for tag in company_tags(company_id)))
+    menu_index.forget(company_ids)
+
+
+def invalidate_catalog():
+    """Expire every company's cached menu (a food, side dish or category changed)."""
+    from . import menu_index
+
+    invalidate_tags(CATALOG_TAG)
+    menu_index.forget()
+
+
+# --- Rendering ---
+
+def _render(company_id, today, request):
+    # Imported here: the serializers use the generation engine, which expires this cache
+    from .serializers import ScheduleSerializer, DAILY_MENU_PREFETCH
+
+    schedules = Schedule.objects.filter(
+        company_id=company_id,
+        is_active=True,
+        start_date__lte=today,
+        end_date__gte=today
+    ).select_related('company').prefetch_related(
+        *(f'daily_menus__{path}' for path in DAILY_MENU_PREFETCH)
+    )
+    body = JSONRenderer().render(ScheduleSerializer(schedules, many=True, context={'request': request}).data)
+    return {
+        'body': body,
+        'etag': '"%s"' % hashlib.sha1(body).hexdigest(),
+        'last_modified': time.time(),
+    }
+
+
+def get_company_menu(company_id, request=None):
+    """
+    Return the active schedules of a company as pre-rendered JSON, with the
+    ETag and Last-Modified time of that rendering:
+    {'body': bytes, 'etag': str, 'last_modified': epoch seconds}.
+    Every employee of the company shares one rendering per day and version.
+    """
+    today = timezone.localdate()
+    return menus.get_or_set(
+        [company_id, today.isoformat()],
+        lambda: _render(company_id, today, request),
+        tags=[*company_tags(company_id), CATALOG_TAG],
+    )
@@ -0,0 +1,83 @@
+# schedules/menu_calendar.py
+
+from menu.models import FoodItem
+from orders.models import Order
+from .availability import menu_links
+from .models import DailyMenu
+
+# Longest window a calendar request may cover (six weeks of a month view)
+MAX_CALENDAR_DAYS = 42
+
+# Item detail key -> column on the through model, per relation
+FOOD_COLUMNS = {
+    'name': 'fooditem__name',
+    'price': 'fooditem__price',
+    'image': 'fooditem__image',
+    'is_available': 'fooditem__is_available',
+    'category_name': 'fooditem__category__name',
+}
+SIDE_COLUMNS = {
+    'name': 'sidedish__name',
+    'price': 'sidedish__price',
+    'is_available': 'sidedish__is_available',
+}
+
+
+def _collect(menu_ids, relation, item_column, columns, days, key, details):
+    """
+    Add the item ids of one relation to each day in `days` (keyed by menu id)
+    and the item details, once per item, to `details`.
+    """
+    for menu_id, item_id, *values in menu_links(menu_ids, relation, item_column, *columns.values()):
+        days[menu_id][key].append(item_id)
+        if item_id not in details:
+            details[item_id] = {'id': item_id, **dict(zip(columns, values))}
+
+
+def build_calendar(company_id, user_id, start_date, end_date, request=None):
+    """
+    Return the menus of a company's active schedules between two dates as
+    {'days': [...], 'foods': {id: {...}}, 'sides': {id: {...}}}.
+
+    Each day lists its menu id, the ids of its foods and sides and the id of
+    the user's order for it, if any; the foods and sides themselves are
+    described once in the shared dictionaries. Built from four flat queries
+    (menus, food links, side links, orders) joined here, so neither the
+    query count nor the per-day payload grows with the number of items.
+    """
+    menus = DailyMenu.objects.filter(
+        schedule__company_id=company_id,
+        schedule__is_active=True,
+        date__range=(start_date, end_date),
+    ).order_by('date', 'id').values_list('id', 'date', 'schedule_id')
+    days = {
+        menu_id: {'date': date, 'menu': menu_id, 'schedule': schedule_id,
+                  'foods': [], 'sides': [], 'order': None, 'order_status': None}
+        for menu_id, date, schedule_id in menus
+    }
+    if not days:
+        return {'days': [], 'foods': {}, 'sides': {}}
+
+    foods, sides = {}, {}
+    _collect(list(days), 'available_foods', 'fooditem_id', FOOD_COLUMNS, days, 'foods', foods)
+    _collect(list(days), 'available_sides', 'sidedish_id', SIDE_COLUMNS, days, 'sides', sides)
+
+    orders = Order.objects.filter(user_id=user_id, daily_menu_id__in=list(days)).values_list('daily_menu_id', 'id', 'status')
+    for menu_id, order_id, status in orders:
+        days[menu_id].update(order=order_id, order_status=status)
+
+    # Prices and image URLs are rendered as FoodItemSerializer renders them
+    storage = FoodItem._meta.get_field('image').storage
+    for item in [*foods.values(), *sides.values()]:
+        item['price'] = str(item['price'])
+    for food in foods.values():
+        if food['image']:
+            url = storage.url(food['image'])
+            food['image'] = request.build_absolute_uri(url) if request is not None else url
+        else:
+            food['image'] = None
+
+    for day in days.values():
+        day['foods'].sort()
+        day['sides'].sort()
+    return {'days': list(days.values()), 'foods': foods, 'sides': sides}
@@ -0,0 +1,92 @@
+# schedules/menu_index.py
+
+from collections import namedtuple
+
+from django.utils import timezone
+
+from core.cache import is_shared, tag_versions
+from .availability import load_menu_availability
+from .models import DailyMenu
+from . import menu_cache
+
+# One orderable menu of a company
+MenuEntry = namedtuple('MenuEntry', ['menu_id', 'date', 'food_ids', 'side_ids'])
+
+
+# --- Index ---
+# Each worker process keeps, per company, the menus from today on with their
+# food and side id sets. An index is valid for the day it was built and for
+# the versions of the company's menu tag and the catalog tag it was built
+# under: writes bump those tags on commit and drop the index of this process
+# at once through forget(). Other processes only see the bump through a
+# shared cache, so without one menu_availability() reads the database.
+
+_indexes = {}
+
+
+class CompanyMenuIndex:
+    """The upcoming menus of one company, as {menu_id: MenuEntry}."""
+
+    def __init__(self, day, versions, entries):
+        self.day = day
+        self.versions = versions
+        self.by_id = {entry.menu_id: entry for entry in entries}
+
+
+def _versions(company_id):
+    return tag_versions([menu_cache.company_tag(company_id), menu_cache.CATALOG_TAG])
+
+
+def _build(company_id, day, versions):
+    # The versions are read before the rows, so a write committed meanwhile
+    # bumps them and the next lookup rebuilds the index
+    menus = dict(DailyMenu.objects.filter(schedule__company_id=company_id, date__gte=day).values_list('id', 'date'))
+    availability = load_menu_availability(menus)
+    return CompanyMenuIndex(day, versions, [
+        MenuEntry(menu_id, date, *availability[menu_id]) for menu_id, date in menus.items()
+    ])
+
+
+def company_index(company_id):
+    """
+    Return the CompanyMenuIndex of a company, rebuilt (three queries) when a
+    menu, schedule or catalog item changed or the day rolled over, and
+    otherwise costing one cache round trip for the tag versions.
+    """
+    day = timezone.localdate()
+    versions = _versions(company_id)
+    index = _indexes.get(company_id)
+    if index is None or index.day != day or index.versions != versions:
+        index = _indexes[company_id] = _build(company_id, day, versions)
+    return index
+
+
+def forget(company_ids=None):
+    """Drop the indexes of the given companies (or all of them) in this process."""
+    if company_ids is None:
+        _indexes.clear()
+        return
+    for company_id in company_ids:
+        _indexes.pop(company_id, None)
+
+
+# --- Lookups ---
+
+def menu_availability(company_id, menu_ids):
+    """
+    Return {menu_id: (food_ids, side_ids)} like load_menu_availability().
+    With a shared cache, the company's upcoming menus are answered from its
+    index; other menus (past ones, or another company's) are loaded from the
+    database, and so is everything when the cache is per process.
+    """
+    menu_ids = set(menu_ids)
+    use_index = company_id is not None and is_shared()
+    entries = company_index(company_id).by_id if use_index else {}
+    result = {
+        menu_id: (entries[menu_id].food_ids, entries[menu_id].side_ids)
+        for menu_id in menu_ids if menu_id in entries
+    }
+    missing = menu_ids - result.keys()
+    if missing:
+        result.update(load_menu_availability(missing))
+    return result
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 14:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu', '0001_initial'),
+        ('schedules', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='dailymenu',
+            index=models.Index(fields=['date'], name='schedules_dailymenu_date_idx'),
+        ),
+    ]
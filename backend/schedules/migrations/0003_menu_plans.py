@@ -0,0 +1,50 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:35
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu', '0002_updated_at'),
+        ('schedules', '0002_dailymenu_date_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MenuPlan',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+                ('start_date', models.DateField()),
+                ('end_date', models.DateField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='schedule',
+            name='plan',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='schedules', to='schedules.menuplan'),
+        ),
+        migrations.CreateModel(
+            name='MenuPlanDay',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('available_foods', models.ManyToManyField(blank=True, related_name='plan_days', to='menu.fooditem')),
+                ('available_sides', models.ManyToManyField(blank=True, related_name='plan_days', to='menu.sidedish')),
+                ('plan', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='days', to='schedules.menuplan')),
+            ],
+            options={
+                'ordering': ['date'],
+                'unique_together': {('plan', 'date')},
+            },
+        ),
+        migrations.AddField(
+            model_name='dailymenu',
+            name='plan_day',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='daily_menus', to='schedules.menuplanday'),
+        ),
+    ]
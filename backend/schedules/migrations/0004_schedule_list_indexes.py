@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('companies', '0002_company_updated_at'),
+        ('schedules', '0003_menu_plans'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='schedule',
+            index=models.Index(fields=['company', 'is_active', 'end_date'], name='schedules_company_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='schedule',
+            index=models.Index(fields=['end_date', 'start_date'], name='schedules_schedule_dates_idx'),
+        ),
+    ]
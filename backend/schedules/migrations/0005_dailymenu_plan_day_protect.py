@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-17 17:58
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('schedules', '0004_schedule_list_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='dailymenu',
+            name='plan_day',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='daily_menus', to='schedules.menuplanday'),
+        ),
+    ]
@@ -1,6 +1,50 @@
 from django.db import models
 from django.core.exceptions import ValidationError
 
+class MenuPlan(models.Model):
+    """
+    A master menu plan published to the schedules of many companies.
+    Its days hold the foods and sides once; the companies' daily menus
+    point at them instead of copying the ManyToMany rows.
+    """
+    name = models.CharField(max_length=255)
+    start_date = models.DateField()
+    end_date = models.DateField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def clean(self):
+        if self.start_date > self.end_date:
+            raise ValidationError("End date cannot be before the start date.")
+
+    def __str__(self):
+        return self.name
+
+class MenuPlanDay(models.Model):
+    plan = models.ForeignKey(
+        MenuPlan,
+        on_delete=models.CASCADE,
+        related_name='days'
+    )
+    date = models.DateField()
+    available_foods = models.ManyToManyField(
+        'menu.FoodItem',
+        related_name='plan_days',
+        blank=True
+    )
+    available_sides = models.ManyToManyField(
+        'menu.SideDish',
+        related_name='plan_days',
+        blank=True
+    )
+
+    class Meta:
+        unique_together = ('plan', 'date')
+        ordering = ['date']
+
+    def __str__(self):
+        return f"Plan menu for {self.date} ({self.plan.name})"
+
 class Schedule(models.Model):
     name = models.CharField(max_length=255)
     company = models.ForeignKey(
@@ -11,6 +55,22 @@ class Schedule(models.Model):
     start_date = models.DateField()
     end_date = models.DateField()
     is_active = models.BooleanField(default=True)
+    # Set when the schedule was published from a master plan
+    plan = models.ForeignKey(
+        MenuPlan,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='schedules'
+    )
+
+    class Meta:
+        indexes = [
+            # The schedule list filters and the company menu lookup start with the company
+            models.Index(fields=['company', 'is_active', 'end_date'], name='schedules_company_active_idx'),
+            # Schedules running on a date, across all companies
+            models.Index(fields=['end_date', 'start_date'], name='schedules_schedule_dates_idx'),
+        ]
 
     def clean(self):
         # Ensures that the start date is not after the end date.
@@ -37,11 +97,25 @@ class DailyMenu(models.Model):
         related_name='daily_menus',
         blank=True
     )
+    # A menu published from a plan offers the plan day's foods and sides
+    # and has no ManyToMany rows of its own. Plan days are removed through
+    # plans.remove_plan_days(), which keeps the menus that have orders
+    plan_day = models.ForeignKey(
+        MenuPlanDay,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name='daily_menus'
+    )
 
     class Meta:
         # Ensures that there is only one menu per day for a given schedule
         unique_together = ('schedule', 'date')
         ordering = ['date']
+        indexes = [
+            # Reports and order filters look menus up by date across all schedules
+            models.Index(fields=['date'], name='schedules_dailymenu_date_idx'),
+        ]
 
     def clean(self):
         # Ensures that the menu's date is within its parent schedule's date range.
@@ -51,5 +125,10 @@ class DailyMenu(models.Model):
                 f"({self.schedule.start_date} to {self.schedule.end_date})."
             )
 
+    @property
+    def menu_source(self):
+        """The row holding the foods and sides this menu offers."""
+        return self.plan_day if self.plan_day_id else self
+
     def __str__(self):
         return f"Menu for {self.date} ({self.schedule.name})"
\ No newline at end of file
@@ -0,0 +1,127 @@
+# schedules/plans.py
+
+from django.db import transaction
+
+from .models import DailyMenu, MenuPlanDay, Schedule
+from . import menu_cache
+
+FoodLink = MenuPlanDay.available_foods.through
+SideLink = MenuPlanDay.available_sides.through
+MenuFoodLink = DailyMenu.available_foods.through
+MenuSideLink = DailyMenu.available_sides.through
+
+
+@transaction.atomic
+def set_plan_days(plan, days, replace=False):
+    """
+    Define the foods and sides of a plan's days. `days` maps dates to
+    MenuTemplates; with `replace`, plan days missing from it are removed
+    with remove_plan_days().
+
+    The links of all given days are rewritten by one delete and one bulk
+    insert per relation, then the plan is propagated with sync_plan().
+    Companies see the new foods at once, as their menus point at the days.
+    """
+    if replace:
+        remove_plan_days(plan.days.exclude(date__in=list(days)))
+
+    plan_days = {day.date: day for day in plan.days.filter(date__in=list(days))}
+    new_days = [MenuPlanDay(plan=plan, date=date) for date in days if date not in plan_days]
+    MenuPlanDay.objects.bulk_create(new_days)
+    plan_days.update((day.date, day) for day in new_days)
+
+    day_ids = [day.pk for day in plan_days.values()]
+    FoodLink.objects.filter(menuplanday_id__in=day_ids).delete()
+    SideLink.objects.filter(menuplanday_id__in=day_ids).delete()
+    FoodLink.objects.bulk_create([
+        FoodLink(menuplanday_id=plan_days[date].pk, fooditem_id=food_id)
+        for date, template in days.items() for food_id in set(template.food_ids)
+    ], batch_size=5000)
+    SideLink.objects.bulk_create([
+        SideLink(menuplanday_id=plan_days[date].pk, sidedish_id=side_id)
+        for date, template in days.items() for side_id in set(template.side_ids)
+    ], batch_size=5000)
+
+    sync_plan(plan)
+
+
+@transaction.atomic
+def publish_plan(plan, company_ids):
+    """
+    Subscribe companies to a plan: each company without a schedule for it
+    gets one (a single bulk insert for all of them), then sync_plan() gives
+    every subscribed schedule its menus. Returns the new schedules.
+    """
+    subscribed = set(plan.schedules.values_list('company_id', flat=True))
+    schedules = Schedule.objects.bulk_create([
+        Schedule(name=plan.name, company_id=company_id, start_date=plan.start_date,
+                 end_date=plan.end_date, plan=plan)
+        for company_id in sorted(set(company_ids) - subscribed)
+    ])
+    sync_plan(plan)
+    return schedules
+
+
+def remove_plan_days(days):
+    """
+    Delete plan days together with the companies' menus published from
+    them. Menus that already have orders are kept as the company's own copy
+    of the day, as editing one does, so the orders keep their menu.
+    """
+    ordered = dict(
+        DailyMenu.objects.filter(plan_day__in=days, orders__isnull=False)
+        .values_list('id', 'plan_day_id').distinct()
+    )
+    if ordered:
+        foods = FoodLink.objects.filter(menuplanday_id__in=set(ordered.values())).values_list('menuplanday_id', 'fooditem_id')
+        sides = SideLink.objects.filter(menuplanday_id__in=set(ordered.values())).values_list('menuplanday_id', 'sidedish_id')
+        menus_of_day = {}
+        for menu_id, day_id in ordered.items():
+            menus_of_day.setdefault(day_id, []).append(menu_id)
+        MenuFoodLink.objects.bulk_create([
+            MenuFoodLink(dailymenu_id=menu_id, fooditem_id=food_id)
+            for day_id, food_id in foods for menu_id in menus_of_day[day_id]
+        ], batch_size=5000)
+        MenuSideLink.objects.bulk_create([
+            MenuSideLink(dailymenu_id=menu_id, sidedish_id=side_id)
+            for day_id, side_id in sides for menu_id in menus_of_day[day_id]
+        ], batch_size=5000)
+        DailyMenu.objects.filter(pk__in=list(ordered)).update(plan_day=None)
+
+    DailyMenu.objects.filter(plan_day__in=days).delete()
+    days.delete()
+
+
+@transaction.atomic
+def delete_plan(plan):
+    """
+    Delete a plan and its days. The subscribed schedules stay with their
+    companies, keeping the menus that have orders (see remove_plan_days()).
+    """
+    company_ids = set(plan.schedules.values_list('company_id', flat=True))
+    remove_plan_days(plan.days.all())
+    plan.delete()
+    menu_cache.invalidate_companies(company_ids)
+
+
+def sync_plan(plan):
+    """
+    Bring every schedule published from the plan in line with it using
+    set-based statements: schedule ranges follow the plan, days outside
+    its range are removed with remove_plan_days(), and each schedule gets
+    a menu for every plan day it is missing (one INSERT that skips dates
+    the company already has).
+    """
+    remove_plan_days(plan.days.exclude(date__range=(plan.start_date, plan.end_date)))
+    schedules = plan.schedules.all()
+    schedules.update(start_date=plan.start_date, end_date=plan.end_date)
+
+    subscribers = dict(schedules.values_list('id', 'company_id'))
+    days = list(plan.days.values_list('id', 'date'))
+    DailyMenu.objects.bulk_create([
+        DailyMenu(schedule_id=schedule_id, date=date, plan_day_id=day_id)
+        for schedule_id in subscribers for day_id, date in days
+    ], batch_size=2000, ignore_conflicts=True)
+
+    # Bulk statements send no signals, so expire the cached menus here
+    menu_cache.invalidate_companies(set(subscribers.values()))
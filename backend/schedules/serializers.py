@@ -1,5 +1,8 @@
 from rest_framework import serializers
-from .models import Schedule, DailyMenu
+from .models import Schedule, DailyMenu, MenuPlan, MenuPlanDay
+from .generation import MAX_GENERATION_DAYS
+from companies.models import Company
+from menu.models import FoodItem, SideDish
 from menu.serializers import FoodItemSerializer, SideDishSerializer
 
 # --- Serializers for DailyMenu ---
@@ -19,15 +22,42 @@ class DailyMenuWriteSerializer(serializers.ModelSerializer):
             )
         return value
 
+    def update(self, instance, validated_data):
+        # Editing a menu published from a plan turns it into the company's own copy
+        if instance.plan_day_id is not None:
+            plan_day = instance.plan_day
+            validated_data.setdefault('available_foods', list(plan_day.available_foods.all()))
+            validated_data.setdefault('available_sides', list(plan_day.available_sides.all()))
+            instance.plan_day = None
+        return super().update(instance, validated_data)
+
 class DailyMenuReadSerializer(serializers.ModelSerializer):
-    """Serializer for reading DailyMenu instances with nested food details."""
-    available_foods = FoodItemSerializer(many=True, read_only=True)
-    available_sides = SideDishSerializer(many=True, read_only=True)
+    """
+    Serializer for reading DailyMenu instances with nested food details.
+    Menus published from a plan show the plan day's foods and sides.
+    """
+    available_foods = serializers.SerializerMethodField()
+    available_sides = serializers.SerializerMethodField()
 
     class Meta:
         model = DailyMenu
         fields = ['id', 'date', 'available_foods', 'available_sides']
 
+    def get_available_foods(self, menu):
+        return FoodItemSerializer(menu.menu_source.available_foods.all(), many=True, context=self.context).data
+
+    def get_available_sides(self, menu):
+        return SideDishSerializer(menu.menu_source.available_sides.all(), many=True, context=self.context).data
+
+
+# Prefetches covering both sources of a menu's foods and sides
+DAILY_MENU_PREFETCH = [
+    'available_foods__category',
+    'available_sides',
+    'plan_day__available_foods__category',
+    'plan_day__available_sides',
+]
+
 
 # --- Serializer for Schedule ---
 
@@ -40,4 +70,172 @@ class ScheduleSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'name', 'company', 'company_name', 'start_date', 'end_date', 'is_active', 'daily_menus'
         ]
-        extra_kwargs = {'company': {'write_only': True}}
\ No newline at end of file
+        extra_kwargs = {'company': {'write_only': True}}
+
+class ScheduleSummarySerializer(serializers.ModelSerializer):
+    """
+    A schedule list row without its daily menus. `menu_count` comes from an
+    annotation on the queryset.
+    """
+    company_name = serializers.CharField(source='company.name', read_only=True)
+    menu_count = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = Schedule
+        fields = [
+            'id', 'name', 'company', 'company_name', 'start_date', 'end_date', 'is_active', 'plan', 'menu_count'
+        ]
+        read_only_fields = fields
+
+# --- Serializers for schedule generation ---
+
+class MenuTemplateSerializer(serializers.Serializer):
+    """The food and side dish ids offered on a generated day."""
+    foods = serializers.ListField(child=serializers.IntegerField(), allow_empty=False)
+    sides = serializers.ListField(child=serializers.IntegerField(), required=False, default=list)
+
+
+class ScheduleGenerateSerializer(serializers.Serializer):
+    """
+    Builds the daily menus of a period, either into new schedules (one per
+    company in `company_ids`, named `name`) or into the existing schedule
+    `schedule_id`. Exactly one rule chooses each day's menu: a `weekly`
+    pattern keyed by weekday (0 = Monday), a `rotation` of templates, or
+    `copy_from` an earlier schedule.
+    """
+    company_ids = serializers.ListField(child=serializers.IntegerField(), required=False, allow_empty=False)
+    name = serializers.CharField(max_length=255, required=False)
+    schedule_id = serializers.IntegerField(required=False)
+    start_date = serializers.DateField(required=False)
+    end_date = serializers.DateField(required=False)
+    skip_weekdays = serializers.ListField(
+        child=serializers.IntegerField(min_value=0, max_value=6), required=False, default=list
+    )
+    holidays = serializers.ListField(child=serializers.DateField(), required=False, default=list)
+    weekly = serializers.DictField(child=MenuTemplateSerializer(), required=False)
+    rotation = MenuTemplateSerializer(many=True, required=False, allow_empty=False)
+    copy_from = serializers.IntegerField(required=False)
+
+    def validate_company_ids(self, value):
+        validate_companies_exist(value)
+        return value
+
+    def validate_weekly(self, value):
+        try:
+            pattern = {int(weekday): template for weekday, template in value.items()}
+        except ValueError:
+            raise serializers.ValidationError("Weekdays must be numbers from 0 (Monday) to 6 (Sunday).")
+        if not all(0 <= weekday <= 6 for weekday in pattern):
+            raise serializers.ValidationError("Weekdays must be numbers from 0 (Monday) to 6 (Sunday).")
+        return pattern
+
+    def validate(self, data):
+        if ('company_ids' in data) == ('schedule_id' in data):
+            raise serializers.ValidationError("Provide exactly one of company_ids or schedule_id.")
+        if sum(key in data for key in ('weekly', 'rotation', 'copy_from')) != 1:
+            raise serializers.ValidationError("Provide exactly one of weekly, rotation or copy_from.")
+
+        if 'schedule_id' in data:
+            schedule = Schedule.objects.filter(pk=data['schedule_id']).first()
+            if schedule is None:
+                raise serializers.ValidationError({'schedule_id': "Schedule not found."})
+            data['schedule'] = schedule
+            data.setdefault('start_date', schedule.start_date)
+            data.setdefault('end_date', schedule.end_date)
+            if data['start_date'] < schedule.start_date or data['end_date'] > schedule.end_date:
+                raise serializers.ValidationError("The period must lie within the schedule's date range.")
+        elif not data.get('name') or 'start_date' not in data or 'end_date' not in data:
+            raise serializers.ValidationError("New schedules need a name, a start_date and an end_date.")
+
+        if data['end_date'] < data['start_date']:
+            raise serializers.ValidationError("End date cannot be before the start date.")
+        if (data['end_date'] - data['start_date']).days >= MAX_GENERATION_DAYS:
+            raise serializers.ValidationError(f"A generation cannot cover more than {MAX_GENERATION_DAYS} days.")
+
+        if 'copy_from' in data:
+            data['source'] = Schedule.objects.filter(pk=data['copy_from']).first()
+            if data['source'] is None:
+                raise serializers.ValidationError({'copy_from': "Schedule not found."})
+        else:
+            templates = data['rotation'] if 'rotation' in data else list(data['weekly'].values())
+            validate_menu_items(templates)
+        return data
+
+
+def validate_menu_items(templates):
+    """Check every food and side dish referenced by the templates with one query per model."""
+    food_ids = {food_id for template in templates for food_id in template['foods']}
+    side_ids = {side_id for template in templates for side_id in template['sides']}
+    missing_foods = food_ids - set(FoodItem.objects.filter(pk__in=food_ids).values_list('id', flat=True))
+    missing_sides = side_ids - set(SideDish.objects.filter(pk__in=side_ids).values_list('id', flat=True))
+    if missing_foods or missing_sides:
+        raise serializers.ValidationError(
+            f"Unknown food items {sorted(missing_foods)} or side dishes {sorted(missing_sides)}."
+        )
+
+
+def validate_companies_exist(company_ids):
+    company_ids = set(company_ids)
+    found = set(Company.objects.filter(pk__in=company_ids).values_list('id', flat=True))
+    if found != company_ids:
+        raise serializers.ValidationError(f"Unknown companies: {sorted(company_ids - found)}.")
+
+
+# --- Serializers for menu plans ---
+
+class MenuPlanDaySerializer(serializers.ModelSerializer):
+    """A plan day with the ids of its foods and side dishes."""
+    class Meta:
+        model = MenuPlanDay
+        fields = ['id', 'date', 'available_foods', 'available_sides']
+        read_only_fields = fields
+
+
+class MenuPlanSerializer(serializers.ModelSerializer):
+    days = MenuPlanDaySerializer(many=True, read_only=True)
+    company_ids = serializers.SerializerMethodField()
+
+    class Meta:
+        model = MenuPlan
+        fields = ['id', 'name', 'start_date', 'end_date', 'days', 'company_ids', 'updated_at']
+
+    def get_company_ids(self, plan):
+        return sorted(schedule.company_id for schedule in plan.schedules.all())
+
+    def validate(self, data):
+        start_date = data.get('start_date', getattr(self.instance, 'start_date', None))
+        end_date = data.get('end_date', getattr(self.instance, 'end_date', None))
+        if start_date > end_date:
+            raise serializers.ValidationError("End date cannot be before the start date.")
+        return data
+
+
+class MenuPlanDayItemSerializer(MenuTemplateSerializer):
+    date = serializers.DateField()
+
+
+class MenuPlanDaysSerializer(serializers.Serializer):
+    """
+    The foods and sides of some plan days. With `replace`, the plan's other
+    days are removed.
+    """
+    days = MenuPlanDayItemSerializer(many=True)
+    replace = serializers.BooleanField(default=False)
+
+    def validate_days(self, value):
+        plan = self.context['plan']
+        dates = [item['date'] for item in value]
+        if len(set(dates)) != len(dates):
+            raise serializers.ValidationError("Each date may appear only once.")
+        if any(not (plan.start_date <= date <= plan.end_date) for date in dates):
+            raise serializers.ValidationError("Dates must lie within the plan's date range.")
+        validate_menu_items(value)
+        return value
+
+
+class PublishPlanSerializer(serializers.Serializer):
+    company_ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False)
+
+    def validate_company_ids(self, value):
+        validate_companies_exist(value)
+        return value
@@ -0,0 +1,56 @@
+# schedules/signals.py
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+from companies.models import Company
+from menu.models import FoodCategory, FoodItem, SideDish
+from core.cache import invalidate_on_change
+from .models import Schedule, DailyMenu, MenuPlanDay
+from . import menu_cache
+
+# The company name is part of the rendered menu
+invalidate_on_change(Company, lambda company: menu_cache.company_tags(company.pk))
+
+# Foods, side dishes and categories are shared, so every company's menu expires
+for catalog_model in (FoodCategory, FoodItem, SideDish):
+    invalidate_on_change(catalog_model, lambda instance: [menu_cache.CATALOG_TAG])
+
+
+@receiver([post_save, post_delete], sender=Schedule)
+def expire_schedule(sender, instance, **kwargs):
+    menu_cache.invalidate_companies([instance.company_id])
+
+
+@receiver([post_save, post_delete], sender=DailyMenu)
+def expire_daily_menu(sender, instance, **kwargs):
+    menu_cache.invalidate_companies(
+        Schedule.objects.filter(pk=instance.schedule_id).values_list('company_id', flat=True)
+    )
+
+
+@receiver(m2m_changed, sender=DailyMenu.available_foods.through)
+@receiver(m2m_changed, sender=DailyMenu.available_sides.through)
+def expire_menu_items(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Expire the menus whose foods or sides were changed, from either side of the relation.
+    """
+    if not action.startswith('post_'):
+        return
+    if reverse:
+        # A food or side dish was added to or removed from menus: expire them all
+        menu_cache.invalidate_catalog()
+        return
+    menu_cache.invalidate_companies([instance.schedule.company_id])
+
+
+@receiver(m2m_changed, sender=MenuPlanDay.available_foods.through)
+@receiver(m2m_changed, sender=MenuPlanDay.available_sides.through)
+def expire_plan_items(sender, instance, action, reverse, **kwargs):
+    """
+    A plan day's foods or sides changed: expire the menus of every company subscribed to the plan.
+    """
+    if not action.startswith('post_'):
+        return
+    if reverse:
+        menu_cache.invalidate_catalog()
+        return
+    menu_cache.invalidate_companies(Schedule.objects.filter(plan_id=instance.plan_id).values_list('company_id', flat=True))
@@ -0,0 +1,106 @@
+# schedules/tests/test_generation.py
+
+from decimal import Decimal
+from datetime import date
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from users.models import User
+from companies.models import Company
+from menu.models import FoodItem, SideDish
+from schedules.models import Schedule, DailyMenu
+from schedules.availability import load_menu_availability
+
+
+class ScheduleGenerationTests(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(username='gen_admin', password='password123', role=User.Role.SUPER_ADMIN)
+        self.kebab = FoodItem.objects.create(name="Kebab", description="", price=Decimal('150.00'))
+        self.pasta = FoodItem.objects.create(name="Pasta", description="", price=Decimal('90.00'))
+        self.salad = SideDish.objects.create(name="Salad", price=Decimal('25.00'))
+        self.companies = [Company.objects.create(name=f"Gen {i}") for i in range(3)]
+        self.client.force_authenticate(user=self.admin)
+        self.url = reverse('schedule-generate')
+
+    def _menus(self, schedule_id):
+        menus = list(DailyMenu.objects.filter(schedule_id=schedule_id).order_by('date'))
+        availability = load_menu_availability(menu.id for menu in menus)
+        return [(menu.date, set(availability[menu.id][0]), set(availability[menu.id][1])) for menu in menus]
+
+    def test_rotation_for_many_companies_skips_fridays_and_holidays(self):
+        """VERIFY: One request builds a month for every company, rotating templates over service days."""
+        response = self.client.post(self.url, {
+            'company_ids': [company.id for company in self.companies],
+            'name': "June",
+            'start_date': '2025-06-01', 'end_date': '2025-06-30',
+            'skip_weekdays': [4],
+            'holidays': ['2025-06-02'],
+            'rotation': [
+                {'foods': [self.kebab.id], 'sides': [self.salad.id]},
+                {'foods': [self.pasta.id]},
+            ],
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        # June 2025 has 30 days, 4 Fridays and the holiday
+        self.assertEqual([row['created'] for row in response.data['schedules']], [25, 25, 25])
+
+        menus = self._menus(response.data['schedules'][0]['id'])
+        self.assertEqual(menus[0], (date(2025, 6, 1), {self.kebab.id}, {self.salad.id}))
+        self.assertEqual(menus[1], (date(2025, 6, 3), {self.pasta.id}, set()))
+        self.assertFalse(any(day.weekday() == 4 for day, _, _ in menus))
+
+    def test_weekly_pattern_into_existing_schedule_keeps_existing_days(self):
+        """VERIFY: Only the pattern's weekdays get menus and days that already have one are skipped."""
+        schedule = Schedule.objects.create(
+            name="Existing", company=self.companies[0], start_date=date(2025, 6, 2), end_date=date(2025, 6, 15)
+        )
+        DailyMenu.objects.create(schedule=schedule, date=date(2025, 6, 2))
+        response = self.client.post(self.url, {
+            'schedule_id': schedule.id,
+            'weekly': {'0': {'foods': [self.kebab.id]}, '2': {'foods': [self.pasta.id], 'sides': [self.salad.id]}},
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['schedules'][0], {
+            'id': schedule.id, 'company': self.companies[0].id, 'created': 3, 'skipped': 1
+        })
+        self.assertEqual([day for day, _, _ in self._menus(schedule.id)],
+                         [date(2025, 6, 2), date(2025, 6, 4), date(2025, 6, 9), date(2025, 6, 11)])
+
+    def test_copy_of_previous_schedule_and_constant_query_count(self):
+        """VERIFY: Copying repeats the source menus in order, at the same query cost for one or many companies."""
+        source = Schedule.objects.create(
+            name="May", company=self.companies[0], start_date=date(2025, 5, 1), end_date=date(2025, 5, 2)
+        )
+        for day, food in ((1, self.kebab), (2, self.pasta)):
+            DailyMenu.objects.create(schedule=source, date=date(2025, 5, day)).available_foods.add(food)
+
+        def payload(companies):
+            return {'company_ids': [c.id for c in companies], 'name': "Copy",
+                    'start_date': '2025-07-01', 'end_date': '2025-07-05', 'copy_from': source.id}
+
+        with CaptureQueriesContext(connection) as small:
+            self.client.post(self.url, payload(self.companies[:1]), format='json')
+        with CaptureQueriesContext(connection) as large:
+            response = self.client.post(self.url, payload(self.companies), format='json')
+        self.assertEqual(len(small.captured_queries), len(large.captured_queries))
+
+        foods = [food_ids for _, food_ids, _ in self._menus(response.data['schedules'][2]['id'])]
+        self.assertEqual(foods, [{self.kebab.id}, {self.pasta.id}] * 2 + [{self.kebab.id}])
+
+    def test_invalid_requests_write_nothing(self):
+        """VERIFY: Unknown items, two rules at once or non-admins are rejected."""
+        base = {'company_ids': [self.companies[0].id], 'name': "Bad", 'start_date': '2025-06-01', 'end_date': '2025-06-30'}
+        response = self.client.post(self.url, {**base, 'rotation': [{'foods': [999]}]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.post(
+            self.url, {**base, 'rotation': [{'foods': [self.kebab.id]}], 'copy_from': 1}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.client.force_authenticate(user=User.objects.create_user(username='gen_emp', password='password123'))
+        response = self.client.post(self.url, {**base, 'rotation': [{'foods': [self.kebab.id]}]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(Schedule.objects.exists())
@@ -0,0 +1,107 @@
+# schedules/tests/test_menu_cache.py
+
+import json
+from decimal import Decimal
+from datetime import timedelta
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from users.models import User
+from companies.models import Company
+from menu.models import FoodCategory, FoodItem, SideDish
+from schedules.models import Schedule, DailyMenu
+from core.tests.caches import SHARED_LOCMEM_CACHES
+
+
+@override_settings(CACHES=SHARED_LOCMEM_CACHES)
+class CompanyMenuCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        today = timezone.localdate()
+        self.company = Company.objects.create(name="Menu Co")
+        self.employee = User.objects.create_user(username='menu_emp', password='password123', company=self.company)
+        self.colleague = User.objects.create_user(username='menu_colleague', password='password123', company=self.company)
+
+        category = FoodCategory.objects.create(name="Mains")
+        self.kebab = FoodItem.objects.create(name="Kebab", description="", price=Decimal('150.00'), category=category)
+        self.salad = SideDish.objects.create(name="Salad", price=Decimal('25.00'))
+        self.schedule = Schedule.objects.create(
+            name="This week", company=self.company, start_date=today, end_date=today + timedelta(days=6)
+        )
+        for offset in range(3):
+            menu = DailyMenu.objects.create(schedule=self.schedule, date=today + timedelta(days=offset))
+            menu.available_foods.add(self.kebab)
+            menu.available_sides.add(self.salad)
+
+        self.url = reverse('my-company-menu')
+
+    def test_menu_is_rendered_once_per_company(self):
+        """VERIFY: A colleague's request is served from the first rendering without touching the menu tables."""
+        self.client.force_authenticate(user=self.employee)
+        first = self.client.get(self.url)
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        menus = json.loads(first.content)[0]['daily_menus']
+        self.assertEqual(len(menus), 3)
+        self.assertEqual(menus[0]['available_foods'][0]['category_name'], "Mains")
+
+        self.client.force_authenticate(user=self.colleague)
+        with CaptureQueriesContext(connection) as queries:
+            second = self.client.get(self.url)
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second['ETag'], first['ETag'])
+        self.assertFalse([q for q in queries.captured_queries if 'schedules_' in q['sql'] or 'menu_' in q['sql']])
+
+    def test_conditional_requests_get_304(self):
+        """VERIFY: A matching ETag or an up to date If-Modified-Since returns 304 with no body."""
+        self.client.force_authenticate(user=self.employee)
+        first = self.client.get(self.url)
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b'')
+
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=first['Last-Modified'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_writes_expire_the_rendering(self):
+        """VERIFY: Changing a daily menu or a food item produces a new rendering and ETag."""
+        self.client.force_authenticate(user=self.employee)
+        etag = self.client.get(self.url)['ETag']
+
+        menu = self.schedule.daily_menus.first()
+        with self.captureOnCommitCallbacks(execute=True):
+            menu.available_foods.remove(self.kebab)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(json.loads(response.content)[0]['daily_menus'][0]['available_foods'], [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.kebab.name = "Chicken kebab"
+            self.kebab.save()
+        menus = json.loads(self.client.get(self.url).content)[0]['daily_menus']
+        self.assertEqual(menus[1]['available_foods'][0]['name'], "Chicken kebab")
+
+    def test_per_process_cache_renders_every_request(self):
+        """VERIFY: With a per-process cache, a menu change made through another worker is served at once."""
+        self.client.force_authenticate(user=self.employee)
+        with override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}):
+            etag = self.client.get(self.url)['ETag']
+            # Committed by another worker: its tag bump only reached that worker's cache
+            self.schedule.daily_menus.first().available_foods.remove(self.kebab)
+
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(json.loads(response.content)[0]['daily_menus'][0]['available_foods'], [])
+
+    def test_user_without_company_gets_empty_list(self):
+        """VERIFY: Users without a company still get an empty menu list."""
+        self.client.force_authenticate(user=User.objects.create_user(username='menu_loner', password='password123'))
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [])
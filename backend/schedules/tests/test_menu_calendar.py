@@ -0,0 +1,101 @@
+# schedules/tests/test_menu_calendar.py
+
+from decimal import Decimal
+from datetime import date, timedelta
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from users.models import User
+from companies.models import Company
+from menu.models import FoodCategory, FoodItem, SideDish
+from orders.models import Order
+from schedules.models import MenuPlan, Schedule, DailyMenu
+from schedules.generation import MenuTemplate
+from schedules.plans import publish_plan, set_plan_days
+
+
+class MenuCalendarTests(APITestCase):
+    def setUp(self):
+        self.company = Company.objects.create(name="Calendar Co")
+        self.employee = User.objects.create_user(
+            username='calendar_employee', password='password123', role=User.Role.EMPLOYEE, company=self.company
+        )
+        category = FoodCategory.objects.create(name="Main")
+        self.kebab = FoodItem.objects.create(name="Kebab", description="", price=Decimal('150.00'), category=category)
+        self.pasta = FoodItem.objects.create(name="Pasta", description="", price=Decimal('90.00'))
+        self.salad = SideDish.objects.create(name="Salad", price=Decimal('25.00'))
+        self.schedule = Schedule.objects.create(
+            name="June", company=self.company, start_date=date(2025, 6, 1), end_date=date(2025, 6, 30)
+        )
+        self.menus = [DailyMenu.objects.create(schedule=self.schedule, date=date(2025, 6, day)) for day in (2, 3)]
+        self.menus[0].available_foods.set([self.kebab, self.pasta])
+        self.menus[0].available_sides.set([self.salad])
+        self.menus[1].available_foods.set([self.kebab])
+        self.order = Order.objects.create(user=self.employee, daily_menu=self.menus[0], food_item=self.kebab)
+        self.client.force_authenticate(user=self.employee)
+        self.url = reverse('menu-calendar')
+
+    def _get(self, **params):
+        return self.client.get(self.url, {'from': '2025-06-01', 'to': '2025-06-30', **params})
+
+    def test_days_reference_shared_item_details(self):
+        """VERIFY: Days carry ids and the user's order; foods and sides are described once."""
+        response = self._get()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        days = response.data['days']
+        self.assertEqual([day['date'] for day in days], [date(2025, 6, 2), date(2025, 6, 3)])
+        self.assertEqual(days[0]['foods'], sorted([self.kebab.id, self.pasta.id]))
+        self.assertEqual(days[0]['sides'], [self.salad.id])
+        self.assertEqual((days[0]['order'], days[0]['order_status']), (self.order.id, Order.OrderStatus.PLACED))
+        self.assertIsNone(days[1]['order'])
+
+        self.assertEqual(set(response.data['foods']), {self.kebab.id, self.pasta.id})
+        kebab = response.data['foods'][self.kebab.id]
+        self.assertEqual((kebab['name'], kebab['price'], kebab['category_name']), ("Kebab", '150.00', "Main"))
+        self.assertEqual(response.data['sides'][self.salad.id]['name'], "Salad")
+
+    def test_query_count_does_not_grow_with_items(self):
+        """VERIFY: Four queries build the calendar, however many items and days it has."""
+        with CaptureQueriesContext(connection) as small:
+            self._get()
+        extra = [FoodItem.objects.create(name=f"Extra {i}", description="", price=Decimal('10.00')) for i in range(10)]
+        for offset in range(10):
+            menu = DailyMenu.objects.create(schedule=self.schedule, date=date(2025, 6, 10) + timedelta(days=offset))
+            menu.available_foods.set(extra)
+        with CaptureQueriesContext(connection) as large:
+            response = self._get()
+        self.assertEqual(len(response.data['days']), 12)
+        self.assertEqual(len(small.captured_queries), len(large.captured_queries))
+        # Authentication is forced, so every query is the calendar's own
+        self.assertEqual(len(large.captured_queries), 4)
+
+    def test_plan_menus_and_inactive_schedules(self):
+        """VERIFY: Menus published from a plan are included, inactive schedules are not."""
+        Schedule.objects.filter(pk=self.schedule.pk).update(is_active=False)
+        plan = MenuPlan.objects.create(name="Plan", start_date=date(2025, 6, 1), end_date=date(2025, 6, 30))
+        set_plan_days(plan, {date(2025, 6, 5): MenuTemplate([self.pasta.id], [self.salad.id])})
+        publish_plan(plan, [self.company.id])
+
+        days = self._get().data['days']
+        self.assertEqual([(day['date'], day['foods'], day['sides']) for day in days],
+                         [(date(2025, 6, 5), [self.pasta.id], [self.salad.id])])
+
+    def test_company_scope_and_invalid_windows(self):
+        """VERIFY: Employees only see their company, admins may choose one; bad windows are rejected."""
+        other = User.objects.create_user(
+            username='calendar_other', password='password123', role=User.Role.EMPLOYEE,
+            company=Company.objects.create(name="Other Co")
+        )
+        self.client.force_authenticate(user=other)
+        self.assertEqual(self._get(company_id=self.company.id).data['days'], [])
+
+        admin = User.objects.create_user(username='calendar_admin', password='password123', role=User.Role.SUPER_ADMIN)
+        self.client.force_authenticate(user=admin)
+        self.assertEqual(len(self._get(company_id=self.company.id).data['days']), 2)
+
+        self.assertEqual(self._get(to='2025-05-01').status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self._get(to='2025-09-01').status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self._get(company_id='x').status_code, status.HTTP_400_BAD_REQUEST)
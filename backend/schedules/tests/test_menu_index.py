@@ -0,0 +1,159 @@
+# schedules/tests/test_menu_index.py
+
+import unittest
+from decimal import Decimal
+from datetime import timedelta
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from core.cache import invalidate_tags
+from core.tests.caches import SHARED_LOCMEM_CACHES
+from core.tests.fake_redis import FakeRedisServer
+
+from companies.models import Company
+from menu.models import FoodItem, SideDish
+from schedules.models import MenuPlan, Schedule, DailyMenu
+from schedules.generation import MenuTemplate
+from schedules.plans import set_plan_days, publish_plan
+from schedules.menu_cache import company_tag
+from schedules import menu_index
+
+try:
+    import redis
+except ImportError:  # the shared backend is optional
+    redis = None
+
+
+@override_settings(CACHES=SHARED_LOCMEM_CACHES)
+class MenuIndexTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        menu_index.forget()
+        self.today = timezone.localdate()
+        self.company = Company.objects.create(name="Index Co")
+        self.other_company = Company.objects.create(name="Other Index Co")
+        self.kebab = FoodItem.objects.create(name="Kebab", description="", price=Decimal('150.00'))
+        self.pasta = FoodItem.objects.create(name="Pasta", description="", price=Decimal('90.00'))
+        self.salad = SideDish.objects.create(name="Salad", price=Decimal('25.00'))
+        self.schedule = Schedule.objects.create(
+            name="Index", company=self.company, start_date=self.today - timedelta(days=5),
+            end_date=self.today + timedelta(days=10)
+        )
+        self.past = DailyMenu.objects.create(schedule=self.schedule, date=self.today - timedelta(days=1))
+        self.past.available_foods.set([self.pasta])
+        self.upcoming = DailyMenu.objects.create(schedule=self.schedule, date=self.today + timedelta(days=3))
+        self.upcoming.available_foods.set([self.kebab])
+        self.upcoming.available_sides.set([self.salad])
+
+    def test_warm_lookups_cost_no_queries(self):
+        """VERIFY: Once built, the index answers for the company's upcoming menus without queries."""
+        with self.assertNumQueries(3):
+            index = menu_index.company_index(self.company.id)
+        self.assertEqual(set(index.by_id), {self.upcoming.id})
+
+        with self.assertNumQueries(0):
+            availability = menu_index.menu_availability(self.company.id, [self.upcoming.id])
+        self.assertEqual(availability[self.upcoming.id], ({self.kebab.id}, {self.salad.id}))
+
+    def test_other_menus_fall_back_to_the_database(self):
+        """VERIFY: Past menus and other companies' menus are still answered, from the database."""
+        other = DailyMenu.objects.create(
+            schedule=Schedule.objects.create(
+                name="Other", company=self.other_company, start_date=self.today, end_date=self.today + timedelta(days=5)
+            ),
+            date=self.today + timedelta(days=3),
+        )
+        other.available_foods.set([self.pasta])
+        menu_index.company_index(self.company.id)
+
+        with CaptureQueriesContext(connection) as queries:
+            availability = menu_index.menu_availability(self.company.id, [self.past.id, other.id, self.upcoming.id])
+        self.assertEqual(len(queries.captured_queries), 2)
+        self.assertEqual(availability[self.past.id][0], {self.pasta.id})
+        self.assertEqual(availability[other.id][0], {self.pasta.id})
+        self.assertEqual(availability[self.upcoming.id][0], {self.kebab.id})
+
+    def test_menu_and_schedule_writes_refresh_the_index(self):
+        """VERIFY: Menu item, menu and plan changes are seen by the next lookup."""
+        menu_index.company_index(self.company.id)
+
+        self.upcoming.available_foods.add(self.pasta)
+        self.assertEqual(
+            menu_index.menu_availability(self.company.id, [self.upcoming.id])[self.upcoming.id][0],
+            {self.kebab.id, self.pasta.id}
+        )
+
+        added = DailyMenu.objects.create(schedule=self.schedule, date=self.today + timedelta(days=4))
+        self.assertIn(added.id, menu_index.company_index(self.company.id).by_id)
+
+        plan = MenuPlan.objects.create(name="Plan", start_date=self.today, end_date=self.today + timedelta(days=10))
+        publish_plan(plan, [self.company.id])
+        set_plan_days(plan, {self.today + timedelta(days=6): MenuTemplate([self.pasta.id], [])})
+        plan_menu = DailyMenu.objects.get(plan_day__plan=plan)
+        self.assertEqual(menu_index.company_index(self.company.id).by_id[plan_menu.id].food_ids, {self.pasta.id})
+
+    def test_version_bump_from_another_process_refreshes_the_index(self):
+        """VERIFY: A bumped company tag (a write committed by another worker) rebuilds the index."""
+        index = menu_index.company_index(self.company.id)
+        # update() sends no signals, like a write made by another worker
+        DailyMenu.objects.filter(pk=self.upcoming.pk).update(date=self.today - timedelta(days=2))
+        self.assertIs(menu_index.company_index(self.company.id), index)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_tags(company_tag(self.company.id))
+        self.assertEqual(menu_index.company_index(self.company.id).by_id, {})
+
+
+class MenuIndexWorkerTests(TestCase):
+    """
+    Two cache aliases stand in for the caches of two worker processes. A
+    write made by the second worker, with its tag bump sent to its own
+    cache, must be seen by the first worker's next lookup.
+    """
+
+    def setUp(self):
+        menu_index.forget()
+        today = timezone.localdate()
+        company = Company.objects.create(name="Worker Co")
+        self.company_id = company.id
+        self.kebab = FoodItem.objects.create(name="Kebab", description="", price=Decimal('150.00'))
+        self.pasta = FoodItem.objects.create(name="Pasta", description="", price=Decimal('90.00'))
+        schedule = Schedule.objects.create(name="Workers", company=company, start_date=today, end_date=today + timedelta(days=5))
+        self.menu = DailyMenu.objects.create(schedule=schedule, date=today + timedelta(days=2))
+        self.menu.available_foods.set([self.kebab])
+
+    def _write_in_second_worker(self):
+        # bulk_create sends no signals, so only the second worker's cache is bumped
+        DailyMenu.available_foods.through.objects.bulk_create([
+            DailyMenu.available_foods.through(dailymenu_id=self.menu.id, fooditem_id=self.pasta.id)
+        ])
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_tags(company_tag(self.company_id), using='worker')
+
+    def _foods_in_first_worker(self):
+        return menu_index.menu_availability(self.company_id, [self.menu.id])[self.menu.id][0]
+
+    def test_per_process_caches_read_the_database(self):
+        """VERIFY: With a local-memory cache per worker, orders are validated against the database."""
+        locmem = 'django.core.cache.backends.locmem.LocMemCache'
+        workers = {'default': {'BACKEND': locmem, 'LOCATION': 'worker-1'}, 'worker': {'BACKEND': locmem, 'LOCATION': 'worker-2'}}
+        with override_settings(CACHES=workers):
+            self.assertEqual(self._foods_in_first_worker(), {self.kebab.id})
+            self._write_in_second_worker()
+            self.assertEqual(self._foods_in_first_worker(), {self.kebab.id, self.pasta.id})
+
+    @unittest.skipIf(redis is None, "the redis package is not installed")
+    def test_shared_cache_refreshes_every_worker_index(self):
+        """VERIFY: With a shared cache, the first worker's warm index is rebuilt after the second worker's write."""
+        with FakeRedisServer() as server:
+            backend = {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': server.url}
+            with override_settings(CACHES={'default': backend, 'worker': backend}):
+                self.assertEqual(self._foods_in_first_worker(), {self.kebab.id})
+                with self.assertNumQueries(0):
+                    self._foods_in_first_worker()
+
+                self._write_in_second_worker()
+                self.assertEqual(self._foods_in_first_worker(), {self.kebab.id, self.pasta.id})
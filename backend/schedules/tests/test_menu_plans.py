@@ -0,0 +1,193 @@
+# schedules/tests/test_menu_plans.py
+
+from decimal import Decimal
+from datetime import timedelta
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from users.models import User
+from companies.models import Company
+from menu.models import FoodItem, SideDish
+from orders.models import Order
+from schedules.models import MenuPlan, Schedule, DailyMenu
+from schedules.availability import load_menu_availability
+
+
+class MenuPlanTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.today = timezone.localdate()
+        self.admin = User.objects.create_user(username='plan_admin', password='password123', role=User.Role.SUPER_ADMIN)
+        self.kebab = FoodItem.objects.create(name="Kebab", description="", price=Decimal('15.00'))
+        self.pasta = FoodItem.objects.create(name="Pasta", description="", price=Decimal('12.00'))
+        self.salad = SideDish.objects.create(name="Salad", price=Decimal('3.00'))
+        self.companies = [Company.objects.create(name=f"Plan {i}") for i in range(3)]
+        self.plan = MenuPlan.objects.create(
+            name="Shared", start_date=self.today, end_date=self.today + timedelta(days=9)
+        )
+        self.client.force_authenticate(user=self.admin)
+
+    def _set_days(self, days, replace=False):
+        url = reverse('menu-plan-days', args=[self.plan.id])
+        return self.client.post(url, {'days': days, 'replace': replace}, format='json')
+
+    def _publish(self, companies):
+        url = reverse('menu-plan-publish', args=[self.plan.id])
+        return self.client.post(url, {'company_ids': [company.id for company in companies]}, format='json')
+
+    def _day(self, offset):
+        return (self.today + timedelta(days=offset)).isoformat()
+
+    def test_publish_shares_plan_days_between_companies(self):
+        """VERIFY: Publishing creates a schedule and menus per company, but no per-company food links."""
+        self._set_days([{'date': self._day(3), 'foods': [self.kebab.id], 'sides': [self.salad.id]}])
+        response = self._publish(self.companies)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data['schedules']), 3)
+
+        menus = DailyMenu.objects.filter(schedule__plan=self.plan)
+        self.assertEqual(menus.count(), 3)
+        self.assertFalse(DailyMenu.available_foods.through.objects.exists())
+        availability = load_menu_availability(menu.id for menu in menus)
+        self.assertTrue(all(value == ({self.kebab.id}, {self.salad.id}) for value in availability.values()))
+
+        # Publishing again only subscribes the new companies
+        response = self._publish(self.companies[:1])
+        self.assertEqual(response.data['schedules'], [])
+
+    def test_employee_orders_from_plan_menu(self):
+        """VERIFY: Order validation sees the foods of the plan day behind a company's menu."""
+        self._set_days([{'date': self._day(3), 'foods': [self.kebab.id], 'sides': [self.salad.id]}])
+        self._publish(self.companies[:1])
+        employee = User.objects.create_user(
+            username='plan_employee', password='password123', role=User.Role.EMPLOYEE,
+            company=self.companies[0], budget=Decimal('100.00')
+        )
+        menu = DailyMenu.objects.get(schedule__company=self.companies[0])
+        self.client.force_authenticate(user=employee)
+        url = reverse('order-list')
+        response = self.client.post(url, {'daily_menu': menu.id, 'food_item': self.pasta.id})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.post(url, {'daily_menu': menu.id, 'food_item': self.kebab.id, 'side_dishes': [self.salad.id]})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_plan_changes_reach_every_company(self):
+        """VERIFY: New plan days, changed foods and a shorter range propagate to all subscribers."""
+        self._set_days([{'date': self._day(3), 'foods': [self.kebab.id]}])
+        self._publish(self.companies)
+        company_menu_url = reverse('my-company-menu')
+        employee = User.objects.create_user(
+            username='plan_viewer', password='password123', role=User.Role.EMPLOYEE, company=self.companies[1]
+        )
+        self.client.force_authenticate(user=employee)
+        self.client.get(company_menu_url)
+
+        self.client.force_authenticate(user=self.admin)
+        with self.captureOnCommitCallbacks(execute=True):
+            self._set_days([
+                {'date': self._day(3), 'foods': [self.pasta.id]},
+                {'date': self._day(8), 'foods': [self.kebab.id]},
+            ])
+        self.assertEqual(DailyMenu.objects.filter(schedule__plan=self.plan).count(), 6)
+
+        # The cached company menu shows the new foods
+        self.client.force_authenticate(user=employee)
+        menus = self.client.get(company_menu_url).json()[0]['daily_menus']
+        foods = {menu['date']: [food['name'] for food in menu['available_foods']] for menu in menus}
+        self.assertEqual(foods, {self._day(3): ["Pasta"], self._day(8): ["Kebab"]})
+
+        self.client.force_authenticate(user=self.admin)
+        url = reverse('menu-plan-detail', args=[self.plan.id])
+        response = self.client.patch(url, {'end_date': self._day(5)}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(DailyMenu.objects.filter(schedule__plan=self.plan).count(), 3)
+        self.assertEqual(set(Schedule.objects.values_list('end_date', flat=True)), {self.today + timedelta(days=5)})
+
+    def test_editing_a_company_menu_detaches_it(self):
+        """VERIFY: A company's own edit copies the plan day and leaves the other companies unchanged."""
+        self._set_days([{'date': self._day(3), 'foods': [self.kebab.id], 'sides': [self.salad.id]}])
+        self._publish(self.companies[:2])
+        menu = DailyMenu.objects.get(schedule__company=self.companies[0])
+        schedule = menu.schedule
+
+        url = reverse('schedule-daily-menus-detail', args=[schedule.id, menu.id])
+        response = self.client.patch(url, {'available_foods': [self.pasta.id]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        menu.refresh_from_db()
+        self.assertIsNone(menu.plan_day_id)
+        availability = load_menu_availability(DailyMenu.objects.values_list('id', flat=True))
+        self.assertEqual(availability[menu.id], ({self.pasta.id}, {self.salad.id}))
+        other = DailyMenu.objects.get(schedule__company=self.companies[1])
+        self.assertEqual(availability[other.id], ({self.kebab.id}, {self.salad.id}))
+
+    def _order_on_plan_day(self, offset):
+        employee = User.objects.create_user(
+            username=f'plan_orderer_{offset}', password='password123', role=User.Role.EMPLOYEE,
+            company=self.companies[0], budget=Decimal('100.00')
+        )
+        menu = DailyMenu.objects.get(schedule__company=self.companies[0], date=self._day(offset))
+        self.client.force_authenticate(user=employee)
+        response = self.client.post(
+            reverse('order-list'), {'daily_menu': menu.id, 'food_item': self.kebab.id, 'side_dishes': [self.salad.id]}
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.client.force_authenticate(user=self.admin)
+        return menu
+
+    def test_shrinking_a_plan_keeps_menus_with_orders(self):
+        """VERIFY: Removing an ordered plan day keeps that company's menu as its own copy; other menus go."""
+        self._set_days([{'date': self._day(offset), 'foods': [self.kebab.id], 'sides': [self.salad.id]} for offset in (3, 8)])
+        self._publish(self.companies[:2])
+        menu = self._order_on_plan_day(8)
+
+        url = reverse('menu-plan-detail', args=[self.plan.id])
+        response = self.client.patch(url, {'end_date': self._day(5)}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        menu.refresh_from_db()
+        self.assertIsNone(menu.plan_day_id)
+        self.assertEqual(load_menu_availability([menu.id])[menu.id], ({self.kebab.id}, {self.salad.id}))
+        self.assertEqual(Order.objects.get().daily_menu_id, menu.id)
+        self.assertFalse(DailyMenu.objects.filter(date=self._day(8)).exclude(pk=menu.pk).exists())
+
+        # Replacing the days and deleting the plan keep it as well
+        self._order_on_plan_day(3)
+        self._set_days([{'date': self._day(4), 'foods': [self.kebab.id]}], replace=True)
+        self.assertEqual(DailyMenu.objects.filter(date=self._day(3)).count(), 1)
+        self.assertEqual(self.client.delete(url).status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(
+            set(DailyMenu.objects.values_list('date', 'plan_day')),
+            {(self.today + timedelta(days=3), None), (self.today + timedelta(days=8), None)}
+        )
+        self.assertFalse(Order.objects.filter(daily_menu__isnull=True).exists())
+
+    def test_publish_query_count_does_not_grow_with_companies(self):
+        """VERIFY: Publishing to one company or to several costs the same number of queries."""
+        self._set_days([{'date': self._day(offset), 'foods': [self.kebab.id]} for offset in range(5)])
+        with CaptureQueriesContext(connection) as small:
+            self._publish(self.companies[:1])
+        with CaptureQueriesContext(connection) as large:
+            self._publish(self.companies[1:])
+        self.assertEqual(len(small.captured_queries), len(large.captured_queries))
+
+    def test_invalid_requests_are_rejected(self):
+        """VERIFY: Days outside the plan, unknown companies and non-admins are rejected."""
+        response = self._set_days([{'date': self._day(20), 'foods': [self.kebab.id]}])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.post(
+            reverse('menu-plan-publish', args=[self.plan.id]), {'company_ids': [999]}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        employee = User.objects.create_user(
+            username='plan_intruder', password='password123', role=User.Role.EMPLOYEE, company=self.companies[0]
+        )
+        self.client.force_authenticate(user=employee)
+        self.assertEqual(self._publish(self.companies).status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(Schedule.objects.exists())
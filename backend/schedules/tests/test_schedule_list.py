@@ -0,0 +1,82 @@
+# schedules/tests/test_schedule_list.py
+
+from decimal import Decimal
+from datetime import date, timedelta
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from users.models import User
+from companies.models import Company
+from menu.models import FoodItem
+from schedules.models import Schedule, DailyMenu
+
+
+class ScheduleListTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_user(username='list_admin', password='password123', role=User.Role.SUPER_ADMIN)
+        self.kebab = FoodItem.objects.create(name="Kebab", description="", price=Decimal('150.00'))
+        self.company_a = Company.objects.create(name="List A")
+        self.company_b = Company.objects.create(name="List B")
+        self.june = self._schedule(self.company_a, date(2025, 6, 1), days=30)
+        self.july = self._schedule(self.company_a, date(2025, 7, 1), days=5, is_active=False)
+        self.other = self._schedule(self.company_b, date(2025, 6, 10), days=3)
+        self.client.force_authenticate(user=self.admin)
+        self.url = reverse('schedule-list')
+
+    def _schedule(self, company, start, days, is_active=True):
+        schedule = Schedule.objects.create(
+            name=f"{company.name} {start}", company=company, start_date=start,
+            end_date=start + timedelta(days=days - 1), is_active=is_active
+        )
+        menus = DailyMenu.objects.bulk_create([
+            DailyMenu(schedule=schedule, date=start + timedelta(days=offset)) for offset in range(days)
+        ])
+        DailyMenu.available_foods.through.objects.bulk_create([
+            DailyMenu.available_foods.through(dailymenu_id=menu.pk, fooditem_id=self.kebab.pk) for menu in menus
+        ])
+        return schedule
+
+    def test_list_returns_summary_rows_with_menu_counts(self):
+        """VERIFY: The list has no nested menus, counts them instead, and costs one query."""
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        counts = {row['id']: row['menu_count'] for row in response.data}
+        self.assertEqual(counts, {self.june.id: 30, self.july.id: 5, self.other.id: 3})
+        self.assertNotIn('daily_menus', response.data[0])
+        self.assertEqual(response.data[0]['company_name'], "List A")
+
+    def test_list_cost_does_not_grow_with_menus(self):
+        """VERIFY: Adding schedules and menus does not add list queries."""
+        with CaptureQueriesContext(connection) as before:
+            self.client.get(self.url)
+        self._schedule(self.company_b, date(2025, 8, 1), days=31)
+        cache.clear()
+        with CaptureQueriesContext(connection) as after:
+            self.client.get(self.url)
+        self.assertEqual(len(before.captured_queries), len(after.captured_queries))
+
+    def test_expand_and_detail_nest_daily_menus(self):
+        """VERIFY: ?expand=daily_menus and the detail route return the full menu tree."""
+        response = self.client.get(self.url, {'expand': 'daily_menus', 'company': self.company_b.id})
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data[0]['daily_menus']), 3)
+        self.assertEqual(response.data[0]['daily_menus'][0]['available_foods'][0]['name'], "Kebab")
+
+        response = self.client.get(reverse('schedule-detail', args=[self.june.id]))
+        self.assertEqual(len(response.data['daily_menus']), 30)
+
+    def test_filters(self):
+        """VERIFY: Schedules can be filtered by company, active flag and the day they run on."""
+        def ids(**params):
+            return {row['id'] for row in self.client.get(self.url, params).data}
+
+        self.assertEqual(ids(company=self.company_a.id), {self.june.id, self.july.id})
+        self.assertEqual(ids(is_active='false'), {self.july.id})
+        self.assertEqual(ids(date='2025-06-11'), {self.june.id, self.other.id})
+        self.assertEqual(ids(date='2025-06-11', company=self.company_b.id), {self.other.id})
@@ -3,11 +3,13 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 # vvv ADD THIS LINE vvv
-from .views import ScheduleViewSet, DailyMenuViewSet 
-from .views_user import MyCompanyMenuView
+from .views import ScheduleViewSet, DailyMenuViewSet, MenuPlanViewSet
+from .views_user import MyCompanyMenuView, MenuCalendarView
 
 # Router for the main Schedule endpoint
 router = DefaultRouter()
+# Registered before the schedules, whose detail route would otherwise match 'plans/'
+router.register(r'plans', MenuPlanViewSet, basename='menu-plan')
 router.register(r'', ScheduleViewSet, basename='schedule') # Now this will work
 
 # Manual URL patterns for the nested DailyMenu endpoint
@@ -18,6 +20,7 @@ daily_menu_detail = DailyMenuViewSet.as_view({'get': 'retrieve', 'put': 'update'
 urlpatterns = [
     # User-facing endpoint
     path('my-menu/', MyCompanyMenuView.as_view(), name='my-company-menu'),
+    path('calendar/', MenuCalendarView.as_view(), name='menu-calendar'),
 
     # Admin-facing endpoints
     path('', include(router.urls)),
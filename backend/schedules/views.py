@@ -1,31 +1,117 @@
 # backend/schedules/views.py
 
 from rest_framework import viewsets, status
+from rest_framework.decorators import action
 from rest_framework.response import Response
+from django.db import transaction
+from django.db.models import Count
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
-from .models import Schedule, DailyMenu
+from .models import Schedule, DailyMenu, MenuPlan
 from .serializers import (
     ScheduleSerializer,
+    ScheduleSummarySerializer,
+    ScheduleGenerateSerializer,
+    DAILY_MENU_PREFETCH,
+    MenuPlanSerializer,
+    MenuPlanDaysSerializer,
+    PublishPlanSerializer,
     DailyMenuReadSerializer,
     DailyMenuWriteSerializer,
 )
-from core.permissions import IsSuperAdminOrReadOnly
+from . import generation, plans
+from core.permissions import IsSuperAdmin, IsSuperAdminOrReadOnly
+from core.mixins import ConditionalGetMixin
+from .menu_cache import CATALOG_TAG, SCHEDULES_TAG
 # [NEW] Import DjangoFilterBackend
 from django_filters.rest_framework import DjangoFilterBackend
+from django_filters import rest_framework as filters
 
 
-class ScheduleViewSet(viewsets.ModelViewSet):
+# --- FilterSet for the Schedule View ---
+
+class ScheduleFilter(filters.FilterSet):
+    company = filters.NumberFilter(field_name='company_id')
+    # Schedules running on the given day
+    date = filters.DateFilter(method='filter_date')
+
+    class Meta:
+        model = Schedule
+        fields = ['company', 'is_active', 'plan', 'date']
+
+    def filter_date(self, queryset, name, value):
+        return queryset.filter(start_date__lte=value, end_date__gte=value)
+
+
+class ScheduleViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """
     API endpoint for viewing and managing schedules.
     Only admins can create or modify schedules.
+
+    The list returns summary rows with a menu count; the daily menus and
+    their foods are nested on the detail route, or in the list with
+    ?expand=daily_menus. Since menu counts (and expanded menus) depend on
+    other rows, the list is validated by the schedule and catalog cache tags.
     """
-    queryset = Schedule.objects.prefetch_related(
-        'daily_menus__available_foods',
-        'daily_menus__available_sides'
-    ).select_related('company').all()
+    conditional_tags = [SCHEDULES_TAG, CATALOG_TAG]
+    queryset = Schedule.objects.select_related('company').order_by('-start_date', 'id')
     serializer_class = ScheduleSerializer
     permission_classes = [IsSuperAdminOrReadOnly]
+    filterset_class = ScheduleFilter
+
+    def expands_menus(self):
+        return self.action != 'list' or 'daily_menus' in self.request.query_params.get('expand', '').split(',')
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.expands_menus():
+            return queryset.prefetch_related(*(f'daily_menus__{path}' for path in DAILY_MENU_PREFETCH))
+        return queryset.annotate(menu_count=Count('daily_menus'))
+
+    def get_serializer_class(self):
+        return ScheduleSerializer if self.expands_menus() else ScheduleSummarySerializer
+
+    @action(detail=False, methods=['post'], url_path='generate')
+    def generate(self, request):
+        """
+        Build the daily menus of a whole period in one request, for many new
+        schedules (one per company) or into an existing one. Days that already
+        have a menu are skipped. See ScheduleGenerateSerializer for the rules.
+        """
+        serializer = ScheduleGenerateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        if 'copy_from' in data:
+            rule = generation.copy_rule(data['source'])
+        elif 'rotation' in data:
+            rule = generation.rotation_rule(_templates(data['rotation']))
+        else:
+            rule = generation.weekly_rule(dict(zip(data['weekly'], _templates(data['weekly'].values()))))
+        days = generation.service_days(data['start_date'], data['end_date'], data['skip_weekdays'], data['holidays'])
+
+        with transaction.atomic():
+            if 'schedule' in data:
+                schedules = [data['schedule']]
+            else:
+                schedules = Schedule.objects.bulk_create([
+                    Schedule(name=data['name'], company_id=company_id,
+                             start_date=data['start_date'], end_date=data['end_date'])
+                    for company_id in data['company_ids']
+                ])
+            summary = generation.generate_menus([(schedule, days, rule) for schedule in schedules])
+
+        return Response({
+            "schedules": [
+                {"id": schedule.pk, "company": schedule.company_id,
+                 "created": summary[schedule.pk][0], "skipped": summary[schedule.pk][1]}
+                for schedule in schedules
+            ]
+        }, status=status.HTTP_201_CREATED)
+
+
+def _templates(items):
+    return [generation.MenuTemplate(item['foods'], item['sides']) for item in items]
 
 
 class DailyMenuViewSet(viewsets.ModelViewSet):
@@ -43,7 +129,7 @@ class DailyMenuViewSet(viewsets.ModelViewSet):
         Return only daily menus belonging to the schedule in the URL.
         """
         schedule_pk = self.kwargs['schedule_pk']
-        return DailyMenu.objects.filter(schedule_id=schedule_pk)
+        return DailyMenu.objects.filter(schedule_id=schedule_pk).prefetch_related(*DAILY_MENU_PREFETCH)
 
     def get_serializer_class(self):
         """
@@ -53,20 +139,27 @@ class DailyMenuViewSet(viewsets.ModelViewSet):
             return DailyMenuWriteSerializer
         return DailyMenuReadSerializer
 
+    def get_schedule(self):
+        """
+        The schedule in the URL, fetched once per request.
+        """
+        if not hasattr(self, '_schedule'):
+            self._schedule = get_object_or_404(Schedule, pk=self.kwargs['schedule_pk'])
+        return self._schedule
+
     def get_serializer_context(self):
         """
         Pass the schedule object to the serializer for validation.
         """
         context = super().get_serializer_context()
-        context['schedule'] = get_object_or_404(Schedule, pk=self.kwargs['schedule_pk'])
+        context['schedule'] = self.get_schedule()
         return context
 
     def perform_create(self, serializer):
         """
         Automatically associate the daily menu with the schedule from the URL.
         """
-        schedule = get_object_or_404(Schedule, pk=self.kwargs['schedule_pk'])
-        serializer.save(schedule=schedule)
+        serializer.save(schedule=self.get_schedule())
 
     def create(self, request, *args, **kwargs):
         """
@@ -88,3 +181,49 @@ class DailyMenuViewSet(viewsets.ModelViewSet):
             response['X-Warning'] = "Menu created for a date that is less than one week away."
 
         return response
+
+
+class MenuPlanViewSet(viewsets.ModelViewSet):
+    """
+    API endpoint for master menu plans, which Super Admins define once and
+    publish to many companies. The companies' daily menus share the plan's
+    days, so editing the plan changes every subscribed company's menu.
+    """
+    queryset = MenuPlan.objects.prefetch_related(
+        'days__available_foods', 'days__available_sides', 'schedules'
+    )
+    serializer_class = MenuPlanSerializer
+    permission_classes = [IsSuperAdmin]
+
+    def perform_update(self, serializer):
+        # Date range changes are carried over to the subscribed schedules
+        with transaction.atomic():
+            plans.sync_plan(serializer.save())
+
+    def perform_destroy(self, instance):
+        plans.delete_plan(instance)
+
+    @action(detail=True, methods=['post'])
+    def days(self, request, pk=None):
+        """Set the foods and sides of some (or, with replace, all) of the plan's days."""
+        plan = self.get_object()
+        serializer = MenuPlanDaysSerializer(data=request.data, context={'plan': plan})
+        serializer.is_valid(raise_exception=True)
+        plans.set_plan_days(
+            plan,
+            {item['date']: generation.MenuTemplate(item['foods'], item['sides']) for item in serializer.validated_data['days']},
+            replace=serializer.validated_data['replace'],
+        )
+        return Response(self.get_serializer(self.get_object()).data)
+
+    @action(detail=True, methods=['post'])
+    def publish(self, request, pk=None):
+        """Subscribe companies to the plan; each gets a schedule sharing the plan's menus."""
+        plan = self.get_object()
+        serializer = PublishPlanSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        created = plans.publish_plan(plan, serializer.validated_data['company_ids'])
+        return Response(
+            {"schedules": [{"id": schedule.pk, "company": schedule.company_id} for schedule in created]},
+            status=status.HTTP_201_CREATED
+        )
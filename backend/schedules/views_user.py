@@ -1,32 +1,73 @@
-from rest_framework import generics, permissions
-from rest_framework.response import Response
-from .models import Schedule
-from .serializers import ScheduleSerializer
+from datetime import timedelta
+from django.http import HttpResponse
 from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from rest_framework import permissions
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from users.models import User
+from . import menu_cache, menu_calendar
 
-class MyCompanyMenuView(generics.ListAPIView):
+class MyCompanyMenuView(APIView):
     """
     A read-only endpoint that returns the active schedule(s)
     for the currently authenticated user's company.
+
+    The JSON is rendered once per company (see menu_cache) and shared by all
+    of its employees; the ETag and Last-Modified headers let clients
+    revalidate with a 304 instead of downloading the menu again.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        user = request.user
+        if not user.company_id:
+            return Response([]) # Return empty if user has no company
+
+        payload = menu_cache.get_company_menu(user.company_id, request)
+        etag, last_modified = payload['etag'], int(payload['last_modified'])
+
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = HttpResponse(payload['body'], content_type='application/json')
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        # The menu is per company: shared caches must not serve it, clients must revalidate
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+
+class MenuCalendarView(APIView):
+    """
+    The compact menu calendar of the user's company between ?from= and ?to=
+    (default: the next 31 days): per day the menu id, food and side ids and
+    the user's order, with the foods and sides described once per response.
+    Super Admins pick the company with ?company_id=.
     """
-    serializer_class = ScheduleSerializer
     permission_classes = [permissions.IsAuthenticated]
 
-    def get_queryset(self):
-        user = self.request.user
-        if not user.company:
-            return Schedule.objects.none() # Return empty if user has no company
-
-        today = timezone.now().date()
-        
-        # Find active schedules for the user's company that are currently ongoing
-        queryset = Schedule.objects.filter(
-            company=user.company,
-            is_active=True,
-            start_date__lte=today,
-            end_date__gte=today
-        ).prefetch_related(
-            'daily_menus__available_foods',
-            'daily_menus__available_sides'
-        )
-        return queryset
\ No newline at end of file
+    def get(self, request, *args, **kwargs):
+        today = timezone.localdate()
+        try:
+            start_date = timezone.datetime.fromisoformat(request.query_params.get('from', today.isoformat())).date()
+            end_date = timezone.datetime.fromisoformat(
+                request.query_params.get('to', (start_date + timedelta(days=30)).isoformat())
+            ).date()
+        except ValueError:
+            return Response({"error": "Invalid date format. Use YYYY-MM-DD."}, status=400)
+
+        if end_date < start_date:
+            return Response({"error": "'to' must not be before 'from'."}, status=400)
+        if (end_date - start_date).days >= menu_calendar.MAX_CALENDAR_DAYS:
+            return Response({"error": f"The range cannot exceed {menu_calendar.MAX_CALENDAR_DAYS} days."}, status=400)
+
+        company_id = request.user.company_id
+        if request.user.role == User.Role.SUPER_ADMIN and 'company_id' in request.query_params:
+            company_id = request.query_params['company_id']
+            if not company_id.isdigit():
+                return Response({"error": "Invalid company_id."}, status=400)
+        if not company_id:
+            return Response({'days': [], 'foods': {}, 'sides': {}})
+
+        return Response(menu_calendar.build_calendar(int(company_id), request.user.pk, start_date, end_date, request))
@@ -0,0 +1,119 @@
+# users/allocation.py
+
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import User
+from wallets.models import Wallet, Transaction
+from ledger import journal
+
+
+class InsufficientFunds(Exception):
+    """Raised when a company wallet cannot cover an allocation."""
+
+
+def allocate_budget(wallet, target_user, amount, allocated_by):
+    """
+    Move `amount` from a company wallet to an employee's budget.
+
+    The wallet is debited with a conditional UPDATE ... WHERE balance >= amount,
+    so the database checks the funds and applies the change in one statement;
+    no row is read, locked and written back from Python. A debit that matches
+    no row means the wallet could not cover the amount.
+    Returns the (company balance, employee budget) after the allocation.
+    """
+    with transaction.atomic():
+        debited = Wallet.objects.filter(pk=wallet.pk, balance__gte=amount).update(
+            balance=F('balance') - amount, updated_at=timezone.now()
+        )
+        if not debited:
+            raise InsufficientFunds("Insufficient company funds to perform this allocation.")
+
+        User.objects.filter(pk=target_user.pk).update(budget=F('budget') + amount)
+
+        # Log both sides of the allocation for auditing
+        Transaction.objects.bulk_create([
+            # The withdrawal from the company wallet, by the admin who performed it
+            Transaction(
+                wallet=wallet,
+                user=allocated_by,
+                transaction_type=Transaction.TransactionType.BUDGET_ALLOCATION,
+                amount=-amount,
+                description=f"Allocation to employee {target_user.username}."
+            ),
+            # The "deposit" into the user's budget, for their transaction history
+            Transaction(
+                wallet=wallet,
+                user=target_user,
+                transaction_type=Transaction.TransactionType.BUDGET_ALLOCATION,
+                amount=amount,
+                description=f"Budget allocated by {allocated_by.username}."
+            ),
+        ])
+        journal.record_allocations(
+            wallet.company_id, [(target_user.pk, amount)],
+            created_by=allocated_by, description=f"Allocation to employee {target_user.username}."
+        )
+
+        company_balance = Wallet.objects.values_list('balance', flat=True).get(pk=wallet.pk)
+        budget = User.objects.values_list('budget', flat=True).get(pk=target_user.pk)
+
+    return company_balance, budget
+
+
+def allocate_budgets(wallet, allocations, allocated_by):
+    """
+    Apply many (user, amount) allocations from one company wallet at once.
+
+    The total is checked against the wallet by a single conditional debit,
+    then all budgets are credited by one bulk UPDATE of F() increments and
+    the audit rows and ledger entries are bulk inserted, so the query count
+    does not grow with the number of employees.
+    Returns the company balance after the allocations.
+    """
+    total = sum((amount for _, amount in allocations), Decimal('0.00'))
+
+    with transaction.atomic():
+        debited = Wallet.objects.filter(pk=wallet.pk, balance__gte=total).update(
+            balance=F('balance') - total, updated_at=timezone.now()
+        )
+        if not debited:
+            raise InsufficientFunds(f"Insufficient company funds to allocate {total}.")
+
+        credited = []
+        for user, amount in sorted(allocations, key=lambda allocation: allocation[0].pk):
+            user.budget = F('budget') + amount
+            credited.append(user)
+        User.objects.bulk_update(credited, ['budget'])
+
+        transactions = [
+            Transaction(
+                wallet=wallet,
+                user=allocated_by,
+                transaction_type=Transaction.TransactionType.BUDGET_ALLOCATION,
+                amount=-total,
+                description=f"Bulk allocation to {len(allocations)} employees."
+            )
+        ]
+        transactions += [
+            Transaction(
+                wallet=wallet,
+                user=user,
+                transaction_type=Transaction.TransactionType.BUDGET_ALLOCATION,
+                amount=amount,
+                description=f"Budget allocated by {allocated_by.username}."
+            )
+            for user, amount in allocations
+        ]
+        Transaction.objects.bulk_create(transactions)
+        journal.record_allocations(
+            wallet.company_id, [(user.pk, amount) for user, amount in allocations],
+            created_by=allocated_by, description=f"Bulk allocation by {allocated_by.username}."
+        )
+
+        company_balance = Wallet.objects.values_list('balance', flat=True).get(pk=wallet.pk)
+
+    return company_balance
@@ -104,3 +104,58 @@ class MyTokenObtainPairSerializer(TokenObtainPairSerializer):
         # Add custom claims
         token['role'] = user.role
         return token
+
+
+class BulkAllocationItemSerializer(AllocateBudgetSerializer):
+    """
+    A single employee's allocation inside a bulk allocation request.
+    """
+    user_id = serializers.IntegerField()
+
+
+class BulkAllocateBudgetSerializer(serializers.Serializer):
+    """
+    Validates a bulk budget allocation, given either as an explicit list of
+    (user_id, amount) items or as one amount for every active employee of
+    the company. All target users are resolved with a single query.
+    """
+    allocations = BulkAllocationItemSerializer(many=True, required=False, allow_empty=False, max_length=5000)
+    all_active_employees = serializers.BooleanField(required=False, default=False)
+    amount = serializers.DecimalField(max_digits=10, decimal_places=2, min_value=Decimal('0.01'), required=False)
+
+    def validate(self, data):
+        company = self.context['request'].user.company
+        items = data.get('allocations')
+
+        if data['all_active_employees']:
+            if items is not None or 'amount' not in data:
+                raise serializers.ValidationError(
+                    "Use either 'allocations' or 'all_active_employees' together with 'amount'."
+                )
+            employees = User.objects.filter(company=company, role=User.Role.EMPLOYEE, is_active=True).order_by('pk')
+            resolved = [(employee, data['amount']) for employee in employees]
+            if not resolved:
+                raise serializers.ValidationError("This company has no active employees.")
+        else:
+            if items is None:
+                raise serializers.ValidationError("Provide 'allocations' or set 'all_active_employees'.")
+            user_ids = [item['user_id'] for item in items]
+            users = User.objects.filter(company=company).in_bulk(user_ids)
+            seen = set()
+            errors = []
+            for item in items:
+                user_id = item['user_id']
+                if user_id not in users:
+                    errors.append({'user_id': [f"User {user_id} is not a member of your company."]})
+                elif user_id in seen:
+                    errors.append({'user_id': [f"User {user_id} appears more than once."]})
+                else:
+                    errors.append({})
+                seen.add(user_id)
+            if any(errors):
+                raise serializers.ValidationError({'allocations': errors})
+            resolved = [(users[item['user_id']], item['amount']) for item in items]
+
+        data['resolved_allocations'] = resolved
+        data['total_amount'] = sum((amount for _, amount in resolved), Decimal('0.00'))
+        return data
@@ -0,0 +1,148 @@
+# users/tests/test_allocate_budget.py
+
+from decimal import Decimal
+from django.db import connection
+from django.db.models import Sum
+from django.test.utils import CaptureQueriesContext
+from django.test import TransactionTestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from users.models import User
+from users.allocation import allocate_budget, InsufficientFunds
+from companies.models import Company
+from wallets.models import Wallet, Transaction
+from ledger import journal
+from ledger.models import Account
+from core.tests.concurrency import run_concurrently
+
+
+class AllocateBudgetViewTests(APITestCase):
+    def setUp(self):
+        self.company = Company.objects.create(name="Alloc Co")
+        Wallet.objects.filter(company=self.company).update(balance=Decimal('100.00'))
+        self.admin = User.objects.create_user(
+            username='alloc_admin', password='password123', role=User.Role.COMPANY_ADMIN, company=self.company
+        )
+        self.employee = User.objects.create_user(username='alloc_emp', password='password123', company=self.company)
+        self.url = reverse('admin-allocate-budget', kwargs={'user_id': self.employee.id})
+        self.client.force_authenticate(user=self.admin)
+
+    def test_allocation_moves_funds(self):
+        """VERIFY: The wallet is debited, the budget credited, and both sides are logged."""
+        response = self.client.post(self.url, {'amount': '60.00'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['new_company_balance'], Decimal('40.00'))
+        self.assertEqual(response.data['new_employee_budget'], Decimal('60.00'))
+        self.assertEqual(Transaction.objects.filter(transaction_type='BUDGET_ALLOCATION').count(), 2)
+
+    def test_insufficient_funds_changes_nothing(self):
+        """VERIFY: An allocation larger than the wallet balance is rejected without side effects."""
+        response = self.client.post(self.url, {'amount': '100.01'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.employee.refresh_from_db()
+        self.assertEqual(self.employee.budget, Decimal('0.00'))
+        self.assertEqual(Wallet.objects.get(company=self.company).balance, Decimal('100.00'))
+        self.assertFalse(Transaction.objects.exists())
+
+
+class BulkAllocateBudgetTests(APITestCase):
+    def setUp(self):
+        self.company = Company.objects.create(name="Bulk Co")
+        Wallet.objects.filter(company=self.company).update(balance=Decimal('1000.00'))
+        self.admin = User.objects.create_user(
+            username='bulk_admin', password='password123', role=User.Role.COMPANY_ADMIN, company=self.company
+        )
+        self.employees = [
+            User.objects.create_user(username=f'bulk_{i}', password='password123', company=self.company)
+            for i in range(12)
+        ]
+        User.objects.filter(pk=self.employees[-1].pk).update(is_active=False)
+        self.outsider = User.objects.create_user(username='bulk_outsider', password='password123')
+        self.url = reverse('admin-bulk-allocate-budget')
+        self.client.force_authenticate(user=self.admin)
+
+    def test_all_active_employees_rule(self):
+        """VERIFY: Every active employee is topped up and the wallet is charged once for the total."""
+        response = self.client.post(self.url, {'all_active_employees': True, 'amount': '20.00'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['allocated_count'], 11)
+        self.assertEqual(response.data['new_company_balance'], Decimal('780.00'))
+        self.assertEqual(User.objects.filter(budget=Decimal('20.00')).count(), 11)
+        self.assertEqual(journal.verify_balances(), [])
+
+    def test_explicit_list_and_constant_query_count(self):
+        """VERIFY: Allocating to many employees costs the same queries as to two."""
+        def payload(employees):
+            return {'allocations': [{'user_id': e.id, 'amount': '5.00'} for e in employees]}
+
+        with CaptureQueriesContext(connection) as small:
+            self.client.post(self.url, payload(self.employees[:2]), format='json')
+        with CaptureQueriesContext(connection) as large:
+            response = self.client.post(self.url, payload(self.employees[2:10]), format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(small.captured_queries), len(large.captured_queries))
+        self.assertEqual(Wallet.objects.get(company=self.company).balance, Decimal('950.00'))
+
+    def test_invalid_items_and_insufficient_funds_reject_the_batch(self):
+        """VERIFY: Foreign users, duplicates or a total above the balance write nothing."""
+        response = self.client.post(self.url, {'allocations': [
+            {'user_id': self.employees[0].id, 'amount': '5.00'},
+            {'user_id': self.outsider.id, 'amount': '5.00'},
+            {'user_id': self.employees[0].id, 'amount': '5.00'},
+        ]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual([bool(error) for error in response.data['allocations']], [False, True, True])
+
+        response = self.client.post(self.url, {'all_active_employees': True, 'amount': '100.00'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Transaction.objects.exists())
+        self.assertFalse(User.objects.filter(budget__gt=0).exists())
+
+
+class AllocateBudgetConcurrencyTests(TransactionTestCase):
+    """
+    Fires many allocations from parallel threads against the configured
+    database and checks that no money is created or lost.
+    """
+    ALLOCATIONS = 300
+    AMOUNT = Decimal('10.00')
+    FUNDED = 150  # the wallet covers only half of the allocations
+
+    def setUp(self):
+        self.company = Company.objects.create(name="Race Co")
+        self.wallet = Wallet.objects.get(company=self.company)
+        initial = self.AMOUNT * self.FUNDED
+        Wallet.objects.filter(pk=self.wallet.pk).update(balance=initial)
+        journal.record_deposit(self.company.id, initial)
+
+        self.admin = User.objects.create_user(
+            username='race_admin', password='password123', role=User.Role.COMPANY_ADMIN, company=self.company
+        )
+        self.employees = [
+            User.objects.create_user(username=f'race_{i}', password='password123', company=self.company)
+            for i in range(8)
+        ]
+
+    def test_parallel_allocations_conserve_balances(self):
+        """VERIFY: Exactly the funded allocations succeed and wallet plus budgets equal the deposit."""
+        calls = [
+            (self.wallet, self.employees[i % len(self.employees)], self.AMOUNT, self.admin)
+            for i in range(self.ALLOCATIONS)
+        ]
+        results = run_concurrently(allocate_budget, calls)
+
+        unexpected = [r for r in results if isinstance(r, Exception) and not isinstance(r, InsufficientFunds)]
+        self.assertEqual(unexpected, [])
+        succeeded = [r for r in results if not isinstance(r, Exception)]
+        self.assertEqual(len(succeeded), self.FUNDED)
+
+        wallet_balance = Wallet.objects.get(pk=self.wallet.pk).balance
+        budgets = User.objects.filter(company=self.company).aggregate(total=Sum('budget'))['total']
+        self.assertEqual(wallet_balance, Decimal('0.00'))
+        self.assertEqual(budgets, self.AMOUNT * self.FUNDED)
+        self.assertEqual(Transaction.objects.filter(amount__gt=0).count(), self.FUNDED)
+
+        self.assertEqual(journal.verify_balances(), [])
+        self.assertEqual(Account.objects.get(company=self.company).balance, wallet_balance)
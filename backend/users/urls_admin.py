@@ -1,7 +1,8 @@
 # users/urls_admin.py
 from django.urls import path
-from .views_admin import AllocateBudgetView
+from .views_admin import AllocateBudgetView, BulkAllocateBudgetView
 
 urlpatterns = [
     path('employees/<int:user_id>/allocate_budget/', AllocateBudgetView.as_view(), name='admin-allocate-budget'),
+    path('employees/allocate_budget/bulk/', BulkAllocateBudgetView.as_view(), name='admin-bulk-allocate-budget'),
 ]
\ No newline at end of file
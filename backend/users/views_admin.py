@@ -1,14 +1,14 @@
 # users/views_admin.py
-from django.db import transaction
 from django.shortcuts import get_object_or_404
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 
 from .models import User
-from wallets.models import Wallet, Transaction
-from .serializers import AllocateBudgetSerializer
-from core.permissions import IsCompanyAdminOfTargetUser
+from wallets.models import Wallet
+from .serializers import AllocateBudgetSerializer, BulkAllocateBudgetSerializer
+from .allocation import allocate_budget, allocate_budgets, InsufficientFunds
+from core.permissions import IsCompanyAdmin, IsCompanyAdminOfTargetUser
 
 class AllocateBudgetView(APIView):
     """
@@ -18,7 +18,6 @@ class AllocateBudgetView(APIView):
     permission_classes = [IsCompanyAdminOfTargetUser]
     serializer_class = AllocateBudgetSerializer
 
-    @transaction.atomic
     def post(self, request, user_id, *args, **kwargs):
         target_user = get_object_or_404(User, pk=user_id)
         company_wallet = get_object_or_404(Wallet, company=request.user.company)
@@ -27,45 +26,53 @@ class AllocateBudgetView(APIView):
         serializer.is_valid(raise_exception=True)
         amount_to_allocate = serializer.validated_data['amount']
 
-        # 1. Check if company wallet has sufficient funds
-        if company_wallet.balance < amount_to_allocate:
-            return Response(
-                {"error": "Insufficient company funds to perform this allocation."},
-                status=status.HTTP_400_BAD_REQUEST
+        # Debit the wallet and credit the employee with conditional, atomic updates
+        try:
+            new_company_balance, new_employee_budget = allocate_budget(
+                company_wallet, target_user, amount_to_allocate, allocated_by=request.user
             )
+        except InsufficientFunds as exc:
+            return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
         
-        # 2. Perform the transaction atomically
-        company_wallet.balance -= amount_to_allocate
-        company_wallet.save()
+        return Response(
+            {
+                "message": "Budget allocated successfully.",
+                "employee": target_user.username,
+                "new_employee_budget": new_employee_budget,
+                "new_company_balance": new_company_balance,
+            },
+            status=status.HTTP_200_OK
+        )
 
-        target_user.budget += amount_to_allocate
-        target_user.save()
 
-        # 3. Log both sides of the transaction for auditing
-        # Log the withdrawal from the company wallet
-        Transaction.objects.create(
-            wallet=company_wallet,
-            user=request.user, # The admin who performed the action
-            transaction_type=Transaction.TransactionType.BUDGET_ALLOCATION,
-            amount=-amount_to_allocate, # Negative amount for withdrawal
-            description=f"Allocation to employee {target_user.username}."
-        )
+class BulkAllocateBudgetView(APIView):
+    """
+    An endpoint for a Company Admin to allocate budget to many employees in
+    one request: either a list of {user_id, amount} items, or one amount for
+    all active employees. Everything is applied in a single transaction.
+    """
+    permission_classes = [IsCompanyAdmin]
+    serializer_class = BulkAllocateBudgetSerializer
+
+    def post(self, request, *args, **kwargs):
+        company_wallet = get_object_or_404(Wallet, company=request.user.company)
+
+        serializer = self.serializer_class(data=request.data, context={'request': request})
+        serializer.is_valid(raise_exception=True)
+        allocations = serializer.validated_data['resolved_allocations']
+        total_amount = serializer.validated_data['total_amount']
+
+        try:
+            new_company_balance = allocate_budgets(company_wallet, allocations, allocated_by=request.user)
+        except InsufficientFunds as exc:
+            return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
 
-        # Log the "deposit" into the user's budget (for their transaction history)
-        Transaction.objects.create(
-            wallet=company_wallet,
-            user=target_user,
-            transaction_type=Transaction.TransactionType.BUDGET_ALLOCATION,
-            amount=amount_to_allocate,
-            description=f"Budget allocated by {request.user.username}."
-        )
-        
         return Response(
             {
-                "message": "Budget allocated successfully.",
-                "employee": target_user.username,
-                "new_employee_budget": target_user.budget,
-                "new_company_balance": company_wallet.balance,
+                "message": "Budgets allocated successfully.",
+                "allocated_count": len(allocations),
+                "total_amount": total_amount,
+                "new_company_balance": new_company_balance,
             },
             status=status.HTTP_200_OK
-        )
\ No newline at end of file
+        )
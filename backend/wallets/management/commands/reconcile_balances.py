@@ -0,0 +1,30 @@
+# wallets/management/commands/reconcile_balances.py
+
+from django.core.management.base import BaseCommand
+
+from wallets.reconciliation import WALLET, reconcile
+
+
+class Command(BaseCommand):
+    """
+    Checks the stored wallet balances and employee budgets against the
+    transaction log. Meant to run nightly.
+    """
+    help = 'Reports wallets and budgets whose stored balance differs from their transaction log.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--fix', action='store_true', help='Log an ADJUSTMENT for every confirmed difference.')
+
+    def handle(self, *args, **options):
+        found = reconcile(fix=options['fix'])
+        for d in found:
+            label = f"Wallet #{d.object_id}" if d.kind == WALLET else f"Budget of user #{d.object_id}"
+            self.stdout.write(self.style.WARNING(
+                f"{label}: stored {d.stored}, transaction log sums to {d.logged} (difference {d.stored - d.logged})."
+            ))
+
+        if not found:
+            self.stdout.write(self.style.SUCCESS("All balances match the transaction log."))
+        elif options['fix']:
+            logged = sum(1 for d in found if d.wallet_id is not None)
+            self.stdout.write(self.style.SUCCESS(f"Logged {logged} correcting adjustments."))
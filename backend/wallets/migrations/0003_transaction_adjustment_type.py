@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wallets', '0002_transaction_history_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='transaction',
+            name='transaction_type',
+            field=models.CharField(choices=[('DEPOSIT', 'Deposit'), ('BUDGET_ALLOCATION', 'Budget Allocation'), ('ORDER_DEDUCTION', 'Order Deduction'), ('REFUND', 'Refund'), ('ADJUSTMENT', 'Adjustment')], max_length=50),
+        ),
+    ]
@@ -38,6 +38,7 @@ class Transaction(models.Model):
         BUDGET_ALLOCATION = "BUDGET_ALLOCATION", "Budget Allocation"
         ORDER_DEDUCTION = "ORDER_DEDUCTION", "Order Deduction"
         REFUND = "REFUND", "Refund"  # New type for refunds
+        ADJUSTMENT = "ADJUSTMENT", "Adjustment"  # Correcting entries written by reconciliation
 
     wallet = models.ForeignKey(
         Wallet,
@@ -70,6 +71,11 @@ class Transaction(models.Model):
 
     class Meta:
         ordering = ['-timestamp']
+        indexes = [
+            # Transaction histories are read newest first, per wallet or per user
+            models.Index(fields=['wallet', '-timestamp'], name='wallets_txn_wallet_ts_idx'),
+            models.Index(fields=['user', '-timestamp'], name='wallets_txn_user_ts_idx'),
+        ]
 
     def __str__(self):
         return f"{self.transaction_type} of {self.amount} for {self.wallet.company.name} at {self.timestamp}"
@@ -0,0 +1,107 @@
+# wallets/reconciliation.py
+
+from collections import namedtuple
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Q, Sum
+
+from users.models import User
+from .models import Wallet, Transaction
+
+Type = Transaction.TransactionType
+ZERO = Decimal('0.00')
+CENT = Decimal('0.01')
+
+WALLET = 'wallet'
+BUDGET = 'budget'
+
+# --- Which log rows move which stored balance ---
+# An allocation is logged twice: the negative row (by the admin) debits the
+# company wallet, the positive one credits the employee's budget.
+WALLET_ROWS = (
+    Q(transaction_type=Type.DEPOSIT)
+    | Q(transaction_type=Type.BUDGET_ALLOCATION, amount__lt=0)
+    | Q(transaction_type=Type.ADJUSTMENT, user__isnull=True)
+)
+BUDGET_ROWS = Q(user__isnull=False) & (
+    Q(transaction_type__in=[Type.ORDER_DEDUCTION, Type.REFUND, Type.ADJUSTMENT])
+    | Q(transaction_type=Type.BUDGET_ALLOCATION, amount__gt=0)
+)
+
+# `object_id` is the wallet or user id; `wallet_id` is where a correction is logged.
+Discrepancy = namedtuple('Discrepancy', ['kind', 'object_id', 'wallet_id', 'stored', 'logged'])
+
+
+def _logged_totals(rows, group_by, ids=None):
+    """One grouped SUM over the log, keyed by wallet or user id."""
+    queryset = Transaction.objects.filter(rows)
+    if ids is not None:
+        queryset = queryset.filter(**{f'{group_by}__in': ids})
+    return dict(queryset.values_list(group_by).annotate(total=Sum('amount')).order_by())
+
+
+def wallet_discrepancies(ids=None):
+    logged = _logged_totals(WALLET_ROWS, 'wallet_id', ids)
+    wallets = Wallet.objects.all() if ids is None else Wallet.objects.filter(pk__in=ids)
+    found = []
+    for pk, balance in wallets.order_by('pk').values_list('pk', 'balance').iterator(chunk_size=2000):
+        total = (logged.get(pk) or ZERO).quantize(CENT)
+        if balance != total:
+            found.append(Discrepancy(WALLET, pk, pk, balance, total))
+    return found
+
+
+def budget_discrepancies(ids=None):
+    logged = _logged_totals(BUDGET_ROWS, 'user_id', ids)
+    users = User.objects.all() if ids is None else User.objects.filter(pk__in=ids)
+    found = []
+    rows = users.order_by('pk').values_list('pk', 'budget', 'company__wallet').iterator(chunk_size=2000)
+    for pk, budget, wallet_id in rows:
+        total = (logged.get(pk) or ZERO).quantize(CENT)
+        if budget != total:
+            found.append(Discrepancy(BUDGET, pk, wallet_id, budget, total))
+    return found
+
+
+def reconcile(fix=False):
+    """
+    Compare every stored `Wallet.balance` and `User.budget` with the sum of
+    the transaction log rows that move it. Each side is one grouped aggregate
+    over the log plus one streamed read of the stored balances, so the cost
+    does not depend on how many wallets or employees there are.
+
+    With `fix`, the flagged rows are locked and checked again (a transfer in
+    flight during the scan is not drift), and an ADJUSTMENT row for the
+    difference is logged for each confirmed one. Stored balances are never
+    rewritten: they are what employees have been spending against, and the
+    adjustment leaves an audit trail instead. Budgets of users without a
+    company wallet cannot be logged and are reported only.
+    Returns the discrepancies found (with `fix`, the confirmed ones).
+    """
+    found = wallet_discrepancies() + budget_discrepancies()
+    if fix and found:
+        found = _write_corrections(found)
+    return found
+
+
+@transaction.atomic
+def _write_corrections(found):
+    wallet_ids = [d.object_id for d in found if d.kind == WALLET]
+    user_ids = [d.object_id for d in found if d.kind == BUDGET]
+    # Same lock order as the allocation code: wallets first, then users
+    list(Wallet.objects.select_for_update().filter(pk__in=wallet_ids).order_by('pk').values_list('pk', flat=True))
+    list(User.objects.select_for_update().filter(pk__in=user_ids).order_by('pk').values_list('pk', flat=True))
+
+    confirmed = wallet_discrepancies(wallet_ids) + budget_discrepancies(user_ids)
+    Transaction.objects.bulk_create([
+        Transaction(
+            wallet_id=d.wallet_id,
+            user_id=d.object_id if d.kind == BUDGET else None,
+            transaction_type=Type.ADJUSTMENT,
+            amount=d.stored - d.logged,
+            description=f"Reconciliation: stored {d.kind} {d.stored}, log summed to {d.logged}.",
+        )
+        for d in confirmed if d.wallet_id is not None
+    ])
+    return confirmed
@@ -32,15 +32,26 @@ class TransactionSerializer(serializers.ModelSerializer):
 
 class WalletSerializer(serializers.ModelSerializer):
     """
-    Serializer for providing a detailed view of a company's wallet.
-    Includes a nested list of all associated transactions.
+    Serializer for the summary of a company's wallet.
+    Transactions are listed by their own paginated endpoint.
     """
     company_name = serializers.CharField(source='company.name', read_only=True)
-    # Use the new TransactionSerializer for the nested relationship
-    transactions = TransactionSerializer(many=True, read_only=True)
 
     class Meta:
         model = Wallet
         fields = [
-            'id', 'company_name', 'balance', 'updated_at', 'transactions'
-        ]
\ No newline at end of file
+            'id', 'company_name', 'balance', 'updated_at'
+        ]
+
+class DiscrepancySerializer(serializers.Serializer):
+    """
+    A stored balance that does not match its transaction log.
+    """
+    kind = serializers.CharField()
+    object_id = serializers.IntegerField()
+    stored = serializers.DecimalField(max_digits=14, decimal_places=2)
+    logged = serializers.DecimalField(max_digits=14, decimal_places=2)
+    difference = serializers.SerializerMethodField()
+
+    def get_difference(self, obj):
+        return str(obj.stored - obj.logged)
@@ -0,0 +1,89 @@
+# wallets/tests/test_reconciliation.py
+
+from io import StringIO
+from decimal import Decimal
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from users.models import User
+from users.allocation import allocate_budget
+from companies.models import Company
+from wallets.models import Wallet, Transaction
+from wallets.reconciliation import BUDGET, WALLET, reconcile
+
+
+class ReconciliationTests(APITestCase):
+    def setUp(self):
+        self.super_admin = User.objects.create_user(
+            username='recon_super', password='password123', role=User.Role.SUPER_ADMIN
+        )
+        self.company = Company.objects.create(name="Recon Co")
+        self.admin = User.objects.create_user(
+            username='recon_admin', password='password123', role=User.Role.COMPANY_ADMIN, company=self.company
+        )
+        self.employee = User.objects.create_user(username='recon_emp', password='password123', company=self.company)
+
+        self.client.force_authenticate(user=self.super_admin)
+        self.client.post(reverse('wallet-deposit', kwargs={'company_id': self.company.id}), {'amount': '500.00'})
+        self.wallet = Wallet.objects.get(company=self.company)
+        allocate_budget(self.wallet, self.employee, Decimal('200.00'), self.admin)
+        Transaction.objects.create(
+            wallet=self.wallet, user=self.employee,
+            transaction_type=Transaction.TransactionType.ORDER_DEDUCTION, amount=Decimal('-30.00')
+        )
+        User.objects.filter(pk=self.employee.pk).update(budget=Decimal('170.00'))
+
+    def test_consistent_balances_report_nothing(self):
+        """VERIFY: Deposits, both allocation rows and order deductions are attributed to the right side."""
+        self.assertEqual(reconcile(), [])
+
+    def test_drift_is_reported_and_corrected(self):
+        """VERIFY: Drifted balances are reported, and fixing logs adjustments without touching balances."""
+        Wallet.objects.filter(pk=self.wallet.pk).update(balance=Decimal('310.00'))
+        User.objects.filter(pk=self.employee.pk).update(budget=Decimal('175.00'))
+
+        found = {(d.kind, d.object_id): d for d in reconcile()}
+        self.assertEqual(set(found), {(WALLET, self.wallet.pk), (BUDGET, self.employee.pk)})
+        self.assertEqual(found[(WALLET, self.wallet.pk)].logged, Decimal('300.00'))
+        self.assertEqual(found[(BUDGET, self.employee.pk)].stored, Decimal('175.00'))
+
+        self.assertEqual(len(reconcile(fix=True)), 2)
+        self.assertEqual(reconcile(), [])
+        adjustments = Transaction.objects.filter(transaction_type=Transaction.TransactionType.ADJUSTMENT)
+        self.assertEqual(
+            {(a.user_id, a.amount) for a in adjustments},
+            {(None, Decimal('10.00')), (self.employee.pk, Decimal('5.00'))},
+        )
+        self.assertEqual(Wallet.objects.get(pk=self.wallet.pk).balance, Decimal('310.00'))
+
+    def test_query_count_does_not_grow_with_employees(self):
+        """VERIFY: The scan costs the same queries for many employees as for a few."""
+        with CaptureQueriesContext(connection) as small:
+            reconcile()
+        User.objects.bulk_create([
+            User(username=f'recon_bulk_{i}', company=self.company, budget=Decimal('1.00')) for i in range(50)
+        ])
+        with CaptureQueriesContext(connection) as large:
+            found = reconcile()
+        self.assertEqual(len(small.captured_queries), len(large.captured_queries))
+        self.assertEqual(len(found), 50)
+
+    def test_endpoint_and_command(self):
+        """VERIFY: Only Super Admins can reconcile; the command reports the same drift."""
+        User.objects.filter(pk=self.employee.pk).update(budget=Decimal('0.00'))
+        url = reverse('wallet-reconciliation')
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['discrepancies'][0]['difference'], '-170.00')
+
+        out = StringIO()
+        call_command('reconcile_balances', stdout=out)
+        self.assertIn(f"Budget of user #{self.employee.pk}", out.getvalue())
+
+        self.client.force_authenticate(user=self.admin)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_403_FORBIDDEN)
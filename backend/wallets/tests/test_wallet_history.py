@@ -0,0 +1,89 @@
+# wallets/tests/test_wallet_history.py
+
+from decimal import Decimal
+from datetime import datetime, timedelta
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from users.models import User
+from companies.models import Company
+from wallets.models import Wallet, Transaction
+
+
+class CompanyWalletHistoryTests(APITestCase):
+    def setUp(self):
+        self.company = Company.objects.create(name="History Co")
+        self.wallet = Wallet.objects.get(company=self.company)
+        Wallet.objects.filter(pk=self.wallet.pk).update(balance=Decimal('500.00'))
+        self.admin = User.objects.create_user(
+            username='history_admin', password='password123', role=User.Role.COMPANY_ADMIN, company=self.company
+        )
+        self.employee = User.objects.create_user(username='history_emp', password='password123', company=self.company)
+
+        other_wallet = Wallet.objects.get(company=Company.objects.create(name="Other Co"))
+        Transaction.objects.create(wallet=other_wallet, transaction_type='DEPOSIT', amount=Decimal('1.00'))
+
+        Transaction.objects.bulk_create([
+            Transaction(
+                wallet=self.wallet,
+                user=self.employee if i % 2 else None,
+                transaction_type='ORDER_DEDUCTION' if i % 2 else 'DEPOSIT',
+                amount=Decimal('-10.00') if i % 2 else Decimal('100.00'),
+            )
+            for i in range(25)
+        ])
+        # Spread the rows over 25 consecutive days
+        base = timezone.make_aware(datetime(2025, 6, 1, 12, 0))
+        for offset, transaction in enumerate(Transaction.objects.filter(wallet=self.wallet).order_by('id')):
+            Transaction.objects.filter(pk=transaction.pk).update(timestamp=base + timedelta(days=offset))
+
+        self.client.force_authenticate(user=self.admin)
+        self.url = reverse('my-company-wallet-transactions')
+
+    def test_wallet_summary_has_no_transactions(self):
+        """VERIFY: The wallet endpoint returns only the summary."""
+        response = self.client.get(reverse('my-company-wallet'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['balance'], '500.00')
+        self.assertNotIn('transactions', response.data)
+
+    def test_history_is_keyset_paginated_newest_first(self):
+        """VERIFY: Pages follow each other by cursor and only cover the admin's wallet."""
+        first = self.client.get(self.url, {'page_size': 10})
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(first.data['results']), 10)
+        self.assertNotIn('count', first.data)
+        timestamps = [row['timestamp'] for row in first.data['results']]
+        self.assertEqual(timestamps, sorted(timestamps, reverse=True))
+
+        seen = {row['id'] for row in first.data['results']}
+        next_url = first.data['next']
+        while next_url:
+            page = self.client.get(next_url)
+            seen |= {row['id'] for row in page.data['results']}
+            next_url = page.data['next']
+        self.assertEqual(seen, set(Transaction.objects.filter(wallet=self.wallet).values_list('id', flat=True)))
+
+    def test_history_filters(self):
+        """VERIFY: Type, user and date range filters narrow the history."""
+        response = self.client.get(self.url, {'transaction_type': 'DEPOSIT'})
+        self.assertEqual(len(response.data['results']), 13)
+        response = self.client.get(self.url, {'user': self.employee.id})
+        self.assertEqual(len(response.data['results']), 12)
+        response = self.client.get(self.url, {'start_date': '2025-06-03', 'end_date': '2025-06-05'})
+        self.assertEqual(len(response.data['results']), 3)
+
+    def test_history_query_count_does_not_grow(self):
+        """VERIFY: A page costs the same queries no matter how many rows the wallet has."""
+        with CaptureQueriesContext(connection) as small:
+            self.client.get(self.url, {'page_size': 5})
+        Transaction.objects.bulk_create([
+            Transaction(wallet=self.wallet, transaction_type='DEPOSIT', amount=Decimal('1.00')) for _ in range(200)
+        ])
+        with CaptureQueriesContext(connection) as large:
+            self.client.get(self.url, {'page_size': 5})
+        self.assertEqual(len(small.captured_queries), len(large.captured_queries))
@@ -1,7 +1,7 @@
 # wallets/urls.py
 from django.urls import path
 # [MODIFIED] Import the new view
-from .views import WalletDepositView, MyCompanyWalletView
+from .views import WalletDepositView, MyCompanyWalletView, MyCompanyTransactionsView, ReconciliationView
 
 urlpatterns = [
     # URL for Super Admins to deposit funds into any company wallet
@@ -9,4 +9,8 @@ urlpatterns = [
 
     # [NEW] URL for Company Admins to view their own company wallet
     path('my-company/', MyCompanyWalletView.as_view(), name='my-company-wallet'),
+    path('my-company/transactions/', MyCompanyTransactionsView.as_view(), name='my-company-wallet-transactions'),
+
+    # Super Admin check of stored balances against the transaction log
+    path('reconciliation/', ReconciliationView.as_view(), name='wallet-reconciliation'),
 ]
\ No newline at end of file
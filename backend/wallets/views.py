@@ -1,61 +1,78 @@
 # wallets/views.py
+from datetime import datetime, time, timedelta
 from django.db import transaction
 from django.db.models import F
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from rest_framework.views import APIView
 from rest_framework import generics, status
 from rest_framework.response import Response
-from rest_framework.pagination import PageNumberPagination
+from django_filters import rest_framework as filters
 
 from companies.models import Company
 from .models import Wallet, Transaction
-from .serializers import DepositSerializer, WalletSerializer, TransactionSerializer
+from .serializers import DepositSerializer, WalletSerializer, TransactionSerializer, DiscrepancySerializer
+from .reconciliation import reconcile
 from core.permissions import IsSuperAdmin, IsCompanyAdmin
+from core.pagination import TimestampCursorPagination
+from ledger import journal
 
 
 # ------------------------
-# Pagination for transactions
+# Filters for the transaction history
 # ------------------------
-class TransactionPagination(PageNumberPagination):
-    page_size = 10
-    page_size_query_param = 'page_size'
-    max_page_size = 50
+class TransactionFilter(filters.FilterSet):
+    transaction_type = filters.ChoiceFilter(choices=Transaction.TransactionType.choices)
+    user = filters.NumberFilter(field_name='user_id')
+    start_date = filters.DateFilter(method='filter_start_date')
+    end_date = filters.DateFilter(method='filter_end_date')
+
+    class Meta:
+        model = Transaction
+        fields = ['transaction_type', 'user', 'start_date', 'end_date']
+
+    # Dates are turned into timestamp bounds so the range stays on the (wallet, timestamp) index
+    def filter_start_date(self, queryset, name, value):
+        return queryset.filter(timestamp__gte=_start_of_day(value))
+
+    def filter_end_date(self, queryset, name, value):
+        return queryset.filter(timestamp__lt=_start_of_day(value + timedelta(days=1)))
+
+
+def _start_of_day(day):
+    return timezone.make_aware(datetime.combine(day, time.min))
 
 
 # ------------------------
-# View for Company Admin to see their wallet
+# Views for Company Admin to see their wallet
 # ------------------------
 class MyCompanyWalletView(generics.RetrieveAPIView):
     """
-    Allows a Company Admin to view their own company's wallet
-    details and paginated transaction history.
+    Allows a Company Admin to view their own company's wallet summary.
+    The transaction history is served separately by MyCompanyTransactionsView.
     """
     serializer_class = WalletSerializer
     permission_classes = [IsCompanyAdmin]
-    pagination_class = TransactionPagination
 
     def get_object(self):
-        user = self.request.user
-        wallet = get_object_or_404(
-            Wallet.objects.prefetch_related('transactions__user'),
-            company=user.company
-        )
-        return wallet
-
-    def retrieve(self, request, *args, **kwargs):
-        wallet = self.get_object()
-        serializer = self.get_serializer(wallet)
+        return get_object_or_404(Wallet.objects.select_related('company'), company=self.request.user.company)
 
-        # Paginate transactions
-        transactions_qs = wallet.transactions.all().order_by('-created_at')
-        paginator = self.pagination_class()
-        page = paginator.paginate_queryset(transactions_qs, request)
-        transactions_serializer = TransactionSerializer(page, many=True)
 
-        data = serializer.data
-        data['transactions'] = transactions_serializer.data
+class MyCompanyTransactionsView(generics.ListAPIView):
+    """
+    Keyset-paginated transaction history of the Company Admin's wallet,
+    newest first, filterable by type, user and date range. Pages are read
+    from the (wallet, timestamp) index, so their cost does not depend on
+    how many transactions the wallet has.
+    """
+    serializer_class = TransactionSerializer
+    permission_classes = [IsCompanyAdmin]
+    pagination_class = TimestampCursorPagination
+    filterset_class = TransactionFilter
 
-        return paginator.get_paginated_response(data)
+    def get_queryset(self):
+        wallet = get_object_or_404(Wallet, company=self.request.user.company)
+        return Transaction.objects.filter(wallet=wallet).select_related('user')
 
 
 # ------------------------
@@ -84,14 +101,34 @@ class WalletDepositView(APIView):
         wallet.refresh_from_db()  # Get actual balance after F()
 
         # Log the transaction
+        description = f"Deposit made by Super Admin {request.user.username}."
         Transaction.objects.create(
             wallet=wallet,
             transaction_type=Transaction.TransactionType.DEPOSIT,
             amount=amount_to_deposit,
-            description=f"Deposit made by Super Admin {request.user.username}."
+            description=description
         )
+        journal.record_deposit(company.id, amount_to_deposit, created_by=request.user, description=description)
 
         return Response(
             {"message": "Deposit successful.", "new_balance": wallet.balance},
             status=status.HTTP_200_OK
         )
+
+
+# ------------------------
+# Reconciliation for Super Admins
+# ------------------------
+class ReconciliationView(APIView):
+    """
+    GET reports every wallet balance and employee budget that differs from
+    its transaction log; POST also logs correcting adjustments for them.
+    """
+    permission_classes = [IsSuperAdmin]
+
+    def get(self, request, *args, **kwargs):
+        return Response({"discrepancies": DiscrepancySerializer(reconcile(), many=True).data})
+
+    def post(self, request, *args, **kwargs):
+        corrected = reconcile(fix=True)
+        return Response({"corrected": DiscrepancySerializer(corrected, many=True).data})
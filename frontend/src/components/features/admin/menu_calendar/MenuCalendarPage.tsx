@@ -3,7 +3,7 @@ import { useState, useEffect } from 'react';
 import { PageHeader } from '@/components/shared/PageHeader';
 import { CalendarGrid } from '@/components/features/admin/menu_calendar/CalendarGrid';
 import SetDailyMenuModal from '@/components/features/admin/menu_calendar/SetDailyMenuModal';
-import { Schedule } from '@/types';
+import { ScheduleSummary } from '@/types';
 import { getSchedules } from '@/services/scheduleService';
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@/components/ui/select";
 import { Label } from "@/components/ui/label";
@@ -11,7 +11,7 @@ import { Card, CardContent } from '@/components/ui/card';
 
 const MenuCalendarPage = () => {
     // Data state
-    const [schedules, setSchedules] = useState<Schedule[]>([]);
+    const [schedules, setSchedules] = useState<ScheduleSummary[]>([]);
     
     // UI State
     const [selectedScheduleId, setSelectedScheduleId] = useState<string>('');
@@ -1,6 +1,7 @@
 // src/pages/OrderHistoryPage.tsx
 import { useEffect, useState } from 'react';
 import { getMyOrders, deleteOrder } from '../services/orderService';
+import { cursorFromLink } from '@/services/walletService';
 import { Order } from '../types';
 import { PageHeader } from '../components/shared/PageHeader';
 import { Card, CardContent, CardDescription, CardFooter, CardHeader, CardTitle } from '../components/ui/card';
@@ -10,14 +11,19 @@ import { isModificationAllowed } from '@/lib/utils'; // Import the helper
 
 const OrderHistoryPage = () => {
   const [orders, setOrders] = useState<Order[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | undefined>(undefined);
   const [isLoading, setIsLoading] = useState(true);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
   const [error, setError] = useState<string | null>(null);
 
+  const byDateDesc = (a: Order, b: Order) => new Date(b.date).getTime() - new Date(a.date).getTime();
+
   const fetchOrders = async () => {
     setIsLoading(true);
     try {
-      const data = await getMyOrders();
-      setOrders(data.sort((a, b) => new Date(b.date).getTime() - new Date(a.date).getTime()));
+      const page = await getMyOrders();
+      setOrders(page.results.sort(byDateDesc));
+      setNextCursor(cursorFromLink(page.next));
     } catch (err) {
       setError('خطا در دریافت تاریخچه سفارشات شما.');
     } finally {
@@ -25,6 +31,20 @@ const OrderHistoryPage = () => {
     }
   };
 
+  const loadMore = async () => {
+    if (!nextCursor) return;
+    setIsLoadingMore(true);
+    try {
+      const page = await getMyOrders(nextCursor);
+      setOrders((current) => [...current, ...page.results].sort(byDateDesc));
+      setNextCursor(cursorFromLink(page.next));
+    } catch (err) {
+      setError('خطا در دریافت تاریخچه سفارشات شما.');
+    } finally {
+      setIsLoadingMore(false);
+    }
+  };
+
   useEffect(() => {
     fetchOrders();
   }, []);
@@ -87,6 +107,13 @@ const OrderHistoryPage = () => {
           <p>شما هنوز سفارشی ثبت نکرده‌اید.</p>
         )}
       </div>
+      {nextCursor && (
+        <div className="mt-4 flex justify-center">
+          <Button variant="outline" onClick={loadMore} disabled={isLoadingMore}>
+            {isLoadingMore ? 'در حال بارگذاری...' : 'نمایش سفارشات بیشتر'}
+          </Button>
+        </div>
+      )}
     </div>
   );
 };
@@ -7,7 +7,7 @@ import { Label } from '@/components/ui/label';
 import { Card, CardContent, CardHeader, CardTitle, CardDescription } from '@/components/ui/card';
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@/components/ui/select";
 import { Checkbox } from '@/components/ui/checkbox';
-import { FoodItem, Schedule, SideDish } from '@/types';
+import { FoodItem, ScheduleSummary, SideDish } from '@/types';
 
 import { getSchedules } from '@/services/scheduleService';
 import { getFoodItems, getSideDishes } from '@/services/foodService';
@@ -16,7 +16,7 @@ import { getDailyMenuForDate, saveOrUpdateDailyMenu } from '@/services/menuServi
 
 const MenuManagementPage = () => {
     // Data states for holding lists from the backend
-    const [schedules, setSchedules] = useState<Schedule[]>([]);
+    const [schedules, setSchedules] = useState<ScheduleSummary[]>([]);
     const [foods, setFoods] = useState<FoodItem[]>([]);
     const [sides, setSides] = useState<SideDish[]>([]);
 
@@ -3,23 +3,43 @@ import { useEffect, useState } from 'react';
 import { PageHeader } from '@/components/shared/PageHeader';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
 import { Table, TableBody, TableCell, TableHead, TableHeader, TableRow } from '@/components/ui/table';
-import { getMyCompanyWallet } from '@/services/walletService';
-import { Wallet } from '@/types';
+import { Button } from '@/components/ui/button';
+import { cursorFromLink, getMyCompanyTransactions, getMyCompanyWallet } from '@/services/walletService';
+import { Transaction, Wallet } from '@/types';
 import { Badge } from '@/components/ui/badge';
 
 const MyCompanyWalletPage = () => {
     const [wallet, setWallet] = useState<Wallet | null>(null);
+    const [transactions, setTransactions] = useState<Transaction[]>([]);
+    const [nextCursor, setNextCursor] = useState<string | undefined>(undefined);
     const [isLoading, setIsLoading] = useState(true);
+    const [isLoadingMore, setIsLoadingMore] = useState(false);
     const [error, setError] = useState<string | null>(null);
 
     useEffect(() => {
         setIsLoading(true);
-        getMyCompanyWallet()
-            .then(setWallet)
+        Promise.all([getMyCompanyWallet(), getMyCompanyTransactions()])
+            .then(([walletData, page]) => {
+                setWallet(walletData);
+                setTransactions(page.results);
+                setNextCursor(cursorFromLink(page.next));
+            })
             .catch(() => setError('خطا در دریافت اطلاعات کیف پول.'))
             .finally(() => setIsLoading(false));
     }, []);
 
+    const loadMore = () => {
+        if (!nextCursor) return;
+        setIsLoadingMore(true);
+        getMyCompanyTransactions({ cursor: nextCursor })
+            .then((page) => {
+                setTransactions((current) => [...current, ...page.results]);
+                setNextCursor(cursorFromLink(page.next));
+            })
+            .catch(() => setError('خطا در دریافت تراکنش‌ها.'))
+            .finally(() => setIsLoadingMore(false));
+    };
+
     const getTransactionTypeLabel = (type: string) => {
         switch (type) {
             case 'DEPOSIT': return 'واریز';
@@ -60,7 +80,7 @@ const MyCompanyWalletPage = () => {
                         </TableRow>
                     </TableHeader>
                     <TableBody>
-                        {wallet.transactions.map((tx) => (
+                        {transactions.map((tx) => (
                             <TableRow key={tx.id}>
                                 <TableCell>{new Date(tx.timestamp).toLocaleString('fa-IR')}</TableCell>
                                 <TableCell>
@@ -76,6 +96,13 @@ const MyCompanyWalletPage = () => {
                     </TableBody>
                 </Table>
             </div>
+            {nextCursor && (
+                <div className="mt-4 flex justify-center">
+                    <Button variant="outline" onClick={loadMore} disabled={isLoadingMore}>
+                        {isLoadingMore ? 'در حال بارگذاری...' : 'نمایش تراکنش‌های بیشتر'}
+                    </Button>
+                </div>
+            )}
         </div>
     );
 };
@@ -1,12 +1,13 @@
 // src/services/orderService.ts
 import api from '@/lib/api';
-import { Order, CreateOrderPayload } from '@/types';
+import { Order, CreateOrderPayload, CursorPage } from '@/types';
 
 /**
- * Fetches the order history for the currently authenticated user.
+ * Fetches one page of the order history for the currently authenticated user, newest first.
+ * Pass the `cursor` taken from the previous page's `next` link to load the following page.
  */
-export const getMyOrders = async (): Promise<Order[]> => {
-  const response = await api.get<Order[]>('/orders/');
+export const getMyOrders = async (cursor?: string): Promise<CursorPage<Order>> => {
+  const response = await api.get<CursorPage<Order>>('/orders/', { params: { cursor } });
   return response.data;
 };
 
@@ -23,4 +24,12 @@ export const createOrder = async (payload: CreateOrderPayload): Promise<Order> =
  */
 export const deleteOrder = async (orderId: number): Promise<void> => {
     await api.delete(`/orders/${orderId}/`);
-}
\ No newline at end of file
+}
+
+/**
+ * Creates orders for several daily menus in a single request.
+ */
+export const createBulkOrders = async (orders: CreateOrderPayload[]): Promise<Order[]> => {
+    const response = await api.post<Order[]>('/orders/bulk/', { orders });
+    return response.data;
+}
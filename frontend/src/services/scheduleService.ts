@@ -1,16 +1,23 @@
 // frontend/src/services/scheduleService.ts
 import api from '@/lib/api';
-import { Schedule } from '@/types';
+import { MenuCalendar, Schedule, ScheduleSummary } from '@/types';
 
 // Define the data structure for creating a schedule
 export type CreateSchedulePayload = Omit<Schedule, 'id' | 'company_name' | 'daily_menus' | 'created_at'>;
 export type UpdateSchedulePayload = Partial<CreateSchedulePayload>;
 
+export interface ScheduleFilters {
+  company?: number;
+  is_active?: boolean;
+  date?: string;
+}
+
 /**
- * Fetches all schedules from the backend (for Super Admins).
+ * Fetches the schedule list from the backend (for Super Admins), optionally
+ * filtered. Rows carry a menu count; use getScheduleById for the menus.
  */
-export const getSchedules = async (): Promise<Schedule[]> => {
-  const response = await api.get<Schedule[]>('/schedules/');
+export const getSchedules = async (filters: ScheduleFilters = {}): Promise<ScheduleSummary[]> => {
+  const response = await api.get<ScheduleSummary[]>('/schedules/', { params: filters });
   return response.data;
 };
 
@@ -43,4 +50,95 @@ export const updateSchedule = async (id: number, payload: UpdateSchedulePayload)
  */
 export const deleteSchedule = async (id: number): Promise<void> => {
   await api.delete(`/schedules/${id}/`);
-};
\ No newline at end of file
+};
+
+// One day's menu in a generation rule
+export interface MenuTemplate {
+  foods: number[];
+  sides?: number[];
+}
+
+// Either new schedules (company_ids + name) or an existing one (schedule_id),
+// filled by exactly one rule: weekly (keyed by weekday, 0 = Monday), rotation or copy_from.
+export interface GenerateSchedulesPayload {
+  company_ids?: number[];
+  name?: string;
+  schedule_id?: number;
+  start_date?: string;
+  end_date?: string;
+  skip_weekdays?: number[];
+  holidays?: string[];
+  weekly?: Record<number, MenuTemplate>;
+  rotation?: MenuTemplate[];
+  copy_from?: number;
+}
+
+export interface GeneratedSchedule {
+  id: number;
+  company: number;
+  created: number;
+  skipped: number;
+}
+
+/**
+ * Builds the daily menus of a whole period in one request (for Super Admins).
+ */
+export const generateSchedules = async (payload: GenerateSchedulesPayload): Promise<GeneratedSchedule[]> => {
+  const response = await api.post<{ schedules: GeneratedSchedule[] }>('/schedules/generate/', payload);
+  return response.data.schedules;
+};
+
+// --- Menu plans ---
+// A plan is defined once and published to many companies, which share its days.
+
+export interface MenuPlanDay {
+  id: number;
+  date: string;
+  available_foods: number[];
+  available_sides: number[];
+}
+
+export interface MenuPlan {
+  id: number;
+  name: string;
+  start_date: string;
+  end_date: string;
+  days: MenuPlanDay[];
+  company_ids: number[];
+  updated_at: string;
+}
+
+export const getMenuPlans = async (): Promise<MenuPlan[]> => {
+  const response = await api.get<MenuPlan[]>('/schedules/plans/');
+  return response.data;
+};
+
+/**
+ * Sets the foods and sides of the given plan days; with replace, the other days are removed.
+ */
+export const setMenuPlanDays = async (
+  planId: number,
+  days: (MenuTemplate & { date: string })[],
+  replace = false
+): Promise<MenuPlan> => {
+  const response = await api.post<MenuPlan>(`/schedules/plans/${planId}/days/`, { days, replace });
+  return response.data;
+};
+
+/**
+ * Subscribes companies to a plan. Returns the schedules created for them.
+ */
+export const publishMenuPlan = async (planId: number, companyIds: number[]): Promise<{ id: number; company: number }[]> => {
+  const response = await api.post<{ schedules: { id: number; company: number }[] }>(
+    `/schedules/plans/${planId}/publish/`, { company_ids: companyIds }
+  );
+  return response.data.schedules;
+};
+
+/**
+ * Fetches the compact menu calendar of the user's company (at most 42 days).
+ */
+export const getMenuCalendar = async (from: string, to: string): Promise<MenuCalendar> => {
+  const response = await api.get<MenuCalendar>('/schedules/calendar/', { params: { from, to } });
+  return response.data;
+};
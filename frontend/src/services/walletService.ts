@@ -1,6 +1,6 @@
 // frontend/src/services/walletService.ts
 import api from '@/lib/api';
-import { Wallet } from '@/types';
+import { CursorPage, Transaction, Wallet } from '@/types';
 
 /**
  * For Super Admins: Deposits funds into a company's wallet.
@@ -13,13 +13,37 @@ export const depositToWallet = async (companyId: number, amount: number | string
 };
 
 /**
- * For Company Admins: Fetches their own company's wallet details.
+ * For Company Admins: Fetches their own company's wallet summary.
  */
 export const getMyCompanyWallet = async (): Promise<Wallet> => {
     const response = await api.get('/admin/wallets/my-company/');
     return response.data;
 };
 
+export interface TransactionFilters {
+    transaction_type?: Transaction['transaction_type'];
+    user?: number;
+    start_date?: string;
+    end_date?: string;
+    page_size?: number;
+    cursor?: string;
+}
+
+/**
+ * For Company Admins: Fetches one page of their company's transaction history, newest first.
+ * Pass the `cursor` taken from the previous page's `next` link to load the following page.
+ */
+export const getMyCompanyTransactions = async (filters: TransactionFilters = {}): Promise<CursorPage<Transaction>> => {
+    const response = await api.get('/admin/wallets/my-company/transactions/', { params: filters });
+    return response.data;
+};
+
+/**
+ * Extracts the cursor parameter from a cursor-paginated `next`/`previous` link.
+ */
+export const cursorFromLink = (link: string | null): string | undefined =>
+    link ? new URL(link).searchParams.get('cursor') ?? undefined : undefined;
+
 /**
  * For Company Admins: Allocates budget from the company wallet to an employee.
  * @param userId The ID of the user to allocate budget to.
@@ -28,4 +52,17 @@ export const getMyCompanyWallet = async (): Promise<Wallet> => {
 export const allocateBudget = async (userId: number, amount: number | string): Promise<any> => {
     const response = await api.post(`/admin/employees/${userId}/allocate_budget/`, { amount });
     return response.data;
-};
\ No newline at end of file
+};
+
+/**
+ * For Company Admins: Allocates budget to many employees in one request.
+ * Pass either a list of { user_id, amount } items, or { all_active_employees: true, amount }.
+ */
+export const allocateBudgetBulk = async (
+    payload:
+        | { allocations: { user_id: number; amount: number | string }[] }
+        | { all_active_employees: true; amount: number | string }
+): Promise<{ allocated_count: number; total_amount: string; new_company_balance: string }> => {
+    const response = await api.post('/admin/employees/allocate_budget/bulk/', payload);
+    return response.data;
+};
@@ -66,7 +66,6 @@ export interface Wallet {
   company_name: string;
   balance: string;
   updated_at: string;
-  transactions: Transaction[];
 }
 
 // ================== MENU & SCHEDULE ==================
@@ -114,6 +113,29 @@ export interface Schedule {
   daily_menus: DailyMenu[];
 }
 
+// A row of the schedule list, which counts the daily menus instead of nesting them
+export interface ScheduleSummary extends Omit<Schedule, 'daily_menus'> {
+  plan: number | null;
+  menu_count: number;
+}
+
+// The compact menu calendar: days reference foods and sides by id
+export interface CalendarDay {
+  date: string;
+  menu: number;
+  schedule: number;
+  foods: number[];
+  sides: number[];
+  order: number | null;
+  order_status: 'PLACED' | 'CONFIRMED' | 'PREPARING' | 'DELIVERED' | 'CANCELED' | null;
+}
+
+export interface MenuCalendar {
+  days: CalendarDay[];
+  foods: Record<number, { id: number; name: string; price: string; image: string | null; is_available: boolean; category_name: string | null }>;
+  sides: Record<number, { id: number; name: string; price: string; is_available: boolean }>;
+}
+
 // ================== ORDERS ==================
 export interface Order {
   id: number;
@@ -131,6 +153,13 @@ export interface CreateOrderPayload {
   side_dishes: number[];
 }
 
+// Response shape of cursor-paginated list endpoints
+export interface CursorPage<T> {
+  next: string | null;
+  previous: string | null;
+  results: T[];
+}
+
 // ================== ADMIN & REPORTING ==================
 export interface DashboardStats {
   orders_today: number;